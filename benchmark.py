@@ -0,0 +1,264 @@
+"""PyInstaller 명령 생성기 자체의 주요 경로 성능 측정 (Tk 비의존)
+
+임시 폴더에 모듈 수와 임포트 팬아웃, 데이터 파일 수가 다른 가상 프로젝트를 만들고
+임포트 분석, 명령어 생성, 휠하우스 기반 환경 준비, 전체 빌드 시간을 측정한다.
+
+사용 예:
+    python benchmark.py --save-baseline bench_baseline.json
+    python benchmark.py --compare bench_baseline.json
+    python benchmark.py --sizes 1 10 --wheelhouse ./wheels --full-build
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import statistics
+import tempfile
+import multiprocessing
+
+import build_env
+import build_runner
+import import_analysis
+import project_model
+
+
+DEFAULT_SIZES = (1, 10, 100, 1000)
+DEFAULT_FANOUT = 5
+DEFAULT_DATA_FILES = 20
+DEFAULT_REPEAT = 3
+
+# 기준 대비 이 비율 이상 느려지면 회귀로 표시 (측정 잡음 수준의 차이는 무시)
+DEFAULT_TOLERANCE = 0.25
+MIN_REGRESSION_DELTA = 0.005
+
+# 가상 모듈이 함께 가져오는 표준 라이브러리 모듈
+_STDLIB_IMPORTS = ("os", "sys", "json", "re", "collections", "functools", "itertools", "pathlib")
+
+
+def make_project(root, module_count, fanout=DEFAULT_FANOUT, data_files=DEFAULT_DATA_FILES):
+    """module_count 개의 모듈이 서로 fanout 개씩 가져오는 가상 프로젝트 생성, 프로젝트 설정 반환"""
+    package_dir = os.path.join(root, "app")
+    data_dir = os.path.join(root, "data")
+    os.makedirs(package_dir, exist_ok=True)
+    os.makedirs(data_dir, exist_ok=True)
+
+    with open(os.path.join(package_dir, "__init__.py"), 'w', encoding='utf-8') as f:
+        f.write("")
+
+    for i in range(module_count):
+        targets = sorted({(i * 7 + k * 13 + 1) % module_count for k in range(fanout)} - {i})
+        lines = [f"import {_STDLIB_IMPORTS[(i + k) % len(_STDLIB_IMPORTS)]}" for k in range(2)]
+        lines += [f"from . import mod_{j}" for j in targets]
+        lines += ["", f"def func_{i}(value):", f"    return value + {i}", ""]
+        with open(os.path.join(package_dir, f"mod_{i}.py"), 'w', encoding='utf-8') as f:
+            f.write("\n".join(lines))
+
+    with open(os.path.join(root, "main.py"), 'w', encoding='utf-8') as f:
+        f.write("from app import mod_0\n\nprint(mod_0.func_0(1))\n")
+
+    entries = []
+    for i in range(data_files):
+        path = os.path.join(data_dir, f"data_{i}.txt")
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write("x" * 1024)
+        entries.append(f"{path}{os.pathsep}data")
+
+    return project_model.new_project(
+        script_path=os.path.join(root, "main.py"),
+        app_name=f"bench{module_count}",
+        output_dir=os.path.join(root, "dist"),
+        work_dir=os.path.join(root, "build"),
+        data_files=entries,
+        no_confirm=True,
+    )
+
+
+def measure(func, repeat):
+    """func 를 repeat 번 실행한 소요 시간 통계 (초)"""
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        samples.append(time.perf_counter() - started)
+    return {
+        "min": min(samples),
+        "median": statistics.median(samples),
+        "max": max(samples),
+        "runs": len(samples),
+    }
+
+
+def bench_analysis(project, repeat, tmp_dir):
+    """임포트 분석: 캐시 없이 / 디스크 캐시를 채운 뒤"""
+    results = {
+        "analysis_cold": measure(lambda: import_analysis.analyze_project(project["script_path"], cache=False),
+                                 repeat),
+    }
+    cache = import_analysis.AnalysisCache(os.path.join(tmp_dir, "analysis_cache.db"))
+    import_analysis.analyze_project(project["script_path"], cache=cache)
+    results["analysis_warm"] = measure(
+        lambda: import_analysis.analyze_project(project["script_path"], cache=cache), repeat)
+    return results
+
+
+def bench_command(project, repeat):
+    """분석 결과를 숨겨진 임포트로 넣은 뒤 명령어 생성 (1000번 반복을 1회로 측정)"""
+    graph = import_analysis.analyze_project(project["script_path"], cache=False)
+    project = dict(project, hidden_imports=graph.hidden_imports())
+
+    def generate():
+        for _ in range(1000):
+            project_model.build_command(project)
+
+    return {"command_x1000": measure(generate, repeat)}
+
+
+def bench_environment(project, wheelhouse, tmp_dir):
+    """휠하우스에서 가상환경 준비: 새로 생성 / 캐시 적중"""
+    graph = import_analysis.analyze_project(project["script_path"], cache=False)
+    cache = build_env.VenvCache(os.path.join(tmp_dir, "venv_cache"))
+    packages = graph.top_level_imports()
+    results = {
+        "environment_cold": measure(
+            lambda: build_env.prepare_environment(packages, cache=cache, wheelhouse=wheelhouse), 1),
+        "environment_cached": measure(
+            lambda: build_env.prepare_environment(packages, cache=cache, wheelhouse=wheelhouse), 1),
+    }
+    return results, cache
+
+
+def bench_build(project, cache, wheelhouse, tmp_dir):
+    """전체 빌드 (휠하우스가 있으면 안전 모드로 캐시된 가상환경 사용)"""
+    venv_dir = None
+    if wheelhouse and cache is not None:
+        graph = import_analysis.analyze_project(project["script_path"], cache=False)
+        venv_dir, _ = build_env.prepare_environment(graph.top_level_imports(), cache=cache, wheelhouse=wheelhouse)
+
+    def build():
+        shutil.rmtree(project["work_dir"], ignore_errors=True)
+        shutil.rmtree(project["output_dir"], ignore_errors=True)
+        command = project_model.build_command(project)
+        command[0:1] = build_runner.pyinstaller_argv(venv_dir)
+        if build_runner.run_pyinstaller(command, cwd=tmp_dir) != 0:
+            raise RuntimeError("벤치마크 빌드 실패")
+
+    return {"build_full": measure(build, 1)}
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, fanout=DEFAULT_FANOUT, data_files=DEFAULT_DATA_FILES,
+                   repeat=DEFAULT_REPEAT, wheelhouse=None, full_build=False, log=None):
+    """모든 크기에 대해 측정하고 {"meta": ..., "results": {"항목/모듈수": 통계}} 반환"""
+    log = log or (lambda message: None)
+    results = {}
+    for size in sizes:
+        tmp_dir = tempfile.mkdtemp(prefix=f"pyigen_bench_{size}_")
+        try:
+            project = make_project(os.path.join(tmp_dir, "project"), size, fanout, data_files)
+            measured = {}
+            log(f"[{size} 모듈] 임포트 분석...\n")
+            measured.update(bench_analysis(project, repeat, tmp_dir))
+            log(f"[{size} 모듈] 명령어 생성...\n")
+            measured.update(bench_command(project, repeat))
+
+            cache = None
+            if wheelhouse:
+                log(f"[{size} 모듈] 휠하우스 환경 준비...\n")
+                env_results, cache = bench_environment(project, wheelhouse, tmp_dir)
+                measured.update(env_results)
+            if full_build:
+                log(f"[{size} 모듈] 전체 빌드...\n")
+                measured.update(bench_build(project, cache, wheelhouse, tmp_dir))
+
+            for name, stats in measured.items():
+                results[f"{name}/{size}"] = stats
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "fanout": fanout,
+            "data_files": data_files,
+            "repeat": repeat,
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+
+
+def compare(current, baseline, tolerance=DEFAULT_TOLERANCE):
+    """기준 결과와 비교해 [(항목, 기준 중앙값, 현재 중앙값, 비율, 회귀 여부)] 반환"""
+    rows = []
+    for name, stats in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base or not base.get("median"):
+            continue
+        ratio = stats["median"] / base["median"]
+        regressed = ratio > 1 + tolerance and stats["median"] - base["median"] > MIN_REGRESSION_DELTA
+        rows.append((name, base["median"], stats["median"], ratio, regressed))
+    return rows
+
+
+def parse_args(argv=None):
+    """명령행 인자 해석"""
+    parser = argparse.ArgumentParser(description="PyInstaller 명령 생성기의 주요 경로 성능을 측정합니다.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="가상 프로젝트 모듈 수")
+    parser.add_argument("--fanout", type=int, default=DEFAULT_FANOUT, help="모듈마다 가져오는 로컬 모듈 수")
+    parser.add_argument("--data-files", type=int, default=DEFAULT_DATA_FILES, help="프로젝트 데이터 파일 수")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="항목별 반복 횟수")
+    parser.add_argument("--wheelhouse", help="환경 준비를 측정할 휠하우스 폴더 (pyinstaller 휠 포함)")
+    parser.add_argument("--full-build", action="store_true", help="전체 PyInstaller 빌드도 측정")
+    parser.add_argument("--output", help="측정 결과를 저장할 JSON 파일")
+    parser.add_argument("--save-baseline", metavar="PATH", help="측정 결과를 기준 파일로 저장")
+    parser.add_argument("--compare", metavar="PATH", help="기준 파일과 비교")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="기준 대비 이 비율 이상 느려지면 회귀로 표시 (기본 0.25)")
+    return parser.parse_args(argv)
+
+
+def _write_json(path, data):
+    """JSON 파일 저장"""
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, ensure_ascii=False)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    def log(message):
+        sys.stderr.write(message)
+        sys.stderr.flush()
+
+    current = run_benchmarks(args.sizes, args.fanout, args.data_files, args.repeat,
+                             args.wheelhouse, args.full_build, log)
+
+    for name, stats in current["results"].items():
+        print(f"{name:<28} 중앙값 {stats['median'] * 1000:10.2f} ms  (최소 {stats['min'] * 1000:.2f} ms)")
+
+    if args.output:
+        _write_json(args.output, current)
+    if args.save_baseline:
+        _write_json(args.save_baseline, current)
+        print(f"기준 저장: {args.save_baseline}")
+
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        rows = compare(current, baseline, args.tolerance)
+        print(f"\n기준 비교: {args.compare}")
+        for name, base, now, ratio, regressed in rows:
+            mark = "  << 회귀" if regressed else ""
+            print(f"{name:<28} {base * 1000:10.2f} ms -> {now * 1000:10.2f} ms  x{ratio:.2f}{mark}")
+        if any(row[4] for row in rows):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,568 @@
+"""PyInstaller GUI 빌드용 가상환경 준비 및 캐시 관리 (Tk 비의존)"""
+import os
+import sys
+import contextlib
+import json
+import hashlib
+import platform
+import re
+import shutil
+import socket
+import subprocess
+import threading
+import time
+
+import module_index
+import user_dirs
+
+
+# 가상환경 캐시 기본 위치 (사용자별 캐시 폴더)
+DEFAULT_CACHE_DIR = user_dirs.cache_path("venv_cache")
+
+# 캐시 제거 정책 기본값 (LRU + 디스크 용량 제한)
+DEFAULT_MAX_ENTRIES = 5
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024 * 1024
+
+# 빌드 도구 자체의 배포판 (숨겨진 임포트에서 제외)
+BUILD_TOOL_DISTRIBUTIONS = {
+    "pip", "setuptools", "wheel", "pyinstaller", "pyinstaller-hooks-contrib",
+    "altgraph", "macholib", "pefile", "pywin32-ctypes",
+}
+
+
+def _null_log(message, tag=None):
+    """로그 콜백이 없을 때 사용하는 기본 콜백"""
+
+
+def venv_executable(venv_dir, name):
+    """가상환경 안의 실행 파일 경로 반환 (python, pip, pyinstaller 등)"""
+    if os.name == "nt":
+        return os.path.join(venv_dir, "Scripts", f"{name}.exe")
+    return os.path.join(venv_dir, "bin", name)
+
+
+def resolve_requirements(packages, index=None):
+    """임포트 모듈 목록을 설치할 pip 패키지 목록으로 변환 (표준 라이브러리 제외)"""
+    index = index or module_index.host_index()
+    requirements = {"pyinstaller"}
+
+    for package in packages:
+        install_name = index.install_name(package)
+        if install_name and module_index.canonical_name(install_name) != "pyinstaller":
+            requirements.add(install_name)
+
+    return sorted(requirements, key=str.lower)
+
+
+# 요구 패키지 문자열을 이름과 버전 지정자로 나누는 패턴 (예: "Foo_Bar >= 1.2")
+_REQUIREMENT_PATTERN = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)(.*)$")
+
+
+def _normalize_requirement(requirement):
+    """요구 패키지를 정규화한 이름과 공백을 뺀 버전 지정자로 (지정자가 바뀌면 다른 값)"""
+    match = _REQUIREMENT_PATTERN.match(requirement)
+    if not match:
+        return requirement.strip()
+    return module_index.canonical_name(match.group(1)) + "".join(match.group(2).split())
+
+
+def wheelhouse_digest(wheelhouse):
+    """휠하우스 폴더의 파일 이름과 크기 목록 지문 (휠을 추가/교체하면 바뀜, 폴더가 없으면 None)"""
+    try:
+        with os.scandir(wheelhouse) as it:
+            listing = sorted((entry.name, entry.stat().st_size) for entry in it if entry.is_file())
+    except OSError:
+        return None
+    return hashlib.sha256(json.dumps(listing).encode("utf-8")).hexdigest()[:16]
+
+
+def compute_fingerprint(requirements, python_executable=None, source="index", wheelhouse=None):
+    """인터프리터 버전, 요구 패키지(버전 지정자 포함), 설치 출처로 캐시 키 계산
+
+    wheelhouse 가 지정되면 휠하우스의 파일 목록도 키에 넣어 휠이 바뀌면 새 가상환경을 만든다.
+    """
+    python_executable = python_executable or sys.executable
+    payload = {
+        "python": sys.version,
+        "executable": os.path.normcase(os.path.abspath(python_executable)),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "requirements": sorted({_normalize_requirement(r) for r in requirements if r.strip()}),
+        "source": source,
+        "wheelhouse": wheelhouse_digest(wheelhouse) if wheelhouse else None,
+    }
+    data = json.dumps(payload, sort_keys=True).encode("utf-8")
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def _dir_size(path):
+    """디렉토리 전체 크기 계산"""
+    total = 0
+    stack = [path]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        total += entry.stat(follow_symlinks=False).st_size
+        except OSError:
+            continue
+    return total
+
+
+# 동시 빌드 시 인덱스 갱신과 같은 지문의 가상환경 생성을 직렬화하기 위한 잠금
+_index_lock = threading.RLock()
+_fingerprint_locks = {}
+# 빌드에 쓰이는 동안 제거하지 않을 가상환경 {경로: 고정 횟수}
+_pins = {}
+
+
+def _fingerprint_lock(fingerprint):
+    """지문별 잠금 (같은 가상환경을 두 작업이 동시에 만들지 않도록)"""
+    with _index_lock:
+        return _fingerprint_locks.setdefault(fingerprint, threading.Lock())
+
+
+def _pin_key(venv_dir):
+    """고정 횟수를 세는 가상환경 경로 키"""
+    return os.path.normcase(os.path.abspath(venv_dir))
+
+
+def pin(venv_dir):
+    """가상환경을 캐시 제거 대상에서 빼기 (unpin 과 짝을 맞춰 호출)"""
+    with _index_lock:
+        key = _pin_key(venv_dir)
+        _pins[key] = _pins.get(key, 0) + 1
+
+
+def unpin(venv_dir):
+    """pin 한 번을 해제 (모두 해제되면 다시 제거 대상)"""
+    with _index_lock:
+        key = _pin_key(venv_dir)
+        count = _pins.get(key, 0) - 1
+        if count > 0:
+            _pins[key] = count
+        else:
+            _pins.pop(key, None)
+
+
+def is_pinned(venv_dir):
+    """가상환경이 빌드에 쓰이는 중인지 확인"""
+    with _index_lock:
+        return _pin_key(venv_dir) in _pins
+
+
+@contextlib.contextmanager
+def pinned(venv_dir):
+    """with 블록 동안 가상환경을 캐시 제거 대상에서 빼기 (venv_dir 가 없으면 아무것도 하지 않음)"""
+    if not venv_dir:
+        yield venv_dir
+        return
+    pin(venv_dir)
+    try:
+        yield venv_dir
+    finally:
+        unpin(venv_dir)
+
+
+class VenvCache:
+    """요구 패키지 지문으로 주소화되는 가상환경 캐시"""
+
+    INDEX_NAME = "index.json"
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR, max_entries=DEFAULT_MAX_ENTRIES, max_bytes=DEFAULT_MAX_BYTES):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(cache_dir, self.INDEX_NAME)
+
+    def entry_dir(self, fingerprint):
+        """지문에 해당하는 가상환경 경로"""
+        return os.path.join(self.cache_dir, fingerprint)
+
+    def _load_index(self):
+        """캐시 인덱스 불러오기"""
+        if not os.path.exists(self.index_path):
+            return {}
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def _save_index(self, index):
+        """캐시 인덱스 저장 (원자적 교체)"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.index_path)
+
+    def lookup(self, fingerprint):
+        """캐시 적중 시 항목 반환 및 사용 시간 갱신, 없으면 None"""
+        with _index_lock:
+            index = self._load_index()
+            entry = index.get(fingerprint)
+            if not entry:
+                return None
+
+            venv_dir = self.entry_dir(fingerprint)
+            if not os.path.exists(venv_executable(venv_dir, "python")):
+                # 디렉토리가 손상된 경우 인덱스에서 제거
+                index.pop(fingerprint, None)
+                self._save_index(index)
+                shutil.rmtree(venv_dir, ignore_errors=True)
+                return None
+
+            entry["last_used"] = time.time()
+            self._save_index(index)
+            return dict(entry, path=venv_dir)
+
+    def store(self, fingerprint, requirements, installed_modules):
+        """완성된 가상환경을 캐시에 등록 (인덱스에 등록되기 전에는 캐시로 인정하지 않음)"""
+        with _index_lock:
+            final_dir = self.entry_dir(fingerprint)
+            index = self._load_index()
+            now = time.time()
+            index[fingerprint] = {
+                "requirements": list(requirements),
+                "installed_modules": list(installed_modules),
+                "created": now,
+                "last_used": now,
+                "size": _dir_size(final_dir),
+            }
+            self._save_index(index)
+            self.evict(keep=fingerprint)
+            return final_dir
+
+    def evict(self, keep=None):
+        """LRU 순서로 개수/용량 제한을 넘는 항목 제거
+
+        다른 작업이 지문 잠금을 잡고 있는(만들거나 재사용 중인) 항목과 빌드에 쓰이는 중인(pin)
+        항목은 지우지 않고 건너뛴다.
+        잠금을 기다리지 않으므로 잠금을 잡은 채 인덱스 잠금을 기다리는 작업과 교착되지 않는다.
+        """
+        with _index_lock:
+            index = self._load_index()
+            entries = sorted(index.items(), key=lambda item: item[1].get("last_used", 0))
+            total_size = sum(entry.get("size", 0) for _, entry in entries)
+            removed = []
+
+            for fingerprint, entry in entries:
+                if len(index) <= self.max_entries and total_size <= self.max_bytes:
+                    break
+                if fingerprint == keep or is_pinned(self.entry_dir(fingerprint)):
+                    continue
+                lock = _fingerprint_lock(fingerprint)
+                if not lock.acquire(blocking=False):
+                    continue
+                try:
+                    shutil.rmtree(self.entry_dir(fingerprint), ignore_errors=True)
+                finally:
+                    lock.release()
+                total_size -= entry.get("size", 0)
+                index.pop(fingerprint, None)
+                removed.append(fingerprint)
+
+            if removed:
+                self._save_index(index)
+            return removed
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+
+
+class BuildCancelled(Exception):
+    """사용자가 환경 준비 작업을 취소했을 때 발생"""
+
+
+def _null_progress(percent, message):
+    """진행률 콜백이 없을 때 사용하는 기본 콜백"""
+
+
+def _check_cancel(cancel_event):
+    """취소 요청이 있으면 BuildCancelled 발생"""
+    if cancel_event is not None and cancel_event.is_set():
+        raise BuildCancelled()
+
+
+def _run(args, on_line=None, cancel_event=None):
+    """하위 프로세스 실행 후 결과 반환
+
+    on_line 이 있으면 표준 출력과 오류를 합쳐 한 줄씩 전달하고,
+    cancel_event 가 설정되면 프로세스를 종료한 뒤 BuildCancelled 를 발생시킨다.
+    """
+    _check_cancel(cancel_event)
+    process = subprocess.Popen(
+        args,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT if on_line else subprocess.PIPE,
+        text=True,
+        errors='replace',
+        bufsize=1
+    )
+
+    # 취소 감시 스레드 (프로세스가 끝나면 함께 종료)
+    def watch_cancel():
+        while process.poll() is None:
+            if cancel_event.wait(0.2):
+                process.terminate()
+                return
+
+    if cancel_event is not None:
+        threading.Thread(target=watch_cancel, daemon=True).start()
+
+    if on_line:
+        lines = []
+        for line in iter(process.stdout.readline, ''):
+            lines.append(line)
+            on_line(line)
+        process.wait()
+        stdout = stderr = "".join(lines)
+    else:
+        stdout, stderr = process.communicate()
+
+    _check_cancel(cancel_event)
+    return subprocess.CompletedProcess(args, process.returncode, stdout, stderr)
+
+
+# pip 오류 출력에서 설치할 수 없는 요구 패키지 이름을 찾는 패턴
+_FAILED_REQUIREMENT_PATTERNS = [
+    re.compile(r"No matching distribution found for ([A-Za-z0-9_.\-]+)"),
+    re.compile(r"Could not find a version that satisfies the requirement ([A-Za-z0-9_.\-]+)"),
+    re.compile(r"Failed to build ([A-Za-z0-9_.\-]+)"),
+]
+
+
+def _failed_requirements(stderr, batch):
+    """pip 오류 출력에서 실패 원인이 된 요구 패키지 추출"""
+    names = set()
+    for pattern in _FAILED_REQUIREMENT_PATTERNS:
+        names.update(module_index.canonical_name(match.group(1)) for match in pattern.finditer(stderr))
+    return [pkg for pkg in batch if module_index.canonical_name(pkg) in names]
+
+
+def _last_error_line(stderr):
+    """pip 오류 출력의 마지막 오류 줄"""
+    lines = [line.strip() for line in stderr.splitlines() if line.strip()]
+    for line in reversed(lines):
+        if line.startswith("ERROR"):
+            return line
+    return lines[-1] if lines else ""
+
+
+def _pip_in_batches(python_path, pip_args, requirements, action, log=_null_log,
+                    progress=_null_progress, progress_range=(0, 100), cancel_event=None):
+    """요구 패키지를 한 번의 pip 실행으로 처리하고 실패 시 묶음을 줄여 재시도
+
+    실패하면 원인이 된 패키지를 빼고 다시 시도하며, 원인을 알 수 없으면
+    묶음을 반으로 나눠 재시도한다. pip 출력은 한 줄씩 log 로 전달되고
+    "Collecting" 줄 수로 진행률을 추정한다. {패키지: 실패 사유} 를 반환한다.
+    """
+    failed = {}
+    pending = [list(requirements)]
+    start, end = progress_range
+    # 의존성까지 포함한 예상 수집 개수 (실제 수가 넘으면 늘려감)
+    state = {"collected": 0, "expected": max(len(requirements) * 3, 1), "ratio": 0.0}
+
+    def on_line(line):
+        log(line)
+        if line.startswith("Collecting"):
+            state["collected"] += 1
+            state["expected"] = max(state["expected"], state["collected"] + 1)
+            ratio = 0.8 * state["collected"] / state["expected"]
+        elif line.startswith("Installing collected packages") or line.startswith("Saved "):
+            ratio = 0.9
+        else:
+            return
+        # 재시도 중에도 진행률이 뒤로 가지 않도록 유지
+        state["ratio"] = max(state["ratio"], ratio)
+        progress(start + (end - start) * state["ratio"], line.strip())
+
+    while pending:
+        batch = pending.pop(0)
+        log(f"패키지 일괄 {action} 중 ({len(batch)}개): {', '.join(batch)}\n", "info")
+        process = _run([python_path, "-m", "pip", *pip_args, "--disable-pip-version-check", *batch],
+                       on_line=on_line, cancel_event=cancel_event)
+
+        if process.returncode == 0:
+            log(f"패키지 {action} 완료: {', '.join(batch)}\n", "success")
+            continue
+
+        bad = _failed_requirements(process.stderr, batch)
+        if bad:
+            for pkg in bad:
+                failed[pkg] = _last_error_line(process.stderr)
+            rest = [pkg for pkg in batch if pkg not in bad]
+            if rest:
+                pending.insert(0, rest)
+        elif len(batch) == 1:
+            failed[batch[0]] = _last_error_line(process.stderr)
+        else:
+            # 원인을 특정할 수 없으면 묶음을 나눠서 재시도
+            mid = len(batch) // 2
+            pending[0:0] = [batch[:mid], batch[mid:]]
+
+    for pkg, reason in failed.items():
+        tag = "error" if pkg == "pyinstaller" else "warning"
+        log(f"패키지 {action} 실패: {pkg} - {reason}\n", tag)
+
+    return failed
+
+
+def install_packages(venv_dir, packages, wheelhouse=None, log=_null_log,
+                     progress=None, progress_range=(0, 100), cancel_event=None):
+    """필요한 패키지를 한 번의 pip 실행으로 일괄 설치
+
+    휠하우스가 지정되면 인덱스에 접근하지 않고 휠하우스에서만 설치한다.
+    progress 가 None 이면 진행률을 보고하지 않는다.
+    """
+    progress = progress or _null_progress
+    pip_args = ["install"]
+    if wheelhouse:
+        pip_args += ["--no-index", "--find-links", wheelhouse]
+    return _pip_in_batches(venv_executable(venv_dir, "python"), pip_args,
+                           resolve_requirements(packages), "설치", log,
+                           progress, progress_range, cancel_event)
+
+
+def populate_wheelhouse(wheelhouse, packages, log=_null_log, progress=None, cancel_event=None):
+    """인터넷 연결 시 프로젝트 의존성 휠을 휠하우스 폴더에 미리 내려받기 (progress 가 None 이면 보고하지 않음)"""
+    progress = progress or _null_progress
+    os.makedirs(wheelhouse, exist_ok=True)
+    failed = _pip_in_batches(sys.executable, ["wheel", "--wheel-dir", wheelhouse],
+                             resolve_requirements(packages), "휠 내려받기", log,
+                             progress, (0, 100), cancel_event)
+    progress(100, "휠하우스 준비 완료")
+    return failed
+
+
+def has_wheels(wheelhouse):
+    """휠하우스 폴더에 휠 파일이 있는지 확인"""
+    if not wheelhouse or not os.path.isdir(wheelhouse):
+        return False
+    with os.scandir(wheelhouse) as it:
+        return any(entry.name.endswith(".whl") for entry in it)
+
+
+def check_internet_connection(host="pypi.org", port=443, timeout=3):
+    """패키지 인덱스에 연결할 수 있는지 확인 (운영체제와 무관한 TCP 연결 시도)"""
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def list_installed_modules(venv_dir, packages, log=_null_log, cancel_event=None):
+    """가상환경에 설치된 배포판이 제공하는 임포트 모듈 이름 목록 반환
+
+    배포판 메타데이터(top_level.txt, RECORD)로 실제 임포트명을 찾으며,
+    요청한 모듈 중 표준 라이브러리 모듈도 함께 포함한다.
+    """
+    _check_cancel(cancel_event)
+
+    try:
+        index = module_index.build_index(venv_executable(venv_dir, "python"), use_cache=False)
+    except Exception as e:
+        log(f"패키지 목록 가져오기 실패: {str(e)}\n", "error")
+        return None
+
+    installed_modules = []
+    for distribution in index.distributions():
+        if module_index.canonical_name(distribution) in BUILD_TOOL_DISTRIBUTIONS:
+            continue
+        for module in index.modules_for(distribution):
+            if module not in installed_modules:
+                installed_modules.append(module)
+
+    # 기본 모듈 추가
+    for pkg in packages:
+        if index.is_stdlib(pkg) and pkg not in installed_modules:
+            installed_modules.append(pkg)
+
+    return installed_modules
+
+
+def prepare_environment(packages, cache=None, wheelhouse=None, log=_null_log,
+                        progress=None, cancel_event=None, pin_result=False):
+    """요구 패키지에 맞는 가상환경을 캐시에서 찾거나 새로 생성
+
+    휠하우스가 지정되면 네트워크 없이 휠하우스에서만 설치한다.
+    진행 상황은 progress(퍼센트, 메시지) 로 보고하고(None 이면 보고하지 않음), cancel_event 가 설정되면
+    만들던 가상환경을 지우고 BuildCancelled 를 발생시킨다.
+    (venv_dir, installed_modules) 를 반환하며 실패 시 (None, []) 를 반환한다.
+    pin_result 가 참이면 반환하는 가상환경을 지문 잠금을 놓기 전에 pin 하므로, 호출한 쪽이
+    빌드를 마친 뒤 unpin 해야 한다.
+    """
+    cache = cache or VenvCache()
+    progress = progress or _null_progress
+    requirements = resolve_requirements(packages)
+    source = f"wheelhouse:{os.path.abspath(wheelhouse)}" if wheelhouse else "index"
+    fingerprint = compute_fingerprint(requirements, source=source, wheelhouse=wheelhouse)
+    build_dir = None
+
+    # 같은 지문을 다른 작업이 만들고 있으면 끝날 때까지 기다렸다가 캐시를 재사용
+    with _fingerprint_lock(fingerprint):
+        try:
+            entry = cache.lookup(fingerprint)
+            if entry:
+                log(f"캐시된 가상환경 재사용: {entry['path']} ({fingerprint})\n", "success")
+                progress(100, "캐시된 가상환경 재사용")
+                if pin_result:
+                    pin(entry["path"])
+                return entry["path"], entry.get("installed_modules", [])
+
+            # 가상환경 스크립트에 절대 경로가 기록되므로 최종 위치에서 바로 생성
+            build_dir = cache.entry_dir(fingerprint)
+            if os.path.exists(build_dir):
+                shutil.rmtree(build_dir)
+
+            # 가상환경 생성
+            log(f"가상환경 생성 중: {build_dir}\n", "info")
+            progress(2, "가상환경 생성 중...")
+            # pip 업그레이드는 가상환경 생성 단계에서 함께 처리 (오프라인 모드에서는 생략)
+            venv_args = [sys.executable, "-m", "venv", build_dir]
+            if sys.version_info >= (3, 9) and not wheelhouse:
+                venv_args.insert(3, "--upgrade-deps")
+            process = _run(venv_args, cancel_event=cancel_event)
+            if process.returncode != 0:
+                log(f"가상환경 생성 실패: {process.stderr}\n", "error")
+                shutil.rmtree(build_dir, ignore_errors=True)
+                return None, []
+
+            progress(15, "패키지 설치 중...")
+            install_packages(build_dir, packages, wheelhouse=wheelhouse, log=log,
+                             progress=progress, progress_range=(15, 90), cancel_event=cancel_event)
+
+            if not os.path.exists(venv_executable(build_dir, "pyinstaller")):
+                log("PyInstaller가 설치되지 않아 가상환경을 캐시에 저장하지 않습니다.\n", "error")
+                shutil.rmtree(build_dir, ignore_errors=True)
+                return None, []
+
+            progress(92, "설치된 패키지 확인 중...")
+            installed_modules = list_installed_modules(build_dir, packages, log, cancel_event)
+            if installed_modules is None:
+                shutil.rmtree(build_dir, ignore_errors=True)
+                return None, []
+
+            venv_dir = cache.store(fingerprint, requirements, installed_modules)
+            if pin_result:
+                pin(venv_dir)
+            log(f"설치된 패키지: {', '.join(installed_modules)}\n", "info")
+            progress(100, "가상환경 준비 완료")
+            return venv_dir, installed_modules
+
+        except BuildCancelled:
+            log("가상환경 준비가 취소되었습니다.\n", "warning")
+            if build_dir:
+                shutil.rmtree(build_dir, ignore_errors=True)
+            raise
+
+        except Exception as e:
+            log(f"가상환경 생성 중 오류 발생: {str(e)}\n", "error")
+            return None, []
@@ -0,0 +1,341 @@
+"""프로젝트별 빌드 기록 데이터베이스와 추세/회귀 보고 (Tk 비의존)"""
+import os
+import json
+import hashlib
+import sqlite3
+import statistics
+from datetime import datetime
+
+import project_model
+import spec_builder
+import user_dirs
+import variant_matrix
+
+
+# 빌드 기록 기본 위치 (GUI와 헤드리스 실행이 함께 쓰는 사용자별 캐시 폴더)
+DEFAULT_HISTORY_PATH = user_dirs.cache_path("build_history.db")
+
+# 회귀 판정 기본값: 최근 성공 빌드 몇 개의 중앙값보다 몇 % 이상 늘면 회귀로 표시
+DEFAULT_WINDOW = 5
+DEFAULT_THRESHOLD = 0.2
+
+# 결과물에 영향을 주지 않아 옵션 지문에서 빼는 옵션 (작업 폴더 관리가 빌드마다 바꿀 수 있음)
+NEUTRAL_OPTIONS = ("--clean",)
+
+_COLUMNS = ("id", "project_key", "script_path", "app_name", "created", "options_fingerprint",
+            "hidden_import_count", "status", "returncode", "duration", "phases",
+            "file_count", "total_size", "exe_size")
+
+# 시작 시간 측정값 (빌드 한 건에 콜드/웜 한 행씩)
+_STARTUP_COLUMNS = ("build_id", "kind", "created", "runs", "first_output", "exit_time", "peak_rss",
+                    "timeouts", "failures", "cache_evicted")
+
+
+def project_key(project):
+    """프로젝트 구분 키 (스크립트 절대 경로 + 앱 이름)"""
+    script_path = os.path.normcase(os.path.abspath(project["script_path"])) if project["script_path"] else ""
+    return f"{script_path}|{project_model.app_name_of(project)}"
+
+
+def significant_options(command):
+    """결과물에 영향을 주는 인자만 남긴 명령 (빌드 기록과 증분 빌드 검사의 옵션 지문에 공통 사용)"""
+    return [arg for arg in command if arg not in NEUTRAL_OPTIONS]
+
+
+def options_fingerprint(project):
+    """PyInstaller 옵션 목록의 지문 (spec 빌드면 spec 내용 포함, --clean 처럼 결과와 무관한 옵션 제외)"""
+    command = significant_options(project_model.build_command(project)[1:])
+    if project_model.uses_spec(project):
+        command.append(spec_builder.spec_fingerprint(project))
+    return hashlib.sha256(json.dumps(command).encode("utf-8")).hexdigest()[:16]
+
+
+def _tree_stats(path):
+    """폴더 아래 파일 수와 전체 크기"""
+    file_count = 0
+    total_size = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    else:
+                        try:
+                            total_size += entry.stat(follow_symlinks=False).st_size
+                            file_count += 1
+                        except OSError:
+                            pass
+        except OSError:
+            pass
+    return file_count, total_size
+
+
+def output_stats(project, base_dir=None):
+    """빌드 결과물의 (파일 수, 전체 크기, 실행 파일 크기), 결과물이 없으면 (0, 0, 0)"""
+    path = project_model.output_path(project, base_dir)
+    if project.get("variants"):
+        # 변형 매트릭스: 변형별 결과물을 합산 (하나라도 없으면 결과물 없음)
+        stats = [output_stats(variant_matrix.variant_project(project, name), base_dir)
+                 for name in project["variants"]]
+        if any(files == 0 for files, _, _ in stats):
+            return 0, 0, 0
+        return sum(s[0] for s in stats), sum(s[1] for s in stats), sum(s[2] for s in stats)
+
+    if project["build_type"] == "--onefile":
+        if not os.path.isfile(path):
+            return 0, 0, 0
+        size = os.path.getsize(path)
+        return 1, size, size
+
+    if not os.path.isdir(path):
+        return 0, 0, 0
+    file_count, total_size = _tree_stats(path)
+    exe_path = os.path.join(path, project_model.app_name_of(project) + (".exe" if os.name == "nt" else ""))
+    exe_size = os.path.getsize(exe_path) if os.path.isfile(exe_path) else 0
+    return file_count, total_size, exe_size
+
+
+def variant_results(project, base_dir=None):
+    """변형 매트릭스 빌드의 변형별 결과 [{"variant", "output", "files", "size", "seconds"}]"""
+    report = variant_matrix.read_report(project, base_dir) or {}
+    seconds = report.get("variants", {})
+    results = []
+    for name in project["variants"]:
+        variant = variant_matrix.variant_project(project, name)
+        files, size, _ = output_stats(variant, base_dir)
+        results.append({
+            "variant": name,
+            "output": project_model.output_path(variant, base_dir),
+            "files": files,
+            "size": size,
+            "seconds": seconds.get(name),
+        })
+    return results
+
+
+class BuildHistory:
+    """빌드 결과를 SQLite 에 쌓아 두고 최근 빌드와 비교"""
+
+    def __init__(self, path=DEFAULT_HISTORY_PATH):
+        self.path = path
+
+    def _connect(self):
+        """기록 데이터베이스 연결 (호출한 스레드 전용)"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS builds ("
+            "id INTEGER PRIMARY KEY AUTOINCREMENT, project_key TEXT, script_path TEXT, app_name TEXT, "
+            "created TEXT, options_fingerprint TEXT, hidden_import_count INTEGER, status TEXT, "
+            "returncode INTEGER, duration REAL, phases TEXT, file_count INTEGER, total_size INTEGER, "
+            "exe_size INTEGER)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS builds_project ON builds (project_key, id)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS startup_profiles ("
+            "build_id INTEGER, kind TEXT, created TEXT, runs INTEGER, first_output REAL, exit_time REAL, "
+            "peak_rss INTEGER, timeouts INTEGER, failures INTEGER, cache_evicted INTEGER, "
+            "PRIMARY KEY (build_id, kind))"
+        )
+        return conn
+
+    def record(self, project, status, returncode=None, duration=None, phases=None, base_dir=None):
+        """빌드 한 건 기록 후 저장된 항목 반환 (결과물 크기는 디스크에서 직접 측정)
+
+        duration 은 PyInstaller 실행에 걸린 초이다 (GUI 와 헤드리스 빌드가 같은 구간을 재야 비교할 수 있음).
+        """
+        project = project_model.new_project(**project)
+        if status == "success":
+            file_count, total_size, exe_size = output_stats(project, base_dir)
+        else:
+            file_count, total_size, exe_size = 0, 0, 0
+        row = {
+            "project_key": project_key(project),
+            "script_path": project["script_path"],
+            "app_name": project_model.app_name_of(project),
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "options_fingerprint": options_fingerprint(project),
+            "hidden_import_count": len(project["hidden_imports"]),
+            "status": status,
+            "returncode": returncode,
+            "duration": duration,
+            "phases": json.dumps(phases or {}),
+            "file_count": file_count,
+            "total_size": total_size,
+            "exe_size": exe_size,
+        }
+        conn = self._connect()
+        try:
+            cursor = conn.execute(
+                f"INSERT INTO builds ({', '.join(_COLUMNS[1:])}) VALUES ({', '.join('?' * (len(_COLUMNS) - 1))})",
+                tuple(row[column] for column in _COLUMNS[1:]))
+            conn.commit()
+            row["id"] = cursor.lastrowid
+        finally:
+            conn.close()
+        row["phases"] = phases or {}
+        return row
+
+    def builds(self, project, limit=20):
+        """프로젝트의 최근 빌드 기록 (오래된 것부터)"""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                f"SELECT {', '.join(_COLUMNS)} FROM builds WHERE project_key = ? ORDER BY id DESC LIMIT ?",
+                (project_key(project), limit)).fetchall()
+        finally:
+            conn.close()
+        builds = []
+        for values in reversed(rows):
+            build = dict(zip(_COLUMNS, values))
+            build["phases"] = json.loads(build["phases"] or "{}")
+            builds.append(build)
+        return builds
+
+    def record_startup(self, build_id, profile):
+        """빌드 기록에 시작 시간 측정 결과 (startup_profiler.profile_executable 반환값) 저장
+
+        같은 빌드를 다시 측정하면 이전 측정값을 덮어쓴다.
+        """
+        created = datetime.now().isoformat(timespec="seconds")
+        conn = self._connect()
+        try:
+            for kind in ("cold", "warm"):
+                summary = profile.get(kind)
+                if not summary:
+                    continue
+                row = (build_id, kind, created, summary["runs"], summary["first_output"]["median"],
+                       summary["exit"]["median"], summary["peak_rss"], summary["timeouts"],
+                       summary["failures"], int(bool(profile.get("cold_cache_evicted"))))
+                conn.execute(
+                    f"INSERT OR REPLACE INTO startup_profiles ({', '.join(_STARTUP_COLUMNS)}) "
+                    f"VALUES ({', '.join('?' * len(_STARTUP_COLUMNS))})", row)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def startup_profiles(self, project, limit=20):
+        """프로젝트의 최근 빌드별 시작 시간 측정값 {빌드 id: {"cold": 행, "warm": 행}}"""
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                f"SELECT {', '.join('s.' + column for column in _STARTUP_COLUMNS)} FROM startup_profiles s "
+                "JOIN builds b ON b.id = s.build_id WHERE b.project_key = ? ORDER BY s.build_id DESC LIMIT ?",
+                (project_key(project), limit * 2)).fetchall()
+        finally:
+            conn.close()
+        profiles = {}
+        for values in rows:
+            row = dict(zip(_STARTUP_COLUMNS, values))
+            profiles.setdefault(row["build_id"], {})[row["kind"]] = row
+        return profiles
+
+    def regressions(self, project, window=DEFAULT_WINDOW, threshold=DEFAULT_THRESHOLD, build=None):
+        """최근 빌드를 직전 성공 빌드 window 개의 중앙값과 비교해 회귀 목록 반환"""
+        # 실패한 빌드가 섞여 있어도 성공 빌드 window 개를 확보할 수 있도록 넉넉히 조회
+        builds = [b for b in self.builds(project, window * 4 + 1) if b["status"] == "success"]
+        if build is None:
+            if not builds:
+                return []
+            build = builds[-1]
+        previous = [b for b in builds if b["id"] != build["id"]][-window:]
+        return find_regressions(build, previous, threshold)
+
+    def clear(self):
+        """기록 전체 삭제"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+# 회귀를 검사할 항목과 표시 이름
+_METRICS = (
+    ("duration", "빌드 시간"),
+    ("total_size", "전체 크기"),
+    ("exe_size", "실행 파일 크기"),
+    ("file_count", "파일 수"),
+)
+
+
+def find_regressions(build, previous, threshold=DEFAULT_THRESHOLD):
+    """build 가 previous 빌드들의 중앙값보다 threshold 이상 늘어난 항목 목록"""
+    if build.get("status") != "success":
+        return []
+    regressions = []
+    for metric, label in _METRICS:
+        values = [b[metric] for b in previous if b.get(metric)]
+        current = build.get(metric)
+        if not values or not current:
+            continue
+        baseline = statistics.median(values)
+        if baseline and current > baseline * (1 + threshold):
+            regressions.append({
+                "metric": metric,
+                "label": label,
+                "value": current,
+                "baseline": baseline,
+                "change": (current - baseline) / baseline,
+            })
+    return regressions
+
+
+def _format_size(size):
+    """바이트 크기를 MB 문자열로"""
+    return f"{(size or 0) / (1024 * 1024):.2f} MB"
+
+
+def format_regressions(regressions):
+    """회귀 목록을 로그용 문자열 줄로 변환"""
+    lines = []
+    for r in regressions:
+        if r["metric"] == "duration":
+            values = f"{r['value']:.1f}초 (기준 {r['baseline']:.1f}초)"
+        elif r["metric"] == "file_count":
+            values = f"{r['value']}개 (기준 {r['baseline']:.0f}개)"
+        else:
+            values = f"{_format_size(r['value'])} (기준 {_format_size(r['baseline'])})"
+        lines.append(f"회귀 감지 - {r['label']}: {values}, +{r['change'] * 100:.0f}%\n")
+    return lines
+
+
+def format_startup_report(builds, profiles):
+    """빌드별 시작 시간 측정값 표 (측정한 빌드만, 측정값이 없으면 빈 목록)"""
+    lines = []
+    for build in builds:
+        profile = profiles.get(build["id"])
+        if not profile:
+            continue
+        cells = []
+        for kind in ("cold", "warm"):
+            row = profile.get(kind)
+            if row:
+                cells.append(f"{row['first_output']:>8.3f}  {row['exit_time']:>8.3f}  "
+                             f"{_format_size(row['peak_rss']):>11}")
+            else:
+                cells.append(f"{'-':>8}  {'-':>8}  {'-':>11}")
+        lines.append(f"{build['id']:>5}  {cells[0]}  {cells[1]}\n")
+    if lines:
+        lines.insert(0, f"{'#':>5}  {'콜드 출력':>8}  {'콜드 종료':>8}  {'콜드 메모리':>11}  "
+                        f"{'웜 출력':>8}  {'웜 종료':>8}  {'웜 메모리':>11}\n")
+    return lines
+
+
+def format_report(builds, window=DEFAULT_WINDOW, threshold=DEFAULT_THRESHOLD):
+    """빌드 기록 추세 표와 회귀 표시를 문자열 줄로 변환"""
+    lines = [f"{'#':>5}  {'일시':<19}  {'상태':<7}  {'시간(초)':>8}  {'전체 크기':>11}  "
+             f"{'실행 파일':>11}  {'파일 수':>6}  {'임포트':>5}  옵션 지문\n"]
+    successes = []
+    for build in builds:
+        flags = find_regressions(build, successes[-window:], threshold)
+        mark = " !" + ",".join(r["metric"] for r in flags) if flags else ""
+        duration = f"{build['duration']:.1f}" if build["duration"] is not None else "-"
+        lines.append(f"{build['id']:>5}  {build['created']:<19}  {build['status']:<7}  {duration:>8}  "
+                     f"{_format_size(build['total_size']):>11}  {_format_size(build['exe_size']):>11}  "
+                     f"{build['file_count']:>6}  {build['hidden_import_count']:>5}  "
+                     f"{build['options_fingerprint']}{mark}\n")
+        if build["status"] == "success":
+            successes.append(build)
+    return lines
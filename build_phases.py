@@ -0,0 +1,135 @@
+"""PyInstaller 로그 표시줄로 빌드 단계를 구분하고 단계별 소요 시간 기록 (Tk 비의존)"""
+import os
+import re
+import json
+import time
+from datetime import datetime
+
+import project_model
+
+
+# (단계, 표시 이름, 진행률, 단계 시작을 알리는 로그 패턴) - PyInstaller 가 출력하는 순서
+PHASES = [
+    ("startup", "PyInstaller 시작", 2, None),
+    ("module_graph", "모듈 그래프 생성", 10, re.compile(r"checking Analysis|Initializing module dependency graph")),
+    ("hooks", "훅 처리", 40, re.compile(r"Processing module hooks \(post-graph stage\)")),
+    ("binary_analysis", "바이너리 의존성 분석", 55, re.compile(r"Looking for ctypes DLLs|Looking for dynamic libraries")),
+    ("pyz", "PYZ 생성", 70, re.compile(r"checking PYZ")),
+    ("pkg", "PKG 생성", 78, re.compile(r"checking PKG")),
+    ("exe", "EXE 조립", 85, re.compile(r"checking EXE")),
+    ("collect", "COLLECT", 92, re.compile(r"checking COLLECT")),
+    ("bundle", "BUNDLE", 96, re.compile(r"checking BUNDLE")),
+]
+
+PHASE_LABELS = {phase: label for phase, label, _, _ in PHASES}
+_PHASE_ORDER = {phase: order for order, (phase, _, _, _) in enumerate(PHASES)}
+
+# 빌드 완료 표시줄
+_COMPLETE_PATTERN = re.compile(r"Build complete!")
+
+# 타이밍 보고서 파일 이름 (작업 폴더의 앱 폴더 안에 저장)
+REPORT_NAME = "build_timings.json"
+
+
+class PhaseTracker:
+    """PyInstaller 출력 줄을 받아 현재 단계와 단계별 실제 경과 시간을 추적
+
+    PyInstaller 를 여러 번 실행하는 빌드(변형 매트릭스)는 실행마다 완료 표시줄이 나오므로
+    finish_on_complete=False 로 만들고 모든 실행이 끝난 뒤 finish() 를 호출한다.
+    """
+
+    def __init__(self, clock=time.monotonic, finish_on_complete=True):
+        self._clock = clock
+        self.finish_on_complete = finish_on_complete
+        self.started_at = datetime.now()
+        self.phases = []
+        self.completed = False
+        self._enter("startup")
+
+    def _enter(self, phase):
+        """새 단계 시작 (이전 단계 종료)"""
+        now = self._clock()
+        if self.phases:
+            self.phases[-1]["end"] = now
+        self.phases.append({"phase": phase, "start": now, "end": None})
+
+    @property
+    def current(self):
+        """현재 단계"""
+        return self.phases[-1]["phase"]
+
+    def feed(self, line):
+        """출력 한 줄 처리, 단계가 바뀌면 (진행률, 표시 이름) 반환"""
+        if self.completed:
+            return None
+        if self.finish_on_complete and _COMPLETE_PATTERN.search(line):
+            self.finish()
+            return 100, "빌드 완료"
+        current_order = _PHASE_ORDER[self.current]
+        for phase, label, percent, pattern in PHASES:
+            if pattern is None or not pattern.search(line):
+                continue
+            # 단계는 앞으로만 진행하고, 새 Analysis 가 시작될 때만 모듈 그래프 단계로 돌아감
+            order = _PHASE_ORDER[phase]
+            if order > current_order or (phase == "module_graph" and order < current_order):
+                self._enter(phase)
+                return percent, label
+            return None
+        return None
+
+    def finish(self):
+        """마지막 단계 종료"""
+        if self.phases[-1]["end"] is None:
+            self.phases[-1]["end"] = self._clock()
+        self.completed = True
+
+    def durations(self):
+        """단계별 누적 소요 시간 (초, 처음 나타난 순서)"""
+        totals = {}
+        now = self._clock()
+        for entry in self.phases:
+            end = entry["end"] if entry["end"] is not None else now
+            totals[entry["phase"]] = totals.get(entry["phase"], 0) + end - entry["start"]
+        return totals
+
+    def report(self, **extra):
+        """JSON 으로 저장할 타이밍 보고서"""
+        durations = self.durations()
+        total = sum(durations.values())
+        phases = [{
+            "phase": phase,
+            "label": PHASE_LABELS.get(phase, phase),
+            "seconds": round(seconds, 3),
+            "percent": round(seconds * 100 / total, 1) if total else 0,
+        } for phase, seconds in durations.items()]
+        report = {
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "completed": self.completed,
+            "total": round(total, 3),
+            "dominant": max(phases, key=lambda p: p["seconds"])["phase"] if phases else None,
+            "phases": phases,
+        }
+        report.update(extra)
+        return report
+
+
+def report_path(project, base_dir=None):
+    """프로젝트의 타이밍 보고서 경로 (PyInstaller 작업 폴더의 앱 폴더 안)"""
+    work_path = os.path.join(base_dir or os.getcwd(), project["work_dir"] or "build")
+    return os.path.join(work_path, project_model.app_name_of(project), REPORT_NAME)
+
+
+def write_report(path, report):
+    """타이밍 보고서를 JSON 으로 저장"""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+    return path
+
+
+def format_summary(report):
+    """로그에 표시할 단계별 소요 시간 요약"""
+    lines = [f"단계별 소요 시간 (총 {report['total']:.1f}초):\n"]
+    for phase in sorted(report["phases"], key=lambda p: p["seconds"], reverse=True):
+        lines.append(f"- {phase['label']}: {phase['seconds']:.2f}초 ({phase['percent']:.0f}%)\n")
+    return lines
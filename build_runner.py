@@ -0,0 +1,472 @@
+"""프로젝트 분석, 환경 준비, PyInstaller 빌드를 잇는 헤드리스 빌드 파이프라인 (Tk 비의존)"""
+import locale
+import os
+import sys
+import shutil
+import subprocess
+import threading
+import time
+
+import build_env
+import bundle_analysis
+import build_history
+import build_phases
+import build_state
+import import_analysis
+import log_pipeline
+import module_index
+import project_model
+import spec_builder
+import startup_profiler
+import variant_matrix
+import workpath
+
+
+# 변형 매트릭스 빌드에서 공유 작업 폴더의 분석 결과(Analysis/PYZ)를 확인하거나 다시 쓰는 단계
+_SHARED_PHASES = ("startup", "module_graph", "hooks", "binary_analysis", "pyz")
+
+
+def _null_log(message, tag=None):
+    """로그 콜백이 없을 때 사용하는 기본 콜백"""
+
+
+def pyinstaller_argv(venv_dir=None):
+    """PyInstaller 실행 명령 (가상환경 > PATH > 현재 인터프리터 모듈 순)"""
+    if venv_dir:
+        return [build_env.venv_executable(venv_dir, "pyinstaller")]
+    executable = shutil.which("pyinstaller")
+    if executable:
+        return [executable]
+    return [sys.executable, "-m", "PyInstaller"]
+
+
+def run_pyinstaller(argv, log=_null_log, cancel_event=None, cwd=None, env=None):
+    """PyInstaller 를 셸 없이 실행하고 출력을 한 줄씩 log 로 전달, 종료 코드 반환
+
+    출력은 시스템 로캘 인코딩으로 읽고 디코딩할 수 없는 바이트는 대체 문자로 바꾼다.
+    cancel_event 가 설정되면 프로세스를 종료한 뒤 BuildCancelled 를 발생시킨다.
+    """
+    process = subprocess.Popen(
+        argv,
+        cwd=cwd,
+        env=env,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,  # 한 스레드에서 순서대로 읽도록 합침
+        text=True,
+        encoding=locale.getpreferredencoding(False),
+        errors='replace',
+        bufsize=1
+    )
+
+    # 취소 감시 스레드 (프로세스가 끝나면 함께 종료)
+    def watch_cancel():
+        while process.poll() is None:
+            if cancel_event.wait(0.2):
+                process.terminate()
+                return
+
+    if cancel_event is not None:
+        threading.Thread(target=watch_cancel, daemon=True).start()
+
+    for line in iter(process.stdout.readline, ''):
+        if "ERROR" in line:
+            log(line, "error")
+        elif "WARNING" in line:
+            log(line, "warning")
+        else:
+            log(line)
+    process.wait()
+
+    if cancel_event is not None and cancel_event.is_set():
+        raise build_env.BuildCancelled()
+    return process.returncode
+
+
+def build_project(project, safe_mode=False, analyze=True, wheelhouse=None, dry_run=False,
+                  log=_null_log, cancel_event=None, cwd=None, log_dir=None, history=None, force=False,
+                  profile_runs=0, profile_timeout=startup_profiler.DEFAULT_TIMEOUT):
+    """프로젝트 하나를 분석, (안전 모드면) 가상환경 준비 후 빌드하고 결과 dict 반환
+
+    log_dir 가 지정되면 pip 설치를 포함한 전체 로그를 그 폴더의 빌드별 파일에 기록하고,
+    history(BuildHistory) 가 지정되면 빌드 결과를 기록한 뒤 최근 빌드와 비교한다.
+    입력과 결과물이 마지막 성공 빌드와 같으면 force 가 아닌 한 PyInstaller 를 건너뛴다.
+    profile_runs 가 0 보다 크면 결과 실행 파일을 그 횟수만큼 실행해 시작 시간과 메모리를 잰다.
+    """
+    options = dict(safe_mode=safe_mode, analyze=analyze, wheelhouse=wheelhouse, dry_run=dry_run,
+                   cancel_event=cancel_event, cwd=cwd, history=history, force=force,
+                   profile_runs=profile_runs, profile_timeout=profile_timeout)
+    if log_dir is None:
+        return _build_project(project, log, **options)
+
+    project = project_model.new_project(**project)
+    build_log = log_pipeline.open_build_log(project_model.app_name_of(project) or "build", log_dir)
+
+    def tee(message, tag=None):
+        build_log.write(message, tag)
+        log(message, tag)
+
+    try:
+        result = _build_project(project, tee, **options)
+    finally:
+        build_log.close()
+    result["log_file"] = build_log.path
+    return result
+
+
+def run_variant_matrix(project, argv, log=_null_log, cancel_event=None, cwd=None, max_workers=None):
+    """변형 매트릭스 빌드: 분석만 하는 PyInstaller 를 실행한 뒤 변형마다 PyInstaller 를 동시에 실행
+
+    뒤의 실행들은 작업 폴더에 남은 분석 결과(Analysis/PYZ TOC)를 그대로 쓰므로 의존성 분석은
+    한 번만 한다. 분석 결과가 낡았다고 판단한 실행이 공유 작업 폴더를 다시 쓰는 동안 다른 실행이
+    읽지 않도록, Analysis/PYZ 단계는 한 번에 한 변형만 지나가게 하고 변형별 작업 폴더를 쓰는
+    EXE/COLLECT 단계부터 동시에 진행한다. 분석 시간과 변형별 소요 시간을 기록하고 첫 실패의
+    종료 코드(모두 성공이면 0) 반환.
+    """
+    env = dict(os.environ)
+    env[variant_matrix.VARIANTS_ENV] = ""
+    started = time.time()
+    returncode = run_pyinstaller(argv, log, cancel_event, cwd, env)
+    report = {"analysis": time.time() - started, "variants": {}}
+    if returncode != 0:
+        return returncode
+
+    # 공유하는 분석 결과를 지우지 않도록 --clean 없이 실행
+    argv = [arg for arg in argv if arg != "--clean"]
+    pending = list(project["variants"])
+    returncodes = {}
+    lock = threading.Lock()
+    shared_steps = threading.Lock()
+
+    def worker():
+        while True:
+            with lock:
+                if not pending or (cancel_event is not None and cancel_event.is_set()):
+                    return
+                name = pending.pop(0)
+
+            # 앞 변형이 공유 단계를 지날 때까지 기다렸다가 시작
+            shared_steps.acquire()
+            released = [False]
+            tracker = build_phases.PhaseTracker()
+
+            def release_shared_steps():
+                if not released[0]:
+                    released[0] = True
+                    shared_steps.release()
+
+            def variant_log(message, tag=None):
+                log(f"[{name}] {message}", tag)
+                tracker.feed(message)
+                if tracker.current not in _SHARED_PHASES:
+                    release_shared_steps()
+
+            variant_started = time.time()
+            try:
+                if cancel_event is not None and cancel_event.is_set():
+                    return
+                log(f"변형 빌드 시작: {name}\n", "info")
+                code = run_pyinstaller(argv, variant_log, cancel_event, cwd,
+                                       dict(env, **{variant_matrix.VARIANTS_ENV: name}))
+            except build_env.BuildCancelled:
+                return
+            except OSError as e:
+                variant_log(f"PyInstaller 실행 실패: {str(e)}\n", "error")
+                code = None
+            finally:
+                release_shared_steps()
+            with lock:
+                report["variants"][name] = time.time() - variant_started
+                returncodes[name] = code
+
+    workers = max_workers or min(len(pending), os.cpu_count() or 1)
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(max(1, workers))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if cancel_event is not None and cancel_event.is_set():
+        raise build_env.BuildCancelled()
+
+    variant_matrix.write_report(project, report, cwd)
+    failed = [name for name in project["variants"] if returncodes.get(name) != 0]
+    for name in failed:
+        log(f"변형 빌드 실패: {name}\n", "error")
+    return returncodes.get(failed[0], 1) if failed else 0
+
+
+def run_build(project, argv, log=_null_log, cancel_event=None, cwd=None, on_phase=None):
+    """PyInstaller 빌드 실행 (변형 매트릭스면 run_variant_matrix), (종료 코드, PhaseTracker) 반환
+
+    출력 줄로 빌드 단계를 추적하고 단계가 바뀔 때마다 on_phase(진행률, 단계 표시 이름) 를 호출한다.
+    GUI 와 헤드리스 빌드가 함께 쓴다.
+    """
+    # 변형 매트릭스는 분석만 하는 실행과 변형별 실행이 각자 완료 표시줄을 출력하므로 모두 끝난 뒤 종료
+    tracker = build_phases.PhaseTracker(finish_on_complete=not project["variants"])
+
+    def phase_log(message, tag=None):
+        log(message, tag)
+        phase = tracker.feed(message)
+        if phase and on_phase is not None:
+            on_phase(*phase)
+
+    if project["variants"]:
+        returncode = run_variant_matrix(project, argv, log=phase_log, cancel_event=cancel_event, cwd=cwd)
+    else:
+        returncode = run_pyinstaller(argv, log=phase_log, cancel_event=cancel_event, cwd=cwd)
+    tracker.finish()
+    return returncode, tracker
+
+
+def _profile_startup(project, cwd, runs, timeout, log):
+    """결과 실행 파일의 시작 시간 측정 (실패하면 경고만 남기고 None)"""
+    try:
+        profile = startup_profiler.profile_build(project, cwd, runs, timeout, log=log)
+    except OSError as e:
+        log(f"시작 시간 측정 실패: {str(e)}\n", "warning")
+        return None
+    if profile is None:
+        log("시작 시간 측정 실패: 실행 파일을 찾을 수 없습니다\n", "warning")
+        return None
+    for line in startup_profiler.format_profile(profile):
+        log(line, "info")
+    return profile
+
+
+def _profile_variants(project, cwd, runs, timeout, log):
+    """변형 매트릭스 빌드의 변형별 시작 시간을 재고 비교표를 남김 (빌드 기록에는 저장하지 않음)"""
+    profiles = []
+    for name in project["variants"]:
+        log(f"== {name} 시작 시간 측정\n", "info")
+        profile = _profile_startup(variant_matrix.variant_project(project, name), cwd, runs, timeout, log)
+        if profile is not None:
+            profile["mode"] = name
+            profiles.append(profile)
+    if profiles:
+        for line in startup_profiler.format_comparison(profiles):
+            log(line, "info")
+    return profiles
+
+
+def _report_variants(project, cwd, log):
+    """변형 매트릭스 빌드의 변형별 크기와 소요 시간을 로그에 남기고 반환"""
+    results = build_history.variant_results(project, cwd)
+    for line in variant_matrix.format_results(results, variant_matrix.read_report(project, cwd)):
+        log(line, "info")
+    return results
+
+
+def _build_project(project, log, **options):
+    """build_project 의 실제 빌드 (안전 모드 가상환경은 빌드가 끝날 때까지 캐시 제거 대상에서 뺌)"""
+    pins = []
+    try:
+        return _build_steps(project, log, pins, **options)
+    finally:
+        for venv_dir in pins:
+            build_env.unpin(venv_dir)
+
+
+def _build_steps(project, log, pins, safe_mode, analyze, wheelhouse, dry_run, cancel_event, cwd, history, force,
+                 profile_runs, profile_timeout):
+    """build_project 의 빌드 단계 (pin 한 가상환경은 pins 에 넣어 돌려줌)"""
+    project = project_model.new_project(**project)
+    # 헤드리스 빌드는 입력을 받을 수 없으므로 출력 폴더 덮어쓰기 확인을 생략
+    project["no_confirm"] = True
+    script_path = project["script_path"]
+    result = {
+        "script_path": script_path,
+        "app_name": project_model.app_name_of(project),
+        "status": "failed",
+        "returncode": None,
+        "venv_dir": None,
+        "hidden_imports": list(project["hidden_imports"]),
+        "command": [],
+        "output": None,
+        "timings": {},
+    }
+
+    errors = project.errors()
+    if errors:
+        result["error"] = "프로젝트 설정 오류: " + "; ".join(errors)
+        log(result["error"] + "\n", "error")
+        return result
+
+    for path in project_model.entry_scripts(project):
+        if not path or not os.path.isfile(path):
+            result["error"] = f"Python 파일을 찾을 수 없습니다: {path}"
+            log(result["error"] + "\n", "error")
+            return result
+
+    started = time.time()
+
+    # 1. 프로젝트 임포트 분석 (추가 진입 스크립트가 있으면 모두 합쳐서)
+    graph = import_analysis.analyze_scripts(project_model.entry_scripts(project))
+    result["timings"]["analysis"] = time.time() - started
+    if analyze:
+        hidden_imports = list(project["hidden_imports"])
+        for module in graph.hidden_imports():
+            if module not in hidden_imports:
+                hidden_imports.append(module)
+        project["hidden_imports"] = hidden_imports
+    for path, error in graph.errors.items():
+        log(f"파싱 실패: {path} - {error}\n", "warning")
+
+    # 2. 안전 모드: 지문 기반 캐시 가상환경 준비
+    venv_dir = None
+    if safe_mode:
+        step_started = time.time()
+        wheelhouse = wheelhouse or project["wheelhouse"] or None
+        if wheelhouse and not build_env.has_wheels(wheelhouse):
+            log(f"휠하우스에 휠이 없어 인덱스를 사용합니다: {wheelhouse}\n", "warning")
+            wheelhouse = None
+
+        if wheelhouse or build_env.check_internet_connection():
+            venv_dir, installed_modules = build_env.prepare_environment(
+                graph.top_level_imports(), wheelhouse=wheelhouse, log=log, cancel_event=cancel_event,
+                pin_result=True)
+            if venv_dir:
+                pins.append(venv_dir)
+            if venv_dir and installed_modules:
+                project["hidden_imports"] = installed_modules
+        else:
+            log("인터넷 연결과 휠하우스가 확인되지 않아 기존 방식으로 진행합니다.\n", "warning")
+        result["venv_dir"] = venv_dir
+        result["timings"]["environment"] = time.time() - step_started
+
+    # 3. 작업 폴더 배정과 --clean 여부 결정 (빌드 환경이 바뀌었을 때만 분석 캐시 정리)
+    project, clean, clean_reasons = workpath.prepare(project, venv_dir, cwd)
+    result["work_dir"] = project["work_dir"]
+    result["clean"] = clean
+    if project["managed_workpath"]:
+        action = "--clean 적용" if clean else "--clean 생략"
+        log(f"작업 폴더: {project['work_dir']} ({action})\n", "info")
+        for reason in clean_reasons:
+            log(f"- {reason}\n", "info")
+
+    # 4. PyInstaller 빌드 (spec 빌드면 옵션이 바뀌었을 때만 spec 파일을 다시 생성, dry_run 이면 쓰지 않음)
+    if project_model.uses_spec(project):
+        try:
+            if dry_run:
+                spec_path, stale = spec_builder.check_spec(project, cwd)
+                log(f"spec 파일: {spec_path} ({'생성 필요' if stale else '변경 없음'})\n", "info")
+            else:
+                spec_path, regenerated = spec_builder.ensure_spec(project, cwd)
+                log(f"spec 파일: {spec_path} ({'다시 생성' if regenerated else '변경 없음'})\n", "info")
+        except (OSError, ValueError) as e:
+            result["error"] = f"spec 파일 생성 실패: {str(e)}"
+            log(result["error"] + "\n", "error")
+            return result
+        result["spec"] = spec_path
+    command = project_model.build_command(project)
+    command[0:1] = pyinstaller_argv(venv_dir)
+    result["command"] = command
+    result["hidden_imports"] = list(project["hidden_imports"])
+    result["output"] = project_model.output_path(project, cwd)
+
+    # 입력 지문으로 다시 빌드해야 하는지 확인
+    signatures = build_state.input_signatures(project, command, graph, venv_dir, cwd)
+    up_to_date, reasons = build_state.check_up_to_date(project, signatures, cwd)
+    result["rebuild_reasons"] = reasons
+
+    if dry_run:
+        result["status"] = "dry-run"
+        result["timings"]["total"] = time.time() - started
+        return result
+
+    if up_to_date and not force:
+        log(f"변경 사항이 없어 빌드를 건너뜁니다: {result['output']}\n", "success")
+        result["status"] = "up-to-date"
+        result["timings"]["total"] = time.time() - started
+        if project["variants"]:
+            result["variants"] = _report_variants(project, cwd, log)
+            if profile_runs > 0:
+                result["variant_startup"] = _profile_variants(project, cwd, profile_runs, profile_timeout, log)
+        elif profile_runs > 0:
+            result["startup"] = _profile_startup(project, cwd, profile_runs, profile_timeout, log)
+            # 결과물이 그대로이므로 같은 옵션으로 성공한 마지막 빌드 기록에 측정값을 붙임
+            if result["startup"] and history is not None:
+                try:
+                    fingerprint = build_history.options_fingerprint(project)
+                    builds = [b for b in history.builds(project) if b["status"] == "success"
+                              and b["options_fingerprint"] == fingerprint]
+                    if builds:
+                        history.record_startup(builds[-1]["id"], result["startup"])
+                except Exception as e:
+                    log(f"빌드 기록 저장 실패: {str(e)}\n", "warning")
+        return result
+    for reason in reasons[:20]:
+        log(f"다시 빌드하는 이유: {reason}\n", "info")
+    if len(reasons) > 20:
+        log(f"... 외 {len(reasons) - 20}개\n", "info")
+
+    step_started = time.time()
+    log(f"빌드 시작: {project_model.command_line(command)}\n", "info")
+    try:
+        returncode, tracker = run_build(project, command, log, cancel_event, cwd)
+    except OSError as e:
+        result["error"] = f"PyInstaller 실행 실패: {str(e)}"
+        log(result["error"] + "\n", "error")
+        return result
+
+    result["returncode"] = returncode
+    result["timings"]["build"] = time.time() - step_started
+    result["timings"]["total"] = time.time() - started
+    result["timings"]["phases"] = {phase: round(seconds, 3) for phase, seconds in tracker.durations().items()}
+    result["status"] = "success" if returncode == 0 else "failed"
+    if returncode == 0:
+        try:
+            build_state.record_success(project, signatures, cwd)
+            if project["managed_workpath"]:
+                workpath.record(project, venv_dir)
+        except OSError as e:
+            log(f"빌드 상태 저장 실패: {str(e)}\n", "warning")
+    else:
+        build_state.invalidate(project, cwd)
+        if project["managed_workpath"]:
+            workpath.discard(project)
+
+    # 단계별 타이밍 보고서 (PyInstaller 작업 폴더에 저장)
+    report = tracker.report(app_name=result["app_name"], script_path=script_path, status=result["status"],
+                            steps={key: round(value, 3) for key, value in result["timings"].items()
+                                   if key != "phases"})
+    try:
+        result["timing_report"] = build_phases.write_report(build_phases.report_path(project, cwd), report)
+    except OSError as e:
+        log(f"타이밍 보고서 저장 실패: {str(e)}\n", "warning")
+    for line in build_phases.format_summary(report):
+        log(line, "info")
+
+    # 결과물 구성 (결과물 파일과 아카이브 항목을 패키지별로 집계, 변형 매트릭스면 첫 변형 기준)
+    if returncode == 0:
+        bundle_project = project
+        if project["variants"]:
+            result["variants"] = _report_variants(project, cwd, log)
+            bundle_project = variant_matrix.variant_project(project, project["variants"][0])
+        try:
+            index = module_index.build_index(build_env.venv_executable(venv_dir, "python")) if venv_dir else None
+            tree = bundle_analysis.analyze_bundle(bundle_project, cwd, index)
+            if tree is not None:
+                result["bundle"] = tree.to_dict(depth=1)
+                for line in bundle_analysis.format_summary(tree):
+                    log(line, "info")
+        except Exception as e:
+            log(f"결과물 구성 분석 실패: {str(e)}\n", "warning")
+        if profile_runs > 0 and project["variants"]:
+            result["variant_startup"] = _profile_variants(project, cwd, profile_runs, profile_timeout, log)
+        elif profile_runs > 0:
+            result["startup"] = _profile_startup(project, cwd, profile_runs, profile_timeout, log)
+
+    # 빌드 기록 저장 및 최근 빌드 대비 회귀 확인
+    if history is not None:
+        try:
+            record = history.record(project, result["status"], returncode, result["timings"]["build"],
+                                    result["timings"]["phases"], base_dir=cwd)
+            result["history_id"] = record["id"]
+            if result.get("startup"):
+                history.record_startup(record["id"], result["startup"])
+            result["regressions"] = history.regressions(project, build=record)
+            for line in build_history.format_regressions(result["regressions"]):
+                log(line, "warning")
+        except Exception as e:
+            log(f"빌드 기록 저장 실패: {str(e)}\n", "warning")
+    return result
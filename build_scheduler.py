@@ -0,0 +1,217 @@
+"""여러 프로젝트 파일을 동시에 빌드하는 빌드 대기열 (Tk 비의존)"""
+import os
+import sys
+import re
+import time
+import heapq
+import threading
+
+import build_env
+import build_runner
+import project_model
+
+
+# 빌드 하나가 사용하는 메모리 추정치 (동시 실행 수 계산용)
+DEFAULT_MEMORY_PER_JOB = 1024 * 1024 * 1024
+
+
+def available_memory_bytes():
+    """사용 가능한 물리 메모리 (알 수 없으면 None)"""
+    try:
+        if sys.platform.startswith("linux"):
+            with open("/proc/meminfo", 'r') as f:
+                for line in f:
+                    if line.startswith("MemAvailable:"):
+                        return int(line.split()[1]) * 1024
+        elif os.name == "nt":
+            import ctypes
+
+            class MEMORYSTATUSEX(ctypes.Structure):
+                _fields_ = [
+                    ("dwLength", ctypes.c_ulong),
+                    ("dwMemoryLoad", ctypes.c_ulong),
+                    ("ullTotalPhys", ctypes.c_ulonglong),
+                    ("ullAvailPhys", ctypes.c_ulonglong),
+                    ("ullTotalPageFile", ctypes.c_ulonglong),
+                    ("ullAvailPageFile", ctypes.c_ulonglong),
+                    ("ullTotalVirtual", ctypes.c_ulonglong),
+                    ("ullAvailVirtual", ctypes.c_ulonglong),
+                    ("sullAvailExtendedVirtual", ctypes.c_ulonglong),
+                ]
+
+            status = MEMORYSTATUSEX()
+            status.dwLength = ctypes.sizeof(MEMORYSTATUSEX)
+            if ctypes.windll.kernel32.GlobalMemoryStatusEx(ctypes.byref(status)):
+                return status.ullAvailPhys
+        else:
+            return os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    return None
+
+
+def default_worker_count(memory_per_job=DEFAULT_MEMORY_PER_JOB):
+    """코어 수와 사용 가능한 메모리를 기준으로 한 동시 빌드 수"""
+    workers = os.cpu_count() or 1
+    memory = available_memory_bytes()
+    if memory:
+        workers = min(workers, max(1, memory // memory_per_job))
+    return max(1, workers)
+
+
+def _safe_dir_name(name):
+    """폴더 이름으로 쓸 수 있도록 문자 정리"""
+    return re.sub(r"[^\w.-]+", "_", name).strip("_") or "app"
+
+
+class BuildJob:
+    """대기열에 들어간 빌드 작업 하나"""
+
+    def __init__(self, job_id, project_path, project, priority=0):
+        self.job_id = job_id
+        self.project_path = project_path
+        self.project = project
+        self.priority = priority
+        self.status = "queued"    # queued, running, success, failed, dry-run, up-to-date, cancelled
+        self.result = None
+        self.error = None
+        self.job_dir = None
+        self.started = None
+        self.finished = None
+
+    @property
+    def duration(self):
+        """실행 시간 (초)"""
+        if self.started is None:
+            return None
+        return (self.finished or time.time()) - self.started
+
+    def to_dict(self):
+        """JSON 출력용 요약"""
+        return {
+            "job_id": self.job_id,
+            "project": self.project_path,
+            "app_name": project_model.app_name_of(self.project),
+            "priority": self.priority,
+            "status": self.status,
+            "duration": self.duration,
+            "job_dir": self.job_dir,
+            "error": self.error,
+            "result": self.result,
+        }
+
+
+class BuildScheduler:
+    """우선순위가 높은 작업부터 최대 max_workers 개까지 동시에 빌드
+
+    각 작업은 batch_dir 아래 자기 폴더에서 실행되며 workpath, distpath,
+    spec 파일이 다른 작업과 겹치지 않는다.
+    """
+
+    def __init__(self, batch_dir, max_workers=None, safe_mode=False, analyze=True, wheelhouse=None,
+                 dry_run=False, log_dir=None, history=None, force=False):
+        self.batch_dir = os.path.abspath(batch_dir)
+        self.max_workers = max_workers or default_worker_count()
+        self.safe_mode = safe_mode
+        self.analyze = analyze
+        self.wheelhouse = wheelhouse
+        self.dry_run = dry_run
+        self.log_dir = log_dir
+        self.history = history
+        self.force = force
+        self.jobs = []
+        self.cancel_event = threading.Event()
+        self._queue = []
+        self._lock = threading.Lock()
+
+    def add(self, project_path, priority=0, project=None):
+        """프로젝트 파일을 대기열에 추가"""
+        project = project or project_model.load_project(project_path)
+        job = BuildJob(len(self.jobs) + 1, project_path, project, priority)
+        self.jobs.append(job)
+        # 우선순위가 높을수록, 같으면 먼저 넣은 작업부터
+        heapq.heappush(self._queue, (-priority, job.job_id, job))
+        return job
+
+    def cancel(self):
+        """대기 중인 작업을 취소하고 실행 중인 빌드 중단"""
+        self.cancel_event.set()
+
+    def _next_job(self):
+        """다음에 실행할 작업 (없으면 None)"""
+        with self._lock:
+            if not self._queue:
+                return None
+            return heapq.heappop(self._queue)[2]
+
+    def _run_job(self, job, log):
+        """작업 하나를 격리된 폴더에서 빌드"""
+        app_name = project_model.app_name_of(job.project)
+        job.job_dir = os.path.join(self.batch_dir, f"{job.job_id:03d}-{_safe_dir_name(app_name)}")
+        os.makedirs(job.job_dir, exist_ok=True)
+
+        project = project_model.new_project(**job.project)
+        project["work_dir"] = os.path.join(job.job_dir, "build")
+        project["output_dir"] = os.path.join(job.job_dir, "dist")
+
+        def job_log(message, tag=None):
+            log(f"[{job.job_id}:{app_name}] {message}", tag)
+
+        job.status = "running"
+        job.started = time.time()
+        log(f"[{job.job_id}:{app_name}] 빌드 시작 (우선순위 {job.priority})\n", "info")
+        try:
+            job.result = build_runner.build_project(
+                project, safe_mode=self.safe_mode, analyze=self.analyze, wheelhouse=self.wheelhouse,
+                dry_run=self.dry_run, log=job_log, cancel_event=self.cancel_event, cwd=job.job_dir,
+                log_dir=self.log_dir, history=self.history, force=self.force)
+            job.status = job.result["status"]
+            job.error = job.result.get("error")
+        except build_env.BuildCancelled:
+            job.status = "cancelled"
+        except Exception as e:
+            job.status = "failed"
+            job.error = str(e)
+        finally:
+            job.finished = time.time()
+            log(f"[{job.job_id}:{app_name}] {job.status} ({job.duration:.1f}초)\n",
+                "error" if job.status in ("failed", "cancelled") else "success")
+
+    def run(self, log=build_runner._null_log):
+        """대기열의 모든 작업을 실행하고 전체 요약 반환"""
+        started = time.time()
+
+        def worker():
+            while True:
+                job = self._next_job()
+                if job is None:
+                    return
+                if self.cancel_event.is_set():
+                    job.status = "cancelled"
+                    continue
+                self._run_job(job, log)
+
+        threads = [threading.Thread(target=worker, daemon=True)
+                   for _ in range(min(self.max_workers, len(self.jobs)) or 1)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        return self.summary(time.time() - started)
+
+    def summary(self, wall_time):
+        """작업별 상태와 전체 통계"""
+        job_time = sum(job.duration or 0 for job in self.jobs)
+        counts = {}
+        for job in self.jobs:
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return {
+            "workers": self.max_workers,
+            "total_jobs": len(self.jobs),
+            "counts": counts,
+            "wall_time": wall_time,
+            "sum_job_time": job_time,
+            "speedup": job_time / wall_time if wall_time else None,
+            "jobs": [job.to_dict() for job in sorted(self.jobs, key=lambda j: j.job_id)],
+        }
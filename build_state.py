@@ -0,0 +1,216 @@
+"""빌드 입력 지문으로 변경 여부를 판단하는 증분 빌드 검사 (Tk 비의존)"""
+import os
+import sys
+import json
+import hashlib
+import sysconfig
+
+import build_history
+import project_model
+
+
+# 마지막 성공 빌드의 입력 지문 파일 이름 (작업 폴더의 앱 폴더 안에 저장)
+STATE_NAME = "build_state.json"
+
+# 상태 파일 형식이 바뀌면 이전 상태를 무시하기 위한 버전
+STATE_VERSION = 1
+
+
+def _split_source(entry):
+    """--add-data / --add-binary 항목에서 원본 경로 분리"""
+    for separator in (";", os.pathsep):
+        if separator in entry:
+            return entry.rsplit(separator, 1)[0]
+    return entry
+
+
+def _stat_signature(path):
+    """파일/폴더의 크기와 수정 시각 (없으면 None)"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+def _module_listing(directory):
+    """폴더의 임포트 가능한 항목 (.py 파일과 패키지) 이름 목록
+
+    spec 파일이나 build/dist 폴더가 생겨도 바뀌지 않도록 폴더 수정 시각 대신 사용한다.
+    """
+    names = []
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".py"):
+                    names.append(entry.name)
+                elif entry.is_dir() and os.path.isfile(os.path.join(entry.path, "__init__.py")):
+                    names.append(entry.name + "/")
+    except OSError:
+        return None
+    return sorted(names)
+
+
+def _add_tree(signatures, path):
+    """폴더면 아래의 모든 파일과 폴더, 파일이면 그 파일의 서명 추가"""
+    signatures[path] = _stat_signature(path)
+    if not os.path.isdir(path):
+        return
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.name == "__pycache__":
+                        continue
+                    try:
+                        st = entry.stat()
+                    except OSError:
+                        continue
+                    signatures[entry.path] = [st.st_size, st.st_mtime_ns]
+                    if entry.is_dir():
+                        stack.append(entry.path)
+        except OSError:
+            pass
+
+
+def site_packages_dirs(venv_dir=None):
+    """빌드에 쓰이는 환경의 site-packages 폴더 (패키지 설치/삭제 시 수정 시각이 바뀜)"""
+    if venv_dir:
+        if os.name == "nt":
+            return [os.path.join(venv_dir, "Lib", "site-packages")]
+        lib_dir = os.path.join(venv_dir, "lib")
+        try:
+            return [os.path.join(lib_dir, name, "site-packages") for name in sorted(os.listdir(lib_dir))]
+        except OSError:
+            return []
+    paths = sysconfig.get_paths()
+    return sorted({paths["purelib"], paths["platlib"]})
+
+
+def input_signatures(project, command, graph=None, venv_dir=None, base_dir=None):
+    """빌드 결과에 영향을 주는 모든 입력의 서명 {항목: 서명}
+
+    상대 경로는 PyInstaller 를 실행하는 폴더(base_dir) 기준으로 해석한다.
+    """
+    base_dir = base_dir or os.getcwd()
+
+    def absolute(path):
+        return os.path.normpath(os.path.join(base_dir, path))
+
+    signatures = {}
+
+    # 옵션 목록 (실제로 실행할 인자 목록 그대로)
+    command_text = json.dumps(build_history.significant_options(command))
+    signatures["options"] = hashlib.sha256(command_text.encode("utf-8")).hexdigest()
+    signatures["python"] = sys.version
+
+    # 스크립트와 로컬 임포트 전체, 그리고 새 모듈 추가를 감지하기 위한 폴더 목록
+    sources = set(graph.local_modules.values()) if graph is not None else set()
+    sources.update(absolute(script) for script in project_model.entry_scripts(project))
+    for path in sorted(sources):
+        signatures[path] = _stat_signature(path)
+        directory = os.path.dirname(path)
+        if directory + os.sep not in signatures:
+            signatures[directory + os.sep] = _module_listing(directory)
+
+    # 데이터/바이너리 파일, 리소스, 아이콘/버전/매니페스트, 훅
+    for entry in project["data_files"] + project["binary_files"]:
+        _add_tree(signatures, absolute(_split_source(entry)))
+    for resource in project["resources"]:
+        _add_tree(signatures, absolute(resource.split(",")[0]))
+    for key in ("icon_file", "version_file", "manifest_file"):
+        if project[key]:
+            _add_tree(signatures, absolute(project[key]))
+    for path in project["hooks_dirs"] + project["runtime_hooks"]:
+        _add_tree(signatures, absolute(path))
+
+    # spec 빌드면 spec 파일 (옵션이 바뀔 때만 다시 생성되므로 수정 시각으로 충분)
+    if project_model.uses_spec(project):
+        signatures["spec"] = _stat_signature(project_model.spec_path_of(project, base_dir))
+
+    # 빌드 환경 (설치된 패키지가 바뀌면 다시 빌드)
+    for path in site_packages_dirs(venv_dir):
+        signatures[path] = _stat_signature(path)
+    return signatures
+
+
+def state_path(project, base_dir=None):
+    """프로젝트의 빌드 상태 파일 경로 (PyInstaller 작업 폴더의 앱 폴더 안)"""
+    work_path = os.path.join(base_dir or os.getcwd(), project["work_dir"] or "build")
+    return os.path.join(work_path, project_model.app_name_of(project), STATE_NAME)
+
+
+def _output_signature(project, base_dir=None):
+    """결과물 상태 (파일 수, 전체 크기, 실행 파일 크기)"""
+    return list(build_history.output_stats(project, base_dir))
+
+
+def _describe(key):
+    """변경 항목의 표시 이름"""
+    if key == "options":
+        return "PyInstaller 옵션"
+    if key == "python":
+        return "Python 버전"
+    if key == "spec":
+        return "spec 파일"
+    return key
+
+
+def check_up_to_date(project, signatures, base_dir=None):
+    """마지막 성공 빌드와 비교해 (최신 여부, 이유 목록) 반환"""
+    path = state_path(project, base_dir)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return False, ["이전 성공 빌드 기록 없음"]
+
+    if state.get("version") != STATE_VERSION:
+        return False, ["빌드 상태 형식이 바뀜"]
+
+    reasons = []
+    previous = state.get("inputs", {})
+    for key in sorted(set(previous) | set(signatures)):
+        if key not in previous:
+            reasons.append(f"입력 추가: {_describe(key)}")
+        elif key not in signatures:
+            reasons.append(f"입력 제거: {_describe(key)}")
+        elif previous[key] != signatures[key]:
+            if signatures[key] is None:
+                reasons.append(f"입력 없음: {_describe(key)}")
+            else:
+                reasons.append(f"입력 변경: {_describe(key)}")
+
+    output = _output_signature(project, base_dir)
+    if output[0] == 0:
+        reasons.append("결과물이 없음")
+    elif output != state.get("output"):
+        reasons.append("결과물이 변경되거나 손상됨")
+
+    if reasons:
+        return False, reasons
+    return True, ["입력과 결과물이 마지막 성공 빌드와 같음"]
+
+
+def record_success(project, signatures, base_dir=None):
+    """성공한 빌드의 입력 지문과 결과물 상태 저장"""
+    path = state_path(project, base_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            "version": STATE_VERSION,
+            "inputs": signatures,
+            "output": _output_signature(project, base_dir),
+        }, f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+    return path
+
+
+def invalidate(project, base_dir=None):
+    """저장된 빌드 상태 삭제 (다음 빌드는 반드시 실행)"""
+    try:
+        os.remove(state_path(project, base_dir))
+    except OSError:
+        pass
@@ -0,0 +1,282 @@
+"""빌드 결과물 구성 분석: dist 파일과 PKG/PYZ 아카이브 항목을 기여한 패키지별 크기로 집계 (Tk 비의존)"""
+import os
+import re
+import struct
+import marshal
+
+import module_index
+import project_model
+
+
+# 패키지로 묶을 수 없는 항목의 그룹 이름
+STDLIB_GROUP = "[표준 라이브러리]"
+RUNTIME_GROUP = "[Python 런타임]"
+SHARED_LIB_GROUP = "[공유 라이브러리]"
+BOOTLOADER_GROUP = "[부트로더]"
+SCRIPT_GROUP = "[실행 스크립트]"
+DATA_GROUP = "[기타 파일]"
+OVERHEAD_GROUP = "[아카이브 목차]"
+
+# PyInstaller 6 의 onedir 내부 폴더 기본 이름
+CONTENTS_DIR = "_internal"
+
+# PKG(CArchive) 쿠키와 목차 항목 형식 (PyInstaller 4 이상)
+_COOKIE_MAGIC = b'MEI\014\013\012\013\016'
+_COOKIE_FORMAT = '!8sIIII64s'
+_COOKIE_LENGTH = struct.calcsize(_COOKIE_FORMAT)
+_TOC_ENTRY_FORMAT = '!IIIIBc'
+_TOC_ENTRY_LENGTH = struct.calcsize(_TOC_ENTRY_FORMAT)
+_PYZ_MAGIC = b'PYZ\0'
+
+# PYZ 목차의 패키지 항목 유형 코드
+_PYZ_PACKAGE = 1
+
+_DIST_INFO_PATTERN = re.compile(r"^(?P<name>[^-]+)-[^-]+\.(dist|egg)-info$")
+_LIBRARY_PATTERN = re.compile(r"\.(so(\.\d+)*|dll|dylib|pyd)$", re.IGNORECASE)
+_EXTENSION_PATTERN = re.compile(r"\.(cpython-[^.]+|abi3)\.so$|\.pyd$", re.IGNORECASE)
+
+
+class BundleNode:
+    """크기 분석 트리의 노드 (그룹, 폴더, 파일)"""
+
+    def __init__(self, name):
+        self.name = name
+        self.size = 0
+        self.files = 0
+        self.children = {}
+
+    def add(self, parts, size):
+        """경로 조각 목록을 따라 내려가며 크기 누적"""
+        node = self
+        node.size += size
+        node.files += 1
+        for part in parts:
+            child = node.children.get(part)
+            if child is None:
+                child = node.children[part] = BundleNode(part)
+            child.size += size
+            child.files += 1
+            node = child
+
+    def sorted_children(self):
+        """크기가 큰 순서의 하위 노드"""
+        return sorted(self.children.values(), key=lambda node: (-node.size, node.name))
+
+    def to_dict(self, depth=1):
+        """JSON 으로 저장할 수 있는 dict (depth 단계까지)"""
+        data = {"name": self.name, "size": self.size, "files": self.files}
+        if depth > 0 and self.children:
+            data["children"] = [child.to_dict(depth - 1) for child in self.sorted_children()]
+        return data
+
+
+class BundleAnalyzer:
+    """결과물 파일과 아카이브 항목을 최상위 모듈/배포판 기준으로 분류"""
+
+    def __init__(self, index=None):
+        self.index = index or module_index.host_index()
+        self.root = BundleNode("")
+
+    def module_group(self, module):
+        """모듈 이름이 속한 그룹 (표준 라이브러리, 배포판 이름, 또는 최상위 모듈 이름)"""
+        top_level = module.split(".")[0]
+        if self.index.is_stdlib(top_level):
+            return STDLIB_GROUP
+        return self.index.distribution_for(top_level) or top_level
+
+    def add_module(self, module, size, is_package=False):
+        """PYZ 의 바이트코드 모듈 하나 추가"""
+        parts = module.split(".")
+        parts[-1] += ".pyc" if not is_package else ""
+        if is_package:
+            parts.append("__init__.pyc")
+        self.root.add([self.module_group(module)] + parts, size)
+
+    def add_file(self, relative_path, size):
+        """결과물 안의 파일 하나 추가 (경로는 내부 폴더 기준, '/' 구분)"""
+        parts = [part for part in relative_path.replace("\\", "/").split("/") if part]
+        first = parts[0]
+
+        if first == "base_library.zip" or first == "lib-dynload" or re.match(r"^python\d\.\d+$", first):
+            group = STDLIB_GROUP
+        elif _DIST_INFO_PATTERN.match(first):
+            name = _DIST_INFO_PATTERN.match(first).group("name")
+            group = self.index.distribution_for(name) or name
+        elif first.endswith((".libs", ".dylibs")):
+            group = self.module_group(first.rsplit(".", 1)[0])
+        elif len(parts) > 1:
+            group = self.module_group(first)
+        elif _EXTENSION_PATTERN.search(first):
+            group = self.module_group(first.split(".")[0])
+        elif re.match(r"^(lib)?python\d", first, re.IGNORECASE) and _LIBRARY_PATTERN.search(first):
+            group = RUNTIME_GROUP
+        elif _LIBRARY_PATTERN.search(first):
+            group = SHARED_LIB_GROUP
+        else:
+            group = DATA_GROUP
+        self.root.add([group] + parts, size)
+
+    def add_tree(self, path, skip=()):
+        """폴더 아래 모든 파일 추가 (os.scandir 로 한 번만 순회)"""
+        stack = [(path, "")]
+        while stack:
+            directory, prefix = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        relative = prefix + entry.name
+                        if entry.path in skip:
+                            continue
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append((entry.path, relative + "/"))
+                            continue
+                        try:
+                            size = entry.stat(follow_symlinks=False).st_size
+                        except OSError:
+                            continue
+                        self.add_file(relative, size)
+            except OSError:
+                continue
+
+    def add_executable(self, path):
+        """실행 파일의 부트로더와 내장 PKG(및 그 안의 PYZ) 항목 추가"""
+        size = os.path.getsize(path)
+        try:
+            pkg_start, entries = read_pkg(path)
+        except (OSError, ValueError, struct.error):
+            self.root.add([BOOTLOADER_GROUP, os.path.basename(path)], size)
+            return
+
+        self.root.add([BOOTLOADER_GROUP, os.path.basename(path)], pkg_start)
+        used = pkg_start
+        for name, offset, length, typecode in entries:
+            if typecode == "z":
+                used += self.add_pyz(path, pkg_start + offset, length)
+                continue
+            if typecode in ("m", "M"):
+                self.root.add([BOOTLOADER_GROUP, name], length)
+            elif typecode == "s":
+                self.root.add([SCRIPT_GROUP, name], length)
+            else:
+                self.add_file(name, length)
+            used += length
+        if size > used:
+            self.root.add([OVERHEAD_GROUP, os.path.basename(path)], size - used)
+
+    def add_pyz(self, path, offset, length):
+        """PKG 안의 PYZ 아카이브 모듈 추가, 분류한 크기 반환"""
+        try:
+            modules = read_pyz(path, offset)
+        except (OSError, ValueError, EOFError, TypeError, struct.error):
+            self.root.add([OVERHEAD_GROUP, "PYZ"], length)
+            return length
+        used = 0
+        for module, typecode, module_length in modules:
+            self.add_module(module, module_length, typecode == _PYZ_PACKAGE)
+            used += module_length
+        if length > used:
+            self.root.add([OVERHEAD_GROUP, "PYZ"], length - used)
+        return length
+
+
+def read_pkg(path):
+    """실행 파일에 붙은 PKG 의 (시작 위치, [(이름, 위치, 저장 크기, 유형 코드)]) 반환"""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        # 쿠키는 파일 끝 가까이에 있으므로 뒤에서부터 찾음
+        window = min(end, 64 * 1024)
+        f.seek(end - window)
+        tail = f.read(window)
+        position = tail.rfind(_COOKIE_MAGIC)
+        if position == -1:
+            raise ValueError("PKG 쿠키를 찾을 수 없습니다")
+        cookie_offset = end - window + position
+        _, pkg_length, toc_offset, toc_length, _, _ = struct.unpack(
+            _COOKIE_FORMAT, tail[position:position + _COOKIE_LENGTH])
+        pkg_start = cookie_offset + _COOKIE_LENGTH - pkg_length
+        f.seek(pkg_start + toc_offset)
+        toc = f.read(toc_length)
+
+    entries = []
+    cursor = 0
+    while cursor < len(toc):
+        entry_length, offset, length, _, _, typecode = struct.unpack(
+            _TOC_ENTRY_FORMAT, toc[cursor:cursor + _TOC_ENTRY_LENGTH])
+        name = toc[cursor + _TOC_ENTRY_LENGTH:cursor + entry_length].rstrip(b"\0").decode("utf-8")
+        cursor += entry_length
+        typecode = typecode.decode("ascii")
+        if typecode != "o":
+            entries.append((name, offset, length, typecode))
+    return pkg_start, entries
+
+
+def read_pyz(path, offset):
+    """PYZ 아카이브의 [(모듈 이름, 유형 코드, 저장 크기)] 반환"""
+    with open(path, 'rb') as f:
+        f.seek(offset)
+        if f.read(len(_PYZ_MAGIC)) != _PYZ_MAGIC:
+            raise ValueError("PYZ 형식이 아닙니다")
+        f.read(4)  # 바이트코드 매직 번호
+        toc_offset, = struct.unpack('!i', f.read(4))
+        f.seek(offset + toc_offset)
+        toc = marshal.load(f)
+    if isinstance(toc, dict):
+        toc = toc.items()
+    return [(name, entry[0], entry[2]) for name, entry in toc]
+
+
+def executable_path(project, base_dir=None):
+    """빌드된 실행 파일 경로 (Windows 가 아니면 확장자 없음)"""
+    path = project_model.output_path(project, base_dir)
+    if project["build_type"] == "--onefile":
+        return path
+    return os.path.join(path, project_model.app_name_of(project) + (".exe" if os.name == "nt" else ""))
+
+
+def analyze_bundle(project, base_dir=None, index=None):
+    """결과물 구성 분석 트리 반환 (결과물이 없으면 None)
+
+    index 는 빌드에 쓰인 환경의 module_index.ModuleIndex (없으면 현재 인터프리터)
+    """
+    output = project_model.output_path(project, base_dir)
+    exe_path = executable_path(project, base_dir)
+    analyzer = BundleAnalyzer(index)
+
+    if project["build_type"] == "--onefile":
+        if not os.path.isfile(output):
+            return None
+        analyzer.add_executable(output)
+        return analyzer.root
+
+    if not os.path.isdir(output):
+        return None
+    if os.path.isfile(exe_path):
+        analyzer.add_executable(exe_path)
+    contents_dir = os.path.join(output, CONTENTS_DIR)
+    if os.path.isdir(contents_dir):
+        analyzer.add_tree(contents_dir)
+        analyzer.add_tree(output, skip={contents_dir, exe_path})
+    else:
+        analyzer.add_tree(output, skip={exe_path})
+    return analyzer.root
+
+
+def format_size(size):
+    """바이트 크기를 읽기 쉬운 문자열로"""
+    if size >= 1024 * 1024:
+        return f"{size / (1024 * 1024):.2f} MB"
+    return f"{size / 1024:.1f} KB"
+
+
+def format_summary(root, limit=10):
+    """로그에 표시할 그룹별 크기 요약 (큰 순서로 limit 개)"""
+    lines = [f"번들 구성 (총 {format_size(root.size)}, {root.files}개 항목):\n"]
+    groups = root.sorted_children()
+    for group in groups[:limit]:
+        percent = group.size * 100 / root.size if root.size else 0
+        lines.append(f"- {group.name}: {format_size(group.size)} ({percent:.1f}%, {group.files}개)\n")
+    if len(groups) > limit:
+        rest = sum(group.size for group in groups[limit:])
+        lines.append(f"- 그 외 {len(groups) - limit}개 그룹: {format_size(rest)}\n")
+    return lines
@@ -0,0 +1,383 @@
+"""PyInstaller 작업 폴더의 모듈 그래프(xref/warn)와 TOC 로 제외 모듈 추천 (Tk 비의존)
+
+빌드 후 작업 폴더에 남는 xref-<앱>.html 의 모듈 그래프에서, 프로젝트가 직접 쓰지 않고
+다른 패키지가 try/함수 안/조건문에서만 가져오는 큰 모듈과 하위 패키지를 찾아
+--exclude-module 후보와 예상 절감 크기를 계산한다.
+"""
+import os
+import re
+import ast
+import html
+
+import import_analysis
+import module_index
+import project_model
+import workpath
+
+
+# 후보로 검토할 최소 크기와 최대 개수 (큰 것부터)
+DEFAULT_MIN_SIZE = 50 * 1024
+DEFAULT_MAX_CANDIDATES = 80
+
+# 크기와 관계없이 검토하는 흔한 불필요 모듈 (이름 패턴, 설명)
+KNOWN_CANDIDATES = (
+    (re.compile(r"(^|\.)(tests?|testing)$"), "테스트 코드"),
+    (re.compile(r"^(IPython|jedi|parso|prompt_toolkit|pygments)$"), "대화형 셸/편집 도구"),
+    (re.compile(r"^(tkinter|_tkinter)$"), "Tk GUI"),
+    (re.compile(r"^(pytest|_pytest|unittest|doctest|pdb|pydoc|pydoc_data|lib2to3)$"), "개발/디버깅 도구"),
+    (re.compile(r"^(setuptools|pkg_resources|distutils|pip)$"), "패키징 도구"),
+    (re.compile(r"\.backends?\."), "대체 백엔드"),
+)
+
+# 모듈 그래프에 없지만 모듈과 함께 수집되는 파일 (Tcl/Tk 데이터 등)
+_EXTRA_FILES = {
+    "tkinter": re.compile(r"^(_tcl_data|_tk_data|tcl|tk|tcl8)(/|$)|^(lib)?t(cl|k)\d", re.IGNORECASE),
+}
+
+# 모듈 그래프에서 실행되지 않는 노드 유형
+_MISSING_TYPES = ("MissingModule", "ExcludedModule", "InvalidSourceModule", "InvalidCompiledModule",
+                  "RuntimeModule", "AliasNode")
+
+_NAME_PATTERN = re.compile(r'<a name="([^"]*)"')
+_HREF_PATTERN = re.compile(r'<a target="code" href="([^"]*)"')
+_TYPE_PATTERN = re.compile(r'<span class="moduletype">([^<]*)</span>')
+_LINK_PATTERN = re.compile(r'<a href="#([^"]*)"')
+_EXTENSION_SUFFIX = re.compile(r"(\.(cpython-[^.]+|abi3))?\.(so|pyd)$", re.IGNORECASE)
+
+
+class ModuleGraph:
+    """xref-*.html 에서 읽은 PyInstaller 모듈 그래프"""
+
+    def __init__(self):
+        self.types = {}      # 모듈 -> 노드 유형 (Script, SourceModule, Package, ...)
+        self.paths = {}      # 모듈 -> 소스 파일 경로
+        self.imports = {}    # 모듈 -> 가져오는 모듈 집합
+        self.sizes = {}      # 모듈 -> 결과물에 들어간 크기 (추정)
+
+    def roots(self):
+        """그래프의 시작점 (진입 스크립트와 런타임 훅)"""
+        return [name for name, node_type in self.types.items() if node_type == "Script"]
+
+    def importers(self):
+        """모듈 -> 그 모듈을 가져오는 모듈 집합"""
+        reverse = {}
+        for name, targets in self.imports.items():
+            for target in targets:
+                reverse.setdefault(target, set()).add(name)
+        return reverse
+
+
+def read_xref(path):
+    """xref-*.html 을 읽어 ModuleGraph 반환"""
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        text = f.read()
+    graph = ModuleGraph()
+    for block in text.split('<div class="node">')[1:]:
+        match = _NAME_PATTERN.search(block)
+        if not match:
+            continue
+        name = html.unescape(match.group(1))
+        node_type = _TYPE_PATTERN.search(block)
+        graph.types[name] = node_type.group(1).strip() if node_type else ""
+        href = _HREF_PATTERN.search(block)
+        if href:
+            graph.paths[name] = html.unescape(href.group(1))
+        imports_part = block.split("imported by:")[0]
+        graph.imports[name] = {html.unescape(link) for link in _LINK_PATTERN.findall(imports_part)}
+    return graph
+
+
+def read_toc(path):
+    """PyInstaller TOC 파일에서 (이름, 원본 경로, 유형) 항목 목록 추출"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = ast.literal_eval(f.read())
+    entries = []
+    stack = [data]
+    while stack:
+        value = stack.pop()
+        if isinstance(value, (list, tuple)):
+            if (len(value) == 3 and all(isinstance(item, str) for item in value)
+                    and value[2].isupper()):
+                entries.append(value)
+            else:
+                stack.extend(value)
+    return entries
+
+
+def _file_size(path):
+    """파일 크기 (없으면 0)"""
+    try:
+        return os.path.getsize(path)
+    except (OSError, TypeError):
+        return 0
+
+
+def _owner_module(dest_name, modules):
+    """결과물 안의 파일 이름을 그 파일을 가져온 모듈로 변환 (없으면 None)"""
+    parts = dest_name.replace("\\", "/").split("/")
+    parts[-1] = _EXTENSION_SUFFIX.sub("", parts[-1])
+    if re.match(r"^python\d\.\d+$", parts[0]) and len(parts) > 2 and parts[1] == "lib-dynload":
+        parts = parts[2:]
+    for length in range(len(parts), 0, -1):
+        candidate = ".".join(parts[:length])
+        if candidate in modules:
+            return candidate
+    for module, pattern in _EXTRA_FILES.items():
+        if module in modules and pattern.search(dest_name):
+            return module
+    return None
+
+
+def _attach_sizes(graph, work_dir):
+    """PYZ/COLLECT/PKG TOC 의 원본 파일 크기를 모듈별로 합산"""
+    modules = set(graph.types)
+    seen = set()
+    for toc_name in ("PYZ-00.toc", "COLLECT-00.toc", "PKG-00.toc"):
+        toc_path = os.path.join(work_dir, toc_name)
+        if not os.path.isfile(toc_path):
+            continue
+        for name, source, typecode in read_toc(toc_path):
+            if name in seen or typecode in ("OPTION", "PYZ", "EXECUTABLE", "PYSOURCE", "DEPENDENCY"):
+                continue
+            seen.add(name)
+            owner = name if typecode == "PYMODULE" else _owner_module(name, modules)
+            if owner is not None:
+                graph.sizes[owner] = graph.sizes.get(owner, 0) + _file_size(source)
+
+
+def _statement_kind(stack):
+    """임포트 문을 감싼 구문으로 임포트 종류 결정"""
+    kinds = set()
+    for node in stack:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda)):
+            kinds.add("delayed")
+        elif isinstance(node, ast.Try) or type(node).__name__ == "TryStar":
+            kinds.add("optional")
+        elif isinstance(node, ast.If):
+            kinds.add("conditional")
+    return kinds or {"top-level"}
+
+
+def import_kinds(path, module_name):
+    """소스 파일의 임포트 문별 [(대상 모듈 목록, 종류 집합)] (파싱 실패 시 None)"""
+    try:
+        with open(path, 'rb') as f:
+            tree = ast.parse(f.read(), filename=path)
+    except (OSError, SyntaxError, ValueError):
+        return None
+
+    is_package = os.path.basename(path).startswith("__init__.")
+    package = module_name if is_package else module_name.rpartition(".")[0]
+    results = []
+
+    def visit(node, stack):
+        for child in ast.iter_child_nodes(node):
+            if isinstance(child, ast.Import):
+                targets = [alias.name for alias in child.names]
+                results.append((targets, _statement_kind(stack)))
+            elif isinstance(child, ast.ImportFrom):
+                if child.level:
+                    parts = package.split(".") if package else []
+                    parts = parts[:len(parts) - (child.level - 1)] if child.level > 1 else parts
+                    base = ".".join(parts + ([child.module] if child.module else []))
+                else:
+                    base = child.module or ""
+                targets = [base] + [f"{base}.{alias.name}" if base else alias.name
+                                    for alias in child.names if alias.name != "*"]
+                results.append((targets, _statement_kind(stack)))
+            else:
+                visit(child, stack + [child])
+
+    visit(tree, [])
+    return results
+
+
+def _in_subtree(name, prefix):
+    """name 이 prefix 모듈이거나 그 하위 모듈인지"""
+    return name == prefix or name.startswith(prefix + ".")
+
+
+def _reachable(graph, roots, blocked=None):
+    """roots 에서 닿는 모듈 집합 (blocked 하위는 들어가지 않음)"""
+    seen = set()
+    stack = [root for root in roots if root in graph.imports]
+    while stack:
+        name = stack.pop()
+        if name in seen or (blocked and _in_subtree(name, blocked)):
+            continue
+        if graph.types.get(name) in _MISSING_TYPES:
+            continue
+        seen.add(name)
+        stack.extend(graph.imports.get(name, ()))
+    return seen
+
+
+def _known_reason(module):
+    """흔한 불필요 모듈이면 설명 (아니면 None)"""
+    for pattern, reason in KNOWN_CANDIDATES:
+        if pattern.search(module):
+            return reason
+    return None
+
+
+class ExcludeAdvisor:
+    """모듈 그래프와 프로젝트 정적 임포트로 제외해도 안전해 보이는 모듈을 찾음"""
+
+    def __init__(self, graph, required=(), hidden_imports=(), excluded=(), index=None):
+        self.graph = graph
+        self.index = index or module_index.host_index()
+        self.required = set(required)
+        self.roots = graph.roots() + [name for name in hidden_imports if name in graph.imports]
+        self.excluded = set(excluded)
+        self.reachable = _reachable(graph, self.roots)
+        self.importers = graph.importers()
+        self._kinds_cache = {}
+
+    def _subtree_size(self, prefix, modules):
+        """모듈 집합 중 prefix 하위의 크기 합"""
+        return sum(self.graph.sizes.get(name, 0) for name in modules if _in_subtree(name, prefix))
+
+    def candidates(self, min_size=DEFAULT_MIN_SIZE, max_candidates=DEFAULT_MAX_CANDIDATES):
+        """검토할 모듈/패키지 이름 목록 (크기순)"""
+        totals = {}
+        for name in self.reachable:
+            size = self.graph.sizes.get(name, 0)
+            if not size:
+                continue
+            parts = name.split(".")
+            for length in range(1, len(parts) + 1):
+                prefix = ".".join(parts[:length])
+                totals[prefix] = totals.get(prefix, 0) + size
+
+        known = [name for name, size in totals.items() if _known_reason(name) and size >= min_size // 10]
+        large = sorted((name for name, size in totals.items() if size >= min_size),
+                       key=lambda name: -totals[name])[:max_candidates]
+        return sorted(set(known) | set(large), key=lambda name: -totals[name])
+
+    def _kinds(self, importer, target):
+        """importer 가 target(하위 포함)을 가져오는 임포트 문의 종류 집합"""
+        if importer not in self._kinds_cache:
+            path = self.graph.paths.get(importer)
+            self._kinds_cache[importer] = import_kinds(path, importer) if path and path.endswith(".py") else None
+        statements = self._kinds_cache[importer]
+        if statements is None:
+            return {"unknown"}
+        kinds = set()
+        for targets, statement_kinds in statements:
+            if any(_in_subtree(name, target) for name in targets):
+                kinds |= statement_kinds
+        # 소스에 임포트 문이 없는 연결은 훅의 hiddenimports 등 런타임에 필요한 것으로 간주
+        return kinds or {"unknown"}
+
+    def evaluate(self, module):
+        """모듈 하나를 제외했을 때의 안전성과 절감 크기, 안전하지 않으면 None"""
+        if module in self.excluded or module.startswith("pyi_"):
+            return None
+        # 표준 라이브러리와 비공개(_ 로 시작하는) 모듈은 속도 가속 모듈이나 지연 임포트가 많아
+        # 흔한 불필요 모듈 목록에 있을 때만 검토
+        known_reason = _known_reason(module)
+        if not known_reason and (self.index.is_stdlib(module) or module.rpartition(".")[2].startswith("_")):
+            return None
+        if any(_in_subtree(name, module) for name in self.required):
+            return None
+
+        remaining = _reachable(self.graph, self.roots, blocked=module)
+        removed = self.reachable - remaining
+        if any(name in self.required for name in removed):
+            return None
+
+        importers = {}
+        for name in removed:
+            if not _in_subtree(name, module):
+                continue
+            for importer in self.importers.get(name, ()):
+                if importer in remaining:
+                    importers.setdefault(importer, set()).update(self._kinds(importer, module))
+        if not importers or any(kinds & {"top-level", "unknown"} for kinds in importers.values()):
+            return None
+
+        # try/except 로만 가져오면 없어도 동작하도록 작성된 것이므로 위험이 낮음
+        optional_only = all(kinds == {"optional"} for kinds in importers.values())
+        return {
+            "module": module,
+            "saving": sum(self.graph.sizes.get(name, 0) for name in removed),
+            "modules": len(removed),
+            "reason": known_reason or ("try/except 안에서만 가져옴" if optional_only
+                                       else "함수 안이나 조건문에서만 가져옴"),
+            "risk": "low" if optional_only else "review",
+            "importers": {importer: sorted(kinds) for importer, kinds in sorted(importers.items())},
+        }
+
+    def recommend(self, min_size=DEFAULT_MIN_SIZE, max_candidates=DEFAULT_MAX_CANDIDATES):
+        """추천 목록 (절감 크기순, 이미 고른 패키지의 하위 모듈은 제외)"""
+        results = [result for result in (self.evaluate(module)
+                                         for module in self.candidates(min_size, max_candidates))
+                   if result is not None and result["saving"] >= min_size // 10]
+        results.sort(key=lambda result: (-result["saving"], result["module"]))
+        chosen = []
+        for result in results:
+            if not any(_in_subtree(result["module"], other["module"]) for other in chosen):
+                chosen.append(result)
+        return chosen
+
+    def combined_saving(self, modules):
+        """여러 모듈을 함께 제외했을 때의 절감 크기"""
+        remaining = set(self.reachable)
+        for module in modules:
+            remaining &= _reachable(self.graph, self.roots, blocked=module)
+        return sum(self.graph.sizes.get(name, 0) for name in self.reachable - remaining)
+
+
+def app_work_dir(project, base_dir=None):
+    """프로젝트의 PyInstaller 작업 폴더 안 앱 폴더"""
+    return os.path.join(workpath.resolve_work_dir(project, base_dir), project_model.app_name_of(project))
+
+
+def required_modules(project):
+    """프로젝트 코드가 직접 가져오는 모듈 (정적 임포트 분석 기준)"""
+    graph = import_analysis.analyze_scripts(project_model.entry_scripts(project))
+    required = set(graph.local_modules)
+    for targets in graph.edges.values():
+        required.update(targets)
+    required.discard("__main__")
+    return required
+
+
+def suggest_excludes(project, base_dir=None, min_size=DEFAULT_MIN_SIZE, index=None):
+    """마지막 빌드의 작업 폴더를 분석해 (추천 목록, 함께 제외 시 절감 크기) 반환
+
+    index 는 빌드에 쓰인 환경의 module_index.ModuleIndex (없으면 현재 인터프리터)
+
+    작업 폴더에 모듈 그래프가 없으면(빌드 전) FileNotFoundError 를 발생시킨다.
+    """
+    work_dir = app_work_dir(project, base_dir)
+    xref_path = os.path.join(work_dir, f"xref-{project_model.app_name_of(project)}.html")
+    if not os.path.isfile(xref_path):
+        raise FileNotFoundError(f"모듈 그래프가 없습니다. 먼저 빌드하세요: {xref_path}")
+
+    graph = read_xref(xref_path)
+    _attach_sizes(graph, work_dir)
+    advisor = ExcludeAdvisor(graph, required_modules(project), project["hidden_imports"],
+                             project["exclude_modules"], index)
+    recommendations = advisor.recommend(min_size)
+    return recommendations, advisor.combined_saving([r["module"] for r in recommendations])
+
+
+def apply_excludes(project, modules):
+    """프로젝트의 제외 모듈 목록에 추천 모듈 추가 (추가된 모듈 목록 반환)"""
+    added = [module for module in modules if module not in project["exclude_modules"]]
+    project["exclude_modules"] = list(project["exclude_modules"]) + added
+    return added
+
+
+def format_recommendations(recommendations, total_saving):
+    """추천 목록을 로그용 문자열 줄로 변환"""
+    if not recommendations:
+        return ["제외를 추천할 모듈이 없습니다.\n"]
+    lines = [f"제외 모듈 추천 {len(recommendations)}개 (모두 제외 시 약 {total_saving / (1024 * 1024):.2f} MB 절감):\n"]
+    for r in recommendations:
+        importers = ", ".join(f"{name} ({'/'.join(kinds)})" for name, kinds in list(r["importers"].items())[:3])
+        mark = "" if r["risk"] == "low" else " (검토 필요)"
+        lines.append(f"- {r['module']}{mark}: 약 {r['saving'] / (1024 * 1024):.2f} MB, 모듈 {r['modules']}개 "
+                     f"[{r['reason']}] <- {importers}\n")
+    return lines
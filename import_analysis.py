@@ -0,0 +1,394 @@
+"""프로젝트 전체 임포트 그래프 분석 (Tk 비의존)"""
+import os
+import sys
+import ast
+import json
+import hashlib
+import multiprocessing
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import module_index
+import user_dirs
+
+
+# 한 단계에서 파싱할 파일이 이 개수 이상이면 프로세스 풀 사용
+PARALLEL_THRESHOLD = 16
+
+# 분석 캐시 기본 위치 (GUI와 헤드리스 실행이 함께 쓰는 사용자별 캐시 폴더)
+DEFAULT_CACHE_PATH = user_dirs.cache_path("analysis_cache.db")
+DEFAULT_CACHE_MAX_ENTRIES = 50000
+
+# 파싱 결과 형식이나 파이썬 문법이 바뀌면 캐시를 무효화하기 위한 버전
+ANALYSIS_VERSION = f"1-py{sys.version_info[0]}.{sys.version_info[1]}"
+
+
+class AnalysisCancelled(Exception):
+    """진행 중인 분석이 취소되었을 때 발생"""
+
+
+def _parse_source(source, path):
+    """소스를 파싱해 (모듈명, 상대 레벨, 가져온 이름들) 목록 반환"""
+    tree = ast.parse(source, filename=path)
+    imports = []
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for name in node.names:
+                imports.append((name.name, 0, ()))
+        elif isinstance(node, ast.ImportFrom):
+            imports.append((node.module or "", node.level, tuple(name.name for name in node.names)))
+
+    return imports
+
+
+def parse_file(path):
+    """파일 하나를 파싱해 (모듈명, 상대 레벨, 가져온 이름들) 목록 반환"""
+    # 바이트로 읽어야 파일의 인코딩 선언을 ast 가 그대로 처리함
+    with open(path, 'rb') as f:
+        source = f.read()
+    return _parse_source(source, path)
+
+
+def _parse_safe(path):
+    """파싱 오류를 결과로 돌려주는 parse_file (프로세스 풀 작업용)
+
+    (임포트 목록, 오류, 내용 해시) 를 반환한다.
+    """
+    try:
+        with open(path, 'rb') as f:
+            source = f.read()
+    except OSError as e:
+        return [], str(e), None
+
+    digest = hashlib.sha256(source).hexdigest()
+    try:
+        return _parse_source(source, path), None, digest
+    except (SyntaxError, ValueError) as e:
+        return [], str(e), digest
+
+
+def _file_digest(path):
+    """파일 내용 해시"""
+    with open(path, 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+class AnalysisCache:
+    """파일 지문(경로, 크기, 수정 시각, 내용 해시)으로 임포트 분석 결과를 보관하는 디스크 캐시
+
+    크기와 수정 시각이 같으면 stat 만으로 적중하고, 다르면 내용 해시를 비교해
+    내용이 같을 때는 다시 파싱하지 않는다. 항목 수가 max_entries 를 넘으면
+    가장 오래 사용하지 않은 항목부터 제거한다.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries=DEFAULT_CACHE_MAX_ENTRIES):
+        self.path = path
+        self.max_entries = max_entries
+
+    def _connect(self):
+        """캐시 데이터베이스 연결 (호출한 스레드 전용)"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "path TEXT PRIMARY KEY, version TEXT, size INTEGER, mtime_ns INTEGER, "
+            "sha256 TEXT, imports TEXT, error TEXT, last_used REAL)"
+        )
+        return conn
+
+    def lookup_many(self, paths):
+        """캐시에서 분석 결과 조회
+
+        ({경로: (임포트 목록, 오류)}, 캐시에 없는 경로 목록) 을 반환한다.
+        """
+        hits = {}
+        misses = []
+        touched = []
+        now = time.time()
+
+        try:
+            conn = self._connect()
+        except sqlite3.Error:
+            return hits, list(paths)
+
+        try:
+            for path in paths:
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    misses.append(path)
+                    continue
+
+                row = conn.execute(
+                    "SELECT size, mtime_ns, sha256, imports, error FROM files WHERE path = ? AND version = ?",
+                    (path, ANALYSIS_VERSION)
+                ).fetchone()
+                if row is None:
+                    misses.append(path)
+                    continue
+
+                size, mtime_ns, digest, imports_json, error = row
+                if size != st.st_size or mtime_ns != st.st_mtime_ns:
+                    # 수정 시각만 바뀐 경우 내용 해시로 확인
+                    try:
+                        same = _file_digest(path) == digest
+                    except OSError:
+                        same = False
+                    if not same:
+                        misses.append(path)
+                        continue
+                    conn.execute("UPDATE files SET size = ?, mtime_ns = ? WHERE path = ?",
+                                 (st.st_size, st.st_mtime_ns, path))
+
+                hits[path] = ([(name, level, tuple(names)) for name, level, names in json.loads(imports_json)],
+                              error)
+                touched.append((now, path))
+
+            conn.executemany("UPDATE files SET last_used = ? WHERE path = ?", touched)
+            conn.commit()
+        except sqlite3.Error:
+            return hits, [path for path in paths if path not in hits]
+        finally:
+            conn.close()
+
+        return hits, misses
+
+    def store_many(self, results):
+        """분석 결과 저장 (results: {경로: (임포트 목록, 오류, 내용 해시)})"""
+        rows = []
+        now = time.time()
+        for path, (imports, error, digest) in results.items():
+            if digest is None:
+                continue
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            rows.append((path, ANALYSIS_VERSION, st.st_size, st.st_mtime_ns, digest,
+                         json.dumps(imports), error, now))
+
+        if not rows:
+            return
+
+        try:
+            conn = self._connect()
+        except sqlite3.Error:
+            return
+
+        try:
+            conn.executemany("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?, ?, ?, ?, ?)", rows)
+            self._evict(conn)
+            conn.commit()
+        except sqlite3.Error:
+            pass
+        finally:
+            conn.close()
+
+    def _evict(self, conn):
+        """항목 수 제한을 넘으면 오래된 항목 제거"""
+        count = conn.execute("SELECT COUNT(*) FROM files").fetchone()[0]
+        if count > self.max_entries:
+            conn.execute(
+                "DELETE FROM files WHERE path IN (SELECT path FROM files ORDER BY last_used LIMIT ?)",
+                (count - self.max_entries,)
+            )
+
+    def clear(self):
+        """캐시 전체 삭제"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class ImportGraph:
+    """프로젝트 임포트 분석 결과"""
+
+    def __init__(self, script_path):
+        self.script_path = os.path.abspath(script_path)
+        self.root = os.path.dirname(self.script_path)
+        self.local_modules = {}   # 로컬 모듈명 -> 파일 경로
+        self.stdlib = set()       # 표준 라이브러리 최상위 모듈
+        self.third_party = set()  # 서드파티 모듈 (점 포함 전체 이름)
+        self.edges = {}           # 로컬 모듈명 -> 가져오는 모듈명 집합
+        self.errors = {}          # 파일 경로 -> 파싱 오류
+
+    def third_party_packages(self):
+        """서드파티 최상위 모듈 이름"""
+        return sorted({name.split('.')[0] for name in self.third_party})
+
+    def top_level_imports(self):
+        """로컬 모듈을 제외한 최상위 임포트 (설치 목록용)"""
+        return sorted(self.stdlib | set(self.third_party_packages()))
+
+    def hidden_imports(self):
+        """숨겨진 임포트 목록 (표준 라이브러리 + 서드파티 전체 이름)"""
+        return sorted(self.stdlib | self.third_party)
+
+    def find_local(self, name):
+        """로컬 모듈 이름에 해당하는 파일 경로 (없으면 None)"""
+        base = os.path.join(self.root, *name.split('.'))
+        if os.path.isfile(base + ".py"):
+            return base + ".py"
+        init_path = os.path.join(base, "__init__.py")
+        if os.path.isfile(init_path):
+            return init_path
+        return None
+
+    def is_local_top_level(self, name):
+        """최상위 이름이 스크립트 폴더의 로컬 모듈/패키지인지 확인"""
+        return self.find_local(name.split('.')[0]) is not None
+
+    def merge(self, other):
+        """다른 진입 스크립트의 분석 결과를 합침 (같은 이름의 로컬 모듈은 먼저 분석한 쪽 유지)"""
+        for name, path in other.local_modules.items():
+            self.local_modules.setdefault(name, path)
+        for name, targets in other.edges.items():
+            self.edges.setdefault(name, set()).update(targets)
+        self.stdlib |= other.stdlib
+        self.third_party |= other.third_party
+        self.errors.update(other.errors)
+
+
+def _module_name(graph, path):
+    """파일 경로에서 로컬 모듈 이름 계산"""
+    if path == graph.script_path:
+        return "__main__"
+    rel = os.path.relpath(path, graph.root)
+    parts = os.path.splitext(rel)[0].split(os.sep)
+    if parts[-1] == "__init__":
+        parts.pop()
+    return ".".join(parts)
+
+
+def _resolve_relative(module_name, path, level, name):
+    """상대 임포트를 절대 모듈 이름으로 변환"""
+    package = module_name if os.path.basename(path) == "__init__.py" else module_name.rpartition('.')[0]
+    if module_name == "__main__":
+        package = ""
+    parts = package.split('.') if package else []
+    if level - 1 > len(parts):
+        return None
+    if level > 1:
+        parts = parts[:len(parts) - (level - 1)]
+    if name:
+        parts.append(name)
+    return ".".join(parts)
+
+
+def _local_targets(graph, name):
+    """로컬 모듈 이름과 그 상위 패키지 중 실제 파일이 있는 것들"""
+    parts = name.split('.')
+    targets = []
+    for i in range(1, len(parts) + 1):
+        candidate = ".".join(parts[:i])
+        path = graph.find_local(candidate)
+        if path:
+            targets.append((candidate, path))
+    return targets
+
+
+def _parse_many(paths, executor_holder, max_workers, cache):
+    """파일 목록을 파싱 (캐시에 없는 파일만, 많으면 프로세스 풀에서 병렬로)"""
+    if cache:
+        hits, misses = cache.lookup_many(paths)
+    else:
+        hits, misses = {}, list(paths)
+
+    if len(misses) < PARALLEL_THRESHOLD:
+        parsed = [_parse_safe(path) for path in misses]
+    else:
+        if executor_holder[0] is None:
+            # GUI 작업 스레드에서도 호출되므로 스레드가 있는 프로세스를 fork 하지 않고 spawn 으로 시작
+            executor_holder[0] = ProcessPoolExecutor(max_workers=max_workers,
+                                                     mp_context=multiprocessing.get_context("spawn"))
+        workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, len(misses) // (workers * 4))
+        parsed = list(executor_holder[0].map(_parse_safe, misses, chunksize=chunksize))
+
+    results = dict(zip(misses, parsed))
+    if cache:
+        cache.store_many(results)
+
+    for path, (imports, error, digest) in results.items():
+        hits[path] = (imports, error)
+    return [hits[path] for path in paths]
+
+
+def analyze_project(script_path, max_workers=None, cache=None, cancel_event=None):
+    """진입 스크립트에서 로컬 모듈을 따라가며 프로젝트 전체 임포트 그래프 생성
+
+    같은 깊이의 파일들은 한 번에 모아 파싱하며, 파일이 많으면 프로세스 풀에서
+    병렬로 처리한다. 변경되지 않은 파일은 분석 캐시에서 가져온다
+    (cache=None 이면 기본 캐시, False 이면 캐시 사용 안 함).
+    cancel_event 가 설정되면 다음 단계로 넘어가기 전에 AnalysisCancelled 를 발생시킨다.
+    """
+    if cache is None:
+        cache = AnalysisCache()
+    stdlib = module_index.host_index().stdlib
+    graph = ImportGraph(script_path)
+    pending = {graph.script_path}
+    seen = set()
+    executor_holder = [None]
+
+    try:
+        while pending:
+            if cancel_event is not None and cancel_event.is_set():
+                raise AnalysisCancelled()
+
+            paths = sorted(pending)
+            seen.update(paths)
+            pending = set()
+
+            for path, (imports, error) in zip(paths, _parse_many(paths, executor_holder, max_workers, cache)):
+                module_name = _module_name(graph, path)
+                graph.local_modules[module_name] = path
+                edges = graph.edges.setdefault(module_name, set())
+                if error:
+                    graph.errors[path] = error
+
+                for name, level, names in imports:
+                    if level:
+                        base = _resolve_relative(module_name, path, level, name)
+                        if base is None:
+                            continue
+                        # 진입 스크립트의 "from . import x" 는 패키지가 없어 base 가 빈 문자열이 됨
+                        candidates = [candidate for candidate in [base] + [f"{base}.{n}" if base else n
+                                                                          for n in names if n != "*"]
+                                      if candidate]
+                    elif graph.is_local_top_level(name):
+                        candidates = [name] + [f"{name}.{n}" for n in names if n != "*"]
+                    else:
+                        top_level = name.split('.')[0]
+                        if not top_level:
+                            continue
+                        edges.add(name)
+                        if top_level in stdlib:
+                            graph.stdlib.add(top_level)
+                        else:
+                            graph.third_party.add(name)
+                        continue
+
+                    # 로컬 모듈: 실제 파일이 있는 모듈과 상위 패키지를 따라감
+                    for candidate in candidates:
+                        for target, target_path in _local_targets(graph, candidate):
+                            edges.add(target)
+                            if target_path not in seen:
+                                pending.add(target_path)
+    finally:
+        if executor_holder[0] is not None:
+            executor_holder[0].shutdown()
+
+    return graph
+
+
+def analyze_scripts(script_paths, max_workers=None, cache=None, cancel_event=None):
+    """여러 진입 스크립트를 분석해 첫 스크립트 기준의 그래프 하나로 합침 (다중 진입점 번들용)"""
+    if cache is None:
+        cache = AnalysisCache()
+    graph = analyze_project(script_paths[0], max_workers, cache, cancel_event)
+    for script_path in script_paths[1:]:
+        graph.merge(analyze_project(script_path, max_workers, cache, cancel_event))
+    return graph
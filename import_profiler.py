@@ -0,0 +1,240 @@
+"""빌드 환경에서 진입 스크립트의 임포트 시간을 -X importtime 으로 측정 (Tk 비의존)
+
+진입 스크립트의 임포트 문만 실행하거나(기본) 스크립트 전체를 실행해 인터프리터가
+출력하는 임포트 시간을 누적 임포트 트리로 만들고, 비싼 모듈과 패키지를 순위로 보여 준다.
+요약은 프로젝트 파일의 import_profile 항목에 저장된다.
+"""
+import os
+import sys
+import ast
+import subprocess
+import threading
+from datetime import datetime
+
+import build_env
+import module_index
+
+
+# 측정 방식: 임포트 문만 실행하거나 스크립트 전체를 실행
+MODE_IMPORTS = "imports"
+MODE_SCRIPT = "script"
+
+DEFAULT_TIMEOUT = 60
+
+# 프로젝트 파일에 저장할 순위 항목 수와, 누적 시간을 따로 저장할 모듈의 최소 누적 시간(마이크로초)
+DEFAULT_STORED_ENTRIES = 30
+STORED_CUMULATIVE_MIN_US = 1000
+
+# 임포트에 실패한 문장을 표준 오류에 알리는 표식
+_FAILED_MARKER = "IMPORT-PROFILE-FAILED:"
+
+# 임포트 문만 실행하는 러너 (스크립트 폴더를 sys.path 맨 앞에 두고 문장마다 따로 실행)
+_RUNNER = """
+import sys
+sys.argv = [{script!r}]
+sys.path.insert(0, {root!r})
+for _statement in {statements!r}:
+    try:
+        exec(_statement, {{"__name__": "__import_profile__"}})
+    except BaseException as _error:
+        sys.stderr.write({marker!r} + " " + _statement + " | " + repr(_error) + "\\n")
+"""
+
+
+class ImportNode:
+    """임포트 트리의 모듈 하나 (시간은 마이크로초)"""
+
+    def __init__(self, name, self_us, cumulative_us, children=None):
+        self.name = name
+        self.self_us = self_us
+        self.cumulative_us = cumulative_us
+        self.children = children or []
+
+    def walk(self):
+        """자신과 모든 하위 노드"""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(node.children)
+
+
+def import_statements(script_path):
+    """스크립트의 함수/클래스 밖 임포트 문 목록 (try/if/with 블록 안 포함, 소스 순서)"""
+    with open(script_path, 'rb') as f:
+        tree = ast.parse(f.read(), filename=script_path)
+    statements = []
+    pending = list(tree.body)
+    while pending:
+        node = pending.pop(0)
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            statements.append(ast.unparse(node))
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            continue
+        else:
+            children = [child for field in ("body", "orelse", "finalbody", "handlers")
+                        for child in getattr(node, field, []) or []]
+            pending[0:0] = children
+    return statements
+
+
+def parse_importtime(output):
+    """-X importtime 출력을 누적 임포트 트리의 최상위 노드 목록으로 변환
+
+    인터프리터는 하위 모듈을 먼저, 들여쓰기(단계마다 공백 두 칸)로 깊이를 표시해 출력한다.
+    """
+    pending = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line[len("import time:"):].split("|", 2)
+        if len(parts) != 3:
+            continue
+        try:
+            self_us = int(parts[0])
+            cumulative_us = int(parts[1])
+        except ValueError:
+            continue  # 머리글 줄
+        name_part = parts[2][1:] if parts[2].startswith(" ") else parts[2]
+        name = name_part.lstrip(" ")
+        depth = (len(name_part) - len(name)) // 2
+        node = ImportNode(name.strip(), self_us, cumulative_us, pending.pop(depth + 1, []))
+        pending.setdefault(depth, []).append(node)
+    roots = []
+    for depth in sorted(pending):
+        roots.extend(pending[depth])
+    return roots
+
+
+def rank_modules(roots, limit=20, key="self_us"):
+    """비용이 큰 순서의 모듈 목록 [(이름, 자체 시간, 누적 시간)]"""
+    nodes = [node for root in roots for node in root.walk()]
+    nodes.sort(key=lambda node: -getattr(node, key))
+    return [(node.name, node.self_us, node.cumulative_us) for node in nodes[:limit]]
+
+
+def rank_packages(roots, index=None, limit=20):
+    """최상위 패키지별 자체 시간 합계 순위 [{"name", "self_us", "modules", "stdlib"}]
+
+    패키지가 임포트하는 다른 패키지의 시간은 그 패키지에 따로 집계된다.
+    """
+    index = index or module_index.host_index()
+    packages = {}
+    for root in roots:
+        for node in root.walk():
+            top_level = node.name.split(".")[0]
+            entry = packages.setdefault(top_level, {"name": top_level, "self_us": 0, "modules": 0,
+                                                    "stdlib": index.is_stdlib(top_level)})
+            entry["self_us"] += node.self_us
+            entry["modules"] += 1
+    ranked = sorted(packages.values(), key=lambda entry: -entry["self_us"])
+    return ranked[:limit]
+
+
+def _run(argv, cwd, timeout):
+    """명령을 실행해 (표준 오류, 종료 코드, 시간 초과 여부) 반환 (표준 출력은 버림)"""
+    process = subprocess.Popen(argv, cwd=cwd, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL,
+                               stderr=subprocess.PIPE, text=True, errors='replace')
+    timed_out = threading.Event()
+
+    def kill():
+        timed_out.set()
+        process.kill()
+
+    timer = threading.Timer(timeout, kill)
+    timer.start()
+    try:
+        _, stderr = process.communicate()
+    finally:
+        timer.cancel()
+    return stderr, process.returncode, timed_out.is_set()
+
+
+def profile_imports(script_path, python_exe=None, mode=MODE_IMPORTS, timeout=DEFAULT_TIMEOUT):
+    """스크립트의 임포트 시간을 측정해 결과 dict 반환
+
+    python_exe 는 빌드에 쓰는 인터프리터(가상환경의 python)이며 없으면 현재 인터프리터를 쓴다.
+    MODE_SCRIPT 는 스크립트 전체를 실행하므로 GUI 앱처럼 끝나지 않는 스크립트는 timeout 후 종료된다.
+    """
+    script_path = os.path.abspath(script_path)
+    python_exe = python_exe or sys.executable
+    root = os.path.dirname(script_path)
+    if mode == MODE_SCRIPT:
+        argv = [python_exe, "-X", "importtime", script_path]
+    else:
+        runner = _RUNNER.format(script=script_path, root=root, statements=import_statements(script_path),
+                                marker=_FAILED_MARKER)
+        argv = [python_exe, "-X", "importtime", "-c", runner]
+
+    stderr, returncode, timed_out = _run(argv, root, timeout)
+    roots = parse_importtime(stderr)
+    failures = [line[len(_FAILED_MARKER):].strip() for line in stderr.splitlines()
+                if line.startswith(_FAILED_MARKER)]
+    return {
+        "script_path": script_path,
+        "python": python_exe,
+        "mode": mode,
+        "returncode": returncode,
+        "timed_out": timed_out,
+        "failures": failures,
+        "roots": roots,
+        "total_us": sum(root.cumulative_us for root in roots),
+    }
+
+
+def profile_project(project, venv_dir=None, mode=MODE_IMPORTS, timeout=DEFAULT_TIMEOUT, index=None):
+    """프로젝트 진입 스크립트를 빌드 환경에서 측정 (venv_dir 가 없으면 현재 인터프리터)"""
+    python_exe = build_env.venv_executable(venv_dir, "python") if venv_dir else None
+    if index is None and python_exe:
+        index = module_index.build_index(python_exe)
+    result = profile_imports(project["script_path"], python_exe, mode, timeout)
+    result["packages"] = rank_packages(result["roots"], index, DEFAULT_STORED_ENTRIES)
+    result["modules"] = rank_modules(result["roots"], DEFAULT_STORED_ENTRIES)
+    return result
+
+
+def summarize(result, limit=DEFAULT_STORED_ENTRIES):
+    """프로젝트 파일에 저장할 요약 (트리 대신 순위만)"""
+    return {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": result["python"],
+        "mode": result["mode"],
+        "total_us": result["total_us"],
+        "timed_out": result["timed_out"],
+        "failures": result["failures"],
+        "packages": result["packages"][:limit],
+        "modules": [{"name": name, "self_us": self_us, "cumulative_us": cumulative_us}
+                    for name, self_us, cumulative_us in result["modules"][:limit]],
+        "cumulative": {node.name: node.cumulative_us for root in result["roots"] for node in root.walk()
+                       if node.cumulative_us >= STORED_CUMULATIVE_MIN_US},
+    }
+
+
+def format_summary(summary, limit=15):
+    """로그에 표시할 임포트 시간 순위"""
+    lines = [f"임포트 시간 (총 {summary['total_us'] / 1000:.1f}ms, "
+             f"{'스크립트 전체' if summary['mode'] == MODE_SCRIPT else '임포트 문만'} 실행):\n"]
+    if summary["timed_out"]:
+        lines.append("- 제한 시간이 지나 중간까지만 측정됨\n")
+    for failure in summary["failures"]:
+        lines.append(f"- 임포트 실패: {failure}\n")
+    lines.append("패키지별 자체 시간:\n")
+    for entry in summary["packages"][:limit]:
+        mark = " (표준 라이브러리)" if entry["stdlib"] else ""
+        lines.append(f"- {entry['name']}{mark}: {entry['self_us'] / 1000:.1f}ms, {entry['modules']}개 모듈\n")
+    lines.append("모듈별 자체 시간 (누적):\n")
+    for entry in summary["modules"][:limit]:
+        lines.append(f"- {entry['name']}: {entry['self_us'] / 1000:.1f}ms "
+                     f"({entry['cumulative_us'] / 1000:.1f}ms)\n")
+    return lines
+
+
+def hidden_import_costs(summary, hidden_imports):
+    """숨겨진 임포트별 누적 임포트 시간(ms) 목록 [(모듈, ms 또는 None)], 비싼 순서
+
+    측정에서 누적 1ms 미만이었거나 임포트되지 않은 모듈은 None 이다.
+    """
+    cumulative = (summary or {}).get("cumulative", {})
+    costs = [(module, cumulative[module] / 1000 if module in cumulative else None) for module in hidden_imports]
+    costs.sort(key=lambda item: -(item[1] or 0))
+    return costs
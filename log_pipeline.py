@@ -0,0 +1,184 @@
+"""빌드 로그 대기열과 빌드별 로그 파일 기록/회전 (Tk 비의존)"""
+import os
+import re
+import gzip
+import queue
+import shutil
+import threading
+from datetime import datetime
+
+import user_dirs
+
+
+# 빌드 로그 파일 기본 위치 (사용자별 캐시 폴더)
+DEFAULT_LOG_DIR = user_dirs.cache_path("build_logs")
+
+# 보관 정책: 최근 몇 개는 그대로 두고 나머지는 압축, 개수/용량을 넘으면 오래된 것부터 삭제
+DEFAULT_KEEP_PLAIN = 3
+DEFAULT_MAX_FILES = 50
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+
+# 기록 중인 로그 파일 (회전 시 압축/삭제 대상에서 제외)
+_open_logs = set()
+_rotate_lock = threading.Lock()
+
+
+def _safe_file_name(name):
+    """파일 이름으로 쓸 수 있도록 문자 정리"""
+    return re.sub(r"[^\w.-]+", "_", name).strip("_") or "build"
+
+
+class BuildLog:
+    """빌드 하나의 로그를 실행 중에 파일로 바로 기록"""
+
+    def __init__(self, path):
+        self.path = path
+        self._lock = threading.Lock()
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._file = open(path, 'w', encoding='utf-8', errors='replace', buffering=1)
+        with _rotate_lock:
+            _open_logs.add(os.path.abspath(path))
+
+    def write(self, message, tag=None):
+        """메시지 기록 (어느 스레드에서나 호출 가능)"""
+        with self._lock:
+            if self._file is not None:
+                self._file.write(message)
+
+    def close(self):
+        """파일 닫기 (이후 회전 대상이 됨)"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+        with _rotate_lock:
+            _open_logs.discard(os.path.abspath(self.path))
+
+
+def _log_files(log_dir):
+    """로그 폴더의 로그 파일 목록 (오래된 것부터)"""
+    try:
+        entries = [entry for entry in os.scandir(log_dir)
+                   if entry.is_file() and entry.name.endswith((".log", ".log.gz"))]
+    except OSError:
+        return []
+    return sorted(entries, key=lambda entry: (entry.stat().st_mtime, entry.name))
+
+
+def rotate_logs(log_dir=DEFAULT_LOG_DIR, keep_plain=DEFAULT_KEEP_PLAIN,
+                max_files=DEFAULT_MAX_FILES, max_bytes=DEFAULT_MAX_BYTES):
+    """오래된 로그를 gzip 으로 압축하고 보관 한도를 넘는 로그 삭제"""
+    with _rotate_lock:
+        open_logs = set(_open_logs)
+        plain = [entry for entry in _log_files(log_dir)
+                 if entry.name.endswith(".log") and os.path.abspath(entry.path) not in open_logs]
+        for entry in plain[:max(0, len(plain) - keep_plain)]:
+            try:
+                with open(entry.path, 'rb') as src, gzip.open(entry.path + ".gz", 'wb') as dst:
+                    shutil.copyfileobj(src, dst)
+                shutil.copystat(entry.path, entry.path + ".gz")
+                os.remove(entry.path)
+            except OSError:
+                pass
+
+        entries = [entry for entry in _log_files(log_dir) if os.path.abspath(entry.path) not in open_logs]
+        total_size = sum(entry.stat().st_size for entry in entries)
+        count = len(entries)
+        for entry in entries:
+            if count <= max_files and total_size <= max_bytes:
+                break
+            try:
+                size = entry.stat().st_size
+                os.remove(entry.path)
+            except OSError:
+                continue
+            total_size -= size
+            count -= 1
+
+
+def open_build_log(name, log_dir=DEFAULT_LOG_DIR, rotate_async=False):
+    """새 빌드 로그 파일을 만들고 이전 로그 회전 (rotate_async 면 백그라운드에서)"""
+    timestamp = datetime.now().strftime("%Y%m%d-%H%M%S-%f")
+    build_log = BuildLog(os.path.join(log_dir, f"{timestamp}-{_safe_file_name(name)}.log"))
+    if rotate_async:
+        threading.Thread(target=rotate_logs, args=(log_dir,), daemon=True).start()
+    else:
+        rotate_logs(log_dir)
+    return build_log
+
+
+def copy_log(path, destination):
+    """로그 파일을 (압축되어 있으면 풀어서) 다른 위치로 복사"""
+    if not os.path.exists(path) and os.path.exists(path + ".gz"):
+        path += ".gz"
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, 'rb') as src, open(destination, 'wb') as dst:
+        shutil.copyfileobj(src, dst)
+
+
+class LogQueue:
+    """작업 스레드가 쌓은 로그를 UI 가 프레임 단위로 모아 가져가는 대기열
+
+    빌드 로그 파일이 열려 있으면 모든 메시지를 즉시 파일에도 기록하므로,
+    화면에는 최근 일부만 남겨도 전체 로그는 디스크에 보존된다.
+    """
+
+    def __init__(self, log_dir=DEFAULT_LOG_DIR):
+        self._queue = queue.SimpleQueue()
+        self.log_dir = log_dir
+        self.log_file = None
+        self.last_log_path = None
+
+    def put(self, message, tag=None):
+        """로그 한 건 추가 (어느 스레드에서나 호출 가능, 대기하지 않음)"""
+        log_file = self.log_file
+        if log_file is not None:
+            log_file.write(message, tag)
+        self._queue.put((message, tag))
+
+    def drain(self, limit=None):
+        """쌓인 로그를 최대 limit 건까지 꺼내 [(message, tag)] 로 반환"""
+        items = []
+        while limit is None or len(items) < limit:
+            try:
+                items.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return items
+
+    def clear(self):
+        """표시 대기 중인 로그 비우기"""
+        self.drain()
+
+    def begin_file(self, name):
+        """이후 메시지를 기록할 새 빌드 로그 파일 시작"""
+        self.end_file()
+        try:
+            self.log_file = open_build_log(name, self.log_dir, rotate_async=True)
+        except OSError:
+            self.log_file = None
+            return None
+        self.last_log_path = self.log_file.path
+        return self.log_file.path
+
+    def end_file(self):
+        """현재 빌드 로그 파일 닫기"""
+        log_file, self.log_file = self.log_file, None
+        if log_file is not None:
+            log_file.close()
+
+
+def group_by_tag(items):
+    """연속된 같은 태그의 로그를 묶어 Text.insert 인자 목록으로 변환"""
+    args = []
+    current_tag = None
+    chunk = []
+    for message, tag in items:
+        if chunk and tag != current_tag:
+            args.extend(("".join(chunk), current_tag or ()))
+            chunk = []
+        current_tag = tag
+        chunk.append(message)
+    if chunk:
+        args.extend(("".join(chunk), current_tag or ()))
+    return args
@@ -0,0 +1,236 @@
+"""임포트 모듈 이름과 배포판(pip 패키지) 이름 사이의 색인 (Tk 비의존)"""
+import os
+import sys
+import json
+import hashlib
+import re
+import subprocess
+import tempfile
+import threading
+
+import user_dirs
+
+
+# 모듈 색인 캐시 기본 위치 (사용자별 캐시 폴더, 인터프리터별 파일 하나)
+DEFAULT_CACHE_DIR = user_dirs.cache_path("module_index_cache")
+
+# 색인 형식이 바뀌면 캐시를 무효화하기 위한 버전
+INDEX_VERSION = 1
+
+# 설치되어 있지 않아 메타데이터로 알 수 없을 때 사용하는 대표적인 임포트명 -> 배포판 이름
+KNOWN_DISTRIBUTIONS = {
+    "cv2": "opencv-python",
+    "PIL": "Pillow",
+    "yaml": "PyYAML",
+    "sklearn": "scikit-learn",
+    "skimage": "scikit-image",
+    "bs4": "beautifulsoup4",
+    "dateutil": "python-dateutil",
+    "dotenv": "python-dotenv",
+    "docx": "python-docx",
+    "pptx": "python-pptx",
+    "serial": "pyserial",
+    "usb": "pyusb",
+    "Crypto": "pycryptodome",
+    "OpenSSL": "pyOpenSSL",
+    "jwt": "PyJWT",
+    "fitz": "PyMuPDF",
+    "magic": "python-magic",
+    "attr": "attrs",
+    "wx": "wxPython",
+    "gi": "PyGObject",
+    "zmq": "pyzmq",
+    "MySQLdb": "mysqlclient",
+    "psycopg2": "psycopg2-binary",
+    "win32api": "pywin32",
+    "win32con": "pywin32",
+    "win32com": "pywin32",
+    "win32gui": "pywin32",
+    "pythoncom": "pywin32",
+    "pywintypes": "pywin32",
+    "win32ctypes": "pywin32-ctypes",
+    "google": "protobuf",
+    "telegram": "python-telegram-bot",
+    "Levenshtein": "python-Levenshtein",
+    "_pyinstaller_hooks_contrib": "pyinstaller-hooks-contrib",
+}
+
+# 대상 인터프리터 안에서 실행해 표준 라이브러리와 배포판 정보를 JSON 으로 출력하는 스크립트
+_INDEX_SCRIPT = r'''
+import sys, os, json, sysconfig
+from importlib import metadata
+
+def top_levels(dist):
+    names = set()
+    text = dist.read_text("top_level.txt")
+    if text:
+        names.update(line.strip().replace("/", ".").split(".")[0] for line in text.splitlines() if line.strip())
+    if not names:
+        for path in dist.files or []:
+            parts = path.parts
+            if not parts or parts[0] in ("..", "__pycache__") or parts[0].endswith((".dist-info", ".egg-info", ".data")):
+                continue
+            if len(parts) == 1:
+                stem, ext = os.path.splitext(parts[0])
+                if ext in (".py", ".pyd", ".so") or ".cpython-" in parts[0] or ".abi3" in parts[0]:
+                    names.add(stem.split(".")[0])
+            elif parts[0].isidentifier():
+                names.add(parts[0])
+    return names
+
+distributions = {}
+for dist in metadata.distributions():
+    name = dist.metadata["Name"]
+    if name:
+        distributions.setdefault(name, set()).update(top_levels(dist))
+
+if hasattr(metadata, "packages_distributions"):
+    for module, dists in metadata.packages_distributions().items():
+        for name in dists:
+            if module.isidentifier():
+                distributions.setdefault(name, set()).add(module)
+
+stdlib = set(sys.builtin_module_names) | set(getattr(sys, "stdlib_module_names", ()))
+if not getattr(sys, "stdlib_module_names", None):
+    stdlib_dir = sysconfig.get_paths()["stdlib"]
+    for entry in os.listdir(stdlib_dir):
+        stem, ext = os.path.splitext(entry)
+        if entry != "site-packages" and (ext == ".py" or os.path.isdir(os.path.join(stdlib_dir, entry))):
+            stdlib.add(stem)
+    dynload = os.path.join(stdlib_dir, "lib-dynload")
+    if os.path.isdir(dynload):
+        stdlib.update(entry.split(".")[0] for entry in os.listdir(dynload))
+
+site_dirs = [p for p in sys.path if p and os.path.isdir(p) and ("site-packages" in p or "dist-packages" in p)]
+print(json.dumps({
+    "version": sys.version,
+    "stdlib": sorted(stdlib),
+    "distributions": {name: sorted(mods) for name, mods in distributions.items()},
+    "site_dirs": site_dirs,
+}))
+'''
+
+
+def canonical_name(name):
+    """PEP 503 방식으로 배포판 이름 정규화"""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def _path_signature(paths):
+    """경로들의 수정 시각 (패키지 설치/삭제 시 바뀜)"""
+    signature = {}
+    for path in paths:
+        try:
+            signature[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            signature[path] = None
+    return signature
+
+
+class ModuleIndex:
+    """임포트명 -> 배포판, 배포판 -> 임포트 가능한 모듈을 O(1) 로 찾는 색인"""
+
+    def __init__(self, data):
+        self.python_version = data.get("version", "")
+        self.stdlib = frozenset(data.get("stdlib", ()))
+        self.module_to_distribution = {}
+        self.distribution_to_modules = {}
+        self.distribution_names = {}
+
+        for dist_name, modules in data.get("distributions", {}).items():
+            key = canonical_name(dist_name)
+            self.distribution_names[key] = dist_name
+            self.distribution_to_modules.setdefault(key, set()).update(modules)
+            for module in modules:
+                self.module_to_distribution.setdefault(module, dist_name)
+
+    def is_stdlib(self, module):
+        """표준 라이브러리 모듈인지 확인"""
+        return module.split('.')[0] in self.stdlib
+
+    def distribution_for(self, module):
+        """임포트명에 해당하는 설치된 배포판 이름 (없으면 None)"""
+        return self.module_to_distribution.get(module.split('.')[0])
+
+    def install_name(self, module):
+        """임포트명을 설치할 pip 패키지 이름으로 변환 (표준 라이브러리면 None)"""
+        top_level = module.split('.')[0]
+        if top_level in self.stdlib:
+            return None
+        return (self.module_to_distribution.get(top_level)
+                or KNOWN_DISTRIBUTIONS.get(top_level)
+                or top_level)
+
+    def modules_for(self, distribution):
+        """배포판이 제공하는 임포트 가능한 최상위 모듈 목록"""
+        return sorted(self.distribution_to_modules.get(canonical_name(distribution), ()))
+
+    def distributions(self):
+        """설치된 배포판 이름 목록"""
+        return sorted(self.distribution_names.values(), key=str.lower)
+
+
+def _run_index_script(python_executable):
+    """대상 인터프리터에서 색인 스크립트를 실행해 원본 데이터 반환"""
+    process = subprocess.run(
+        [python_executable, "-c", _INDEX_SCRIPT],
+        cwd=tempfile.gettempdir(),  # 현재 폴더의 같은 이름 모듈이 섞이지 않도록
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+    if process.returncode != 0:
+        raise RuntimeError(f"모듈 색인 생성 실패: {process.stderr.strip()}")
+    return json.loads(process.stdout)
+
+
+def _cache_path(python_executable, cache_dir):
+    """인터프리터별 색인 캐시 파일 경로"""
+    key = os.path.normcase(os.path.abspath(python_executable))
+    return os.path.join(cache_dir, hashlib.sha256(key.encode("utf-8")).hexdigest()[:16] + ".json")
+
+
+def build_index(python_executable=None, cache_dir=DEFAULT_CACHE_DIR, use_cache=True):
+    """인터프리터의 모듈 색인 생성 (인터프리터와 site-packages 가 그대로면 캐시 사용)"""
+    python_executable = python_executable or sys.executable
+    cache_path = _cache_path(python_executable, cache_dir)
+
+    if use_cache and os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            data = cached["data"]
+            if (cached.get("index_version") == INDEX_VERSION
+                    and cached.get("signature") == _path_signature([python_executable] + data["site_dirs"])):
+                return ModuleIndex(data)
+        except Exception:
+            pass
+
+    data = _run_index_script(python_executable)
+    if use_cache:
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            tmp_path = cache_path + ".tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "index_version": INDEX_VERSION,
+                    "signature": _path_signature([python_executable] + data["site_dirs"]),
+                    "data": data,
+                }, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
+    return ModuleIndex(data)
+
+
+_host_index = None
+_host_index_lock = threading.Lock()
+
+
+def host_index():
+    """현재 인터프리터의 모듈 색인 (프로세스 안에서 한 번만 생성)"""
+    global _host_index
+    with _host_index_lock:
+        if _host_index is None:
+            _host_index = build_index()
+        return _host_index
@@ -0,0 +1,430 @@
+"""PyInstaller 프로젝트 파일(.pyinstaller) 읽기/쓰기와 명령어 구성 (Tk 비의존)
+
+프로젝트 항목은 FIELDS 표 하나에 정의되고, 기본값(DEFAULT_PROJECT)과 Project 의 슬롯, 값 검증이
+모두 이 표에서 만들어진다. 모듈 사이에서는 dict 로 주고받으며, 값 검증과 비교가 필요한 곳에서는
+같은 항목을 슬롯에 담는 Project 를 쓴다. 명령어는 셸 없이 subprocess 에 넘기는 인자 목록(argv)으로 만든다.
+"""
+import os
+import copy
+import json
+import shlex
+import subprocess
+
+import variant_matrix
+
+
+# 값을 검사하는 항목의 선택지
+BUILD_TYPES = ("--onedir", "--onefile")
+CONSOLE_OPTIONS = ("--console", "--noconsole", "--windowed", "-w")
+LOG_LEVELS = ("TRACE", "DEBUG", "INFO", "WARN", "DEPRECATION", "ERROR", "CRITICAL", "FATAL")
+OPTIMIZE_LEVELS = (0, 1, 2)
+
+# spec_overrides 로 덮어쓸 수 있는 spec 항목
+OVERRIDE_SECTIONS = ("Analysis", "PYZ", "EXE", "COLLECT")
+
+# 프로젝트 항목 표 (이름, 기본값, 형식, 선택지) - GUI의 save_project 와 같은 키
+# DEFAULT_PROJECT, Project 의 슬롯, 값 검증이 모두 이 표에서 만들어진다.
+FIELDS = (
+    ("script_path", "", "str", None),
+    ("extra_scripts", [], "list", None),
+    ("app_name", "", "str", None),
+    ("output_dir", "", "str", None),
+    ("work_dir", "", "str", None),
+    ("build_type", "--onedir", "str", BUILD_TYPES),
+    ("console_option", "--console", "str", CONSOLE_OPTIONS),
+    ("clean_build", False, "bool", None),
+    ("managed_workpath", True, "bool", None),
+    ("no_confirm", False, "bool", None),
+    ("log_level", "INFO", "str", LOG_LEVELS),
+    ("use_upx", True, "bool", None),
+    ("upx_dir", "", "str", None),
+    ("noupx", False, "bool", None),
+    ("strip", False, "bool", None),
+    ("ascii", False, "bool", None),
+    ("uac_admin", False, "bool", None),
+    ("uac_uiaccess", False, "bool", None),
+    ("win_private_assemblies", False, "bool", None),
+    ("win_no_prefer_redirects", False, "bool", None),
+    ("data_files", [], "list", None),
+    ("binary_files", [], "list", None),
+    ("hidden_imports", [], "list", None),
+    ("exclude_modules", [], "list", None),
+    ("hooks_dirs", [], "list", None),
+    ("runtime_hooks", [], "list", None),
+    ("icon_file", "", "str", None),
+    ("version_file", "", "str", None),
+    ("manifest_file", "", "str", None),
+    ("resources", [], "list", None),
+    ("file_version", "1.0.0.0", "str", None),
+    ("product_version", "1.0.0.0", "str", None),
+    ("company_name", "", "str", None),
+    ("product_name", "", "str", None),
+    ("wheelhouse", "", "str", None),
+    ("import_profile", None, "dict_or_none", None),
+    ("use_spec", False, "bool", None),
+    ("upx_exclude", [], "list", None),
+    ("toc_excludes", [], "list", None),
+    ("noarchive", False, "bool", None),
+    ("optimize", 0, "int", OPTIMIZE_LEVELS),
+    ("spec_overrides", {}, "dict", None),
+    ("variants", [], "list", None),
+)
+
+# 프로젝트 파일의 항목과 기본값
+DEFAULT_PROJECT = {name: default for name, default, _, _ in FIELDS}
+
+# 형식별 (표시 이름, 검사 함수)
+_KIND_CHECKS = {
+    "str": ("문자열", lambda value: isinstance(value, str)),
+    "bool": ("참/거짓", lambda value: isinstance(value, bool)),
+    "int": ("정수", lambda value: isinstance(value, int) and not isinstance(value, bool)),
+    "list": ("문자열 목록", lambda value: isinstance(value, list) and all(isinstance(item, str) for item in value)),
+    "dict": ("사전", lambda value: isinstance(value, dict)),
+    "dict_or_none": ("사전 또는 null", lambda value: value is None or isinstance(value, dict)),
+}
+_FIELD_KINDS = {name: kind for name, _, kind, _ in FIELDS}
+_FIELD_CHOICES = {name: choices for name, _, _, choices in FIELDS if choices is not None}
+
+
+def new_project(**values):
+    """기본값으로 채운 프로젝트 설정(Project) 생성 (모르는 항목이면 ValueError)"""
+    return Project(**values)
+
+
+def load_project(file_path):
+    """프로젝트 파일 불러오기 (없는 항목은 기본값, 모르는 항목은 무시)"""
+    return Project.load(file_path)
+
+
+def save_project(file_path, project_data):
+    """프로젝트 파일 저장 (Project 또는 프로젝트 dict)"""
+    if isinstance(project_data, Project):
+        project_data = project_data.to_dict()
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(project_data, f, indent=2, ensure_ascii=False)
+
+
+def _copy_value(value):
+    """목록/사전 값은 중첩된 값까지 복사해 설정끼리 공유하지 않도록 (spec_overrides 는 사전의 사전)"""
+    return copy.deepcopy(value) if isinstance(value, (list, dict)) else value
+
+
+def _type_error(key, value):
+    """항목의 형식이 항목 표와 다르면 오류 메시지 (맞으면 None)"""
+    expected, check = _KIND_CHECKS[_FIELD_KINDS[key]]
+    return None if check(value) else f"{key}: {expected} 값이어야 합니다 ({value!r})"
+
+
+class Project:
+    """프로젝트 설정 (항목은 FIELDS 표와 같고 슬롯에 저장)
+
+    new_project/load_project 가 돌려주는 빌드 파이프라인 공용 설정 형식이다. project["키"] 로도
+    읽고 쓸 수 있고 dict(project) 로 프로젝트 dict 를 만들 수 있다.
+    errors()/validate() 로 값의 형식과 선택지를 검사하고 argv() 로 실행할 명령을 만든다.
+    """
+
+    __slots__ = tuple(DEFAULT_PROJECT)
+
+    def __init__(self, **values):
+        unknown = sorted(set(values) - set(DEFAULT_PROJECT))
+        if unknown:
+            raise ValueError(f"알 수 없는 프로젝트 항목입니다: {', '.join(unknown)}")
+        for key, default in DEFAULT_PROJECT.items():
+            setattr(self, key, _copy_value(values[key] if key in values else default))
+
+    @classmethod
+    def from_dict(cls, data):
+        """프로젝트 dict 로 생성 (모르는 항목은 무시)"""
+        return cls(**{key: value for key, value in data.items() if key in DEFAULT_PROJECT})
+
+    @classmethod
+    def load(cls, file_path):
+        """프로젝트 파일 불러오기 (없는 항목은 기본값, 모르는 항목은 무시)"""
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return cls.from_dict(json.load(f))
+
+    def save(self, file_path):
+        """프로젝트 파일 저장"""
+        save_project(file_path, self.to_dict())
+
+    def to_dict(self):
+        """프로젝트 dict (프로젝트 파일 형식)"""
+        return {key: _copy_value(getattr(self, key)) for key in self.__slots__}
+
+    def copy(self, **changes):
+        """일부 항목만 바꾼 새 설정"""
+        values = self.to_dict()
+        values.update(changes)
+        return Project(**values)
+
+    def diff(self, other):
+        """다른 설정과 값이 다른 항목 {항목: (이 설정의 값, 다른 설정의 값)}"""
+        return {key: (getattr(self, key), other[key]) for key in self.__slots__ if getattr(self, key) != other[key]}
+
+    def errors(self):
+        """값 검증 오류 메시지 목록 (문제가 없으면 빈 목록)"""
+        errors = [error for error in (_type_error(key, getattr(self, key)) for key in self.__slots__) if error]
+        if errors:
+            return errors
+        if not self.script_path:
+            errors.append("script_path: Python 파일을 지정해야 합니다")
+        else:
+            # 진입 스크립트마다 실행 파일을 만드므로 실행 파일 이름이 겹치면 빌드할 수 없음
+            names = [app_name_of(self)] + [entry_name_of(path) for path in entry_scripts(self)[1:]]
+            for name in sorted({name for name in names if names.count(name) > 1}):
+                errors.append(f"extra_scripts: 진입 스크립트의 실행 파일 이름이 겹칩니다 ({name})")
+        for key, choices in _FIELD_CHOICES.items():
+            if getattr(self, key) not in choices:
+                errors.append(f"{key}: {', '.join(map(str, choices))} 중 하나여야 합니다 ({getattr(self, key)!r})")
+        for name in self.variants:
+            try:
+                variant_matrix.parse_variant(name)
+            except ValueError as e:
+                errors.append(f"variants: {str(e)}")
+        for section, values in self.spec_overrides.items():
+            if section not in OVERRIDE_SECTIONS:
+                errors.append(f"spec_overrides: {', '.join(OVERRIDE_SECTIONS)} 중 하나여야 합니다 ({section!r})")
+            elif not isinstance(values, dict) or not all(isinstance(key, str) and key.isidentifier()
+                                                         for key in values):
+                errors.append(f"spec_overrides.{section}: 키워드 인자 이름을 키로 하는 사전이어야 합니다 ({values!r})")
+        for key in self.__slots__:
+            value = getattr(self, key)
+            values = value if isinstance(value, list) else [value]
+            if any(isinstance(item, str) and "\0" in item for item in values):
+                errors.append(f"{key}: 널 문자를 포함할 수 없습니다")
+        return errors
+
+    def validate(self):
+        """값을 검사해 문제가 있으면 모든 오류를 담은 ValueError, 없으면 자신을 반환"""
+        errors = self.errors()
+        if errors:
+            raise ValueError("\n".join(errors))
+        return self
+
+    def argv(self, pyinstaller=None):
+        """셸 없이 실행할 PyInstaller 인자 목록 (pyinstaller 로 실행 파일 부분을 바꿀 수 있음)"""
+        command = build_command(self)
+        if pyinstaller:
+            command[0:1] = list(pyinstaller)
+        return command
+
+    def __eq__(self, other):
+        if not isinstance(other, Project):
+            return NotImplemented
+        return all(getattr(self, key) == getattr(other, key) for key in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self):
+        changed = ", ".join(f"{key}={getattr(self, key)!r}" for key in self.__slots__
+                            if getattr(self, key) != DEFAULT_PROJECT[key])
+        return f"Project({changed})"
+
+    # dict 와 같은 접근 (프로젝트 dict 를 받는 함수와 호환)
+    def keys(self):
+        return list(self.__slots__)
+
+    def __iter__(self):
+        return iter(self.__slots__)
+
+    def __len__(self):
+        return len(self.__slots__)
+
+    def __contains__(self, key):
+        return key in DEFAULT_PROJECT
+
+    def __getitem__(self, key):
+        if key not in DEFAULT_PROJECT:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in DEFAULT_PROJECT:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def get(self, key, default=None):
+        return getattr(self, key) if key in DEFAULT_PROJECT else default
+
+
+def app_name_of(project):
+    """앱 이름 (지정하지 않으면 스크립트 파일 이름)"""
+    return project["app_name"] or os.path.splitext(os.path.basename(project["script_path"]))[0]
+
+
+def entry_scripts(project):
+    """진입 스크립트 목록 (주 스크립트와 같은 번들에 들어가는 추가 진입 스크립트)"""
+    return [project["script_path"]] + [path for path in project.get("extra_scripts", []) if path]
+
+
+def entry_name_of(script_path):
+    """추가 진입 스크립트의 실행 파일 이름 (스크립트 파일 이름)"""
+    return os.path.splitext(os.path.basename(script_path))[0]
+
+
+def uses_spec(project):
+    """spec 파일로 빌드하는지 (추가 진입 스크립트나 빌드 변형이 있으면 명령행으로 표현할 수 없어 항상 spec 빌드)"""
+    return bool(project.get("use_spec") or entry_scripts(project)[1:] or project.get("variants"))
+
+
+def spec_path_of(project, base_dir=None):
+    """spec 빌드에 쓰는 spec 파일 경로 (작업 폴더 안, --clean 으로 지워지지 않는 위치)
+
+    base_dir 가 없으면 PyInstaller 를 실행하는 폴더 기준의 경로를 그대로 반환한다.
+    """
+    work_path = project["work_dir"] or "build"
+    if base_dir:
+        work_path = os.path.join(base_dir, work_path)
+    return os.path.join(work_path, app_name_of(project) + ".spec")
+
+
+def spec_build_command(project):
+    """spec 파일로 빌드하는 PyInstaller 명령어 (spec 과 함께 쓸 수 있는 옵션만)"""
+    command = ["pyinstaller"]
+    if project["output_dir"]:
+        command.append(f"--distpath={project['output_dir']}")
+    if project["work_dir"]:
+        command.append(f"--workpath={project['work_dir']}")
+    if project["clean_build"]:
+        command.append("--clean")
+    if project["no_confirm"]:
+        command.append("--noconfirm")
+    if project["log_level"] != "INFO":
+        command.append(f"--log-level={project['log_level']}")
+    if project["use_upx"] and not project["noupx"] and project["upx_dir"]:
+        command.append(f"--upx-dir={project['upx_dir']}")
+    command.append(spec_path_of(project))
+    return command
+
+
+def build_command(project):
+    """프로젝트 설정으로 PyInstaller 명령어의 인자 목록 구성 (셸 없이 subprocess 에 그대로 넘김)
+
+    값은 인용하지 않으며, 화면에 보여 줄 때는 command_line 으로 문자열을 만든다.
+    use_spec 이 켜져 있거나 추가 진입 스크립트가 있으면 작업 폴더의 spec 파일로 빌드하는
+    명령어를 만든다 (spec 파일은 spec_builder.ensure_spec 으로 먼저 생성).
+    """
+    if uses_spec(project):
+        return spec_build_command(project)
+
+    # 기본 명령어
+    command = ["pyinstaller"]
+
+    # 기본 옵션
+    if project["build_type"]:
+        command.append(project["build_type"])
+
+    if project["console_option"]:
+        command.append(project["console_option"])
+
+    # 이름 옵션
+    if project["app_name"]:
+        command.append(f"--name={project['app_name']}")
+
+    # 출력 디렉토리
+    if project["output_dir"]:
+        command.append(f"--distpath={project['output_dir']}")
+
+    # 작업 디렉토리
+    if project["work_dir"]:
+        command.append(f"--workpath={project['work_dir']}")
+
+    # 일반 옵션
+    if project["clean_build"]:
+        command.append("--clean")
+
+    if project["no_confirm"]:
+        command.append("--noconfirm")
+
+    if project["log_level"] != "INFO":
+        command.append(f"--log-level={project['log_level']}")
+
+    # UPX 옵션
+    if not project["use_upx"] or project["noupx"]:
+        command.append("--noupx")
+    elif project["upx_dir"]:
+        command.append(f"--upx-dir={project['upx_dir']}")
+
+    # 고급 옵션
+    if project["strip"]:
+        command.append("--strip")
+
+    if project["ascii"]:
+        command.append("--ascii")
+
+    if project["uac_admin"]:
+        command.append("--uac-admin")
+
+    if project["uac_uiaccess"]:
+        command.append("--uac-uiaccess")
+
+    if project["win_private_assemblies"]:
+        command.append("--win-private-assemblies")
+
+    if project["win_no_prefer_redirects"]:
+        command.append("--win-no-prefer-redirects")
+
+    # 데이터 파일
+    for data_file in project["data_files"]:
+        command.append(f"--add-data={data_file}")
+
+    # 바이너리 파일
+    for binary_file in project["binary_files"]:
+        command.append(f"--add-binary={binary_file}")
+
+    # 숨겨진 임포트
+    for hidden_import in project["hidden_imports"]:
+        command.append(f"--hidden-import={hidden_import}")
+
+    # 제외 모듈
+    for exclude_module in project["exclude_modules"]:
+        command.append(f"--exclude-module={exclude_module}")
+
+    # 훅 디렉토리
+    for hooks_dir in project["hooks_dirs"]:
+        command.append(f"--additional-hooks-dir={hooks_dir}")
+
+    # 런타임 훅
+    for runtime_hook in project["runtime_hooks"]:
+        command.append(f"--runtime-hook={runtime_hook}")
+
+    # 플랫폼 특화 옵션
+    if project["icon_file"]:
+        command.append(f"--icon={project['icon_file']}")
+
+    if project["version_file"]:
+        command.append(f"--version-file={project['version_file']}")
+
+    if project["manifest_file"]:
+        command.append(f"--manifest={project['manifest_file']}")
+
+    # 리소스
+    for resource in project["resources"]:
+        command.append(f"--resource={resource}")
+
+    # 복잡한 패키지에 대한 collect-all 옵션 추가
+    if "pandas" in project["hidden_imports"]:
+        command.append("--collect-all=pandas")
+    if "numpy" in project["hidden_imports"]:
+        command.append("--collect-all=numpy")
+
+    # 스크립트 경로 추가
+    command.append(project["script_path"])
+
+    return command
+
+
+def command_line(argv):
+    """인자 목록을 화면 표시/복사용 명령어 문자열로 (플랫폼의 셸 규칙으로 인용)"""
+    return subprocess.list2cmdline(argv) if os.name == "nt" else shlex.join(argv)
+
+
+def output_path(project, base_dir=None):
+    """빌드 결과물 경로 (--onefile 이면 실행 파일, --onedir 이면 앱 폴더, 빌드 변형이 있으면 출력 폴더)"""
+    dist_path = os.path.join(base_dir or os.getcwd(), project["output_dir"] or "dist")
+    if project.get("variants"):
+        return dist_path
+    app_name = app_name_of(project)
+    if project["build_type"] == "--onefile":
+        return os.path.join(dist_path, app_name + (".exe" if os.name == "nt" else ""))
+    return os.path.join(dist_path, app_name)
@@ -2,16 +2,38 @@ import os
 import sys
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
-import subprocess
 import threading
+import multiprocessing
 import json
-import ast
-import shutil
 from datetime import datetime
 import time
 
+import build_env
+import bundle_analysis
+import build_history
+import build_runner
+import build_phases
+import build_state
+import exclude_advisor
+import import_analysis
+import import_profiler
+import log_pipeline
+import module_index
+import project_model
+import spec_builder
+import startup_profiler
+import variant_matrix
+import workpath
+
 
 class PyInstallerGUI:
+    # 경로 입력이 멈춘 뒤 분석을 시작하기까지의 대기 시간 (ms)
+    ANALYSIS_DEBOUNCE_MS = 400
+
+    # 로그 창에 반영하는 주기 (ms) 와 로그 창에 남겨둘 최대 줄 수
+    LOG_FLUSH_MS = 50
+    LOG_MAX_LINES = 5000
+
     def __init__(self, root):
         self.root = root
         self.root.title("PyInstaller GUI - 종합 도구")
@@ -24,6 +46,33 @@ class PyInstallerGUI:
         self.config_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pyinstaller_gui_config.json")
         self.recent_projects = []
 
+        # 안전 모드 빌드에 사용할 가상환경 (지문 기반 캐시)
+        self.venv_cache = build_env.VenvCache()
+        self.venv_dir = None
+
+        # 프로젝트별 빌드 기록
+        self.build_history = build_history.BuildHistory()
+
+        # 마지막 빌드 결과물의 구성 분석 트리
+        self.bundle_tree = None
+
+        # 백그라운드 환경 준비 작업
+        self.env_job = None
+        self.env_cancel_event = None
+
+        # PyInstaller 빌드 실행 중 여부 (중복 실행 방지)와 빌드 취소 이벤트
+        self.build_running = False
+        self.build_cancel_event = None
+
+        # 작업 스레드 로그 대기열과 마지막으로 보고된 빌드 진행 상황
+        self.log_queue = log_pipeline.LogQueue()
+        self.pending_build_progress = None
+
+        # 경로 입력 시 디바운스된 백그라운드 분석 상태
+        self.analysis_after_id = None
+        self.analysis_cancel_event = None
+        self.analysis_generation = 0
+
         # 메인 노트북 (탭 컨테이너) 생성
         self.notebook = ttk.Notebook(root)
         self.notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
@@ -42,6 +91,9 @@ class PyInstallerGUI:
         # 설정 로드
         self.load_config()
 
+        # 로그 대기열을 일정 주기로 로그 창에 반영
+        self.root.after(self.LOG_FLUSH_MS, self.flush_log_queue)
+
     def create_basic_tab(self):
         """기본 설정 탭 생성"""
         self.tab_basic = ttk.Frame(self.notebook)
@@ -86,6 +138,17 @@ class PyInstallerGUI:
         browse_btn = ttk.Button(file_frame, text="찾아보기", command=self.browse_script)
         browse_btn.grid(row=0, column=2, padx=5, pady=5)
 
+        # 같은 번들에 넣을 추가 진입 스크립트 (하나의 분석과 런타임 폴더를 공유, spec 빌드)
+        ttk.Label(file_frame, text="추가 진입 스크립트:").grid(row=1, column=0, sticky=tk.NW, padx=5, pady=5)
+        self.extra_scripts = []
+        self.extra_script_listbox = tk.Listbox(file_frame, width=50, height=3)
+        self.extra_script_listbox.grid(row=1, column=1, padx=5, pady=5, sticky=tk.W + tk.E)
+
+        extra_btn_frame = ttk.Frame(file_frame)
+        extra_btn_frame.grid(row=1, column=2, padx=5, pady=5, sticky=tk.N)
+        ttk.Button(extra_btn_frame, text="추가", command=self.add_extra_script).pack(fill=tk.X)
+        ttk.Button(extra_btn_frame, text="제거", command=self.remove_extra_script).pack(fill=tk.X, pady=(5, 0))
+
         # 출력 설정 프레임
         output_frame = ttk.LabelFrame(scrollable_frame, text="출력 설정")
         output_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -131,18 +194,37 @@ class PyInstallerGUI:
         ttk.Radiobutton(console_frame, text="콘솔 숨김 (--noconsole)", variable=self.console_option,
                         value="--noconsole").grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
 
+        # 빌드 변형 매트릭스 프레임 (선택하면 위의 빌드 타입/콘솔 대신 한 번의 분석으로 모든 변형을 빌드)
+        variant_frame = ttk.LabelFrame(scrollable_frame, text="빌드 변형 매트릭스 (출력 폴더/<변형> 에 생성)")
+        variant_frame.pack(fill=tk.X, padx=10, pady=5)
+
+        self.variant_vars = {}
+        for i, name in enumerate(variant_matrix.ALL_VARIANTS):
+            self.variant_vars[name] = tk.BooleanVar(value=False)
+            ttk.Checkbutton(variant_frame, text=name, variable=self.variant_vars[name]).grid(
+                row=i % 4, column=i // 4, sticky=tk.W, padx=5, pady=2)
+
         # 일반 옵션 프레임
         general_frame = ttk.LabelFrame(scrollable_frame, text="일반 옵션")
         general_frame.pack(fill=tk.X, padx=10, pady=5)
 
         self.clean_build = tk.BooleanVar(value=False)
-        ttk.Checkbutton(general_frame, text="빌드 전 캐시 정리 (--clean)",
-                        variable=self.clean_build).grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
+        self.clean_check = ttk.Checkbutton(general_frame, text="빌드 전 캐시 정리 (--clean)",
+                                           variable=self.clean_build)
+        self.clean_check.grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
 
         self.no_confirm = tk.BooleanVar(value=False)
         ttk.Checkbutton(general_frame, text="확인 없이 덮어쓰기 (--noconfirm)",
                         variable=self.no_confirm).grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
 
+        # 작업 폴더를 프로젝트마다 고정하고 빌드 환경이 바뀔 때만 --clean 적용
+        self.managed_workpath = tk.BooleanVar(value=True)
+        ttk.Checkbutton(general_frame, text="작업 폴더 자동 관리 (환경이 바뀔 때만 --clean)",
+                        variable=self.managed_workpath,
+                        command=self.update_clean_check).grid(row=1, column=0, columnspan=2, sticky=tk.W,
+                                                              padx=5, pady=5)
+        self.update_clean_check()
+
         # 로그 레벨 프레임
         log_frame = ttk.LabelFrame(scrollable_frame, text="로그 레벨")
         log_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -153,12 +235,53 @@ class PyInstallerGUI:
         log_combo = ttk.Combobox(log_frame, textvariable=self.log_level, values=log_levels, state="readonly")
         log_combo.grid(row=0, column=1, sticky=tk.W, padx=5, pady=5)
 
+    def update_clean_check(self):
+        """작업 폴더 자동 관리 중에는 --clean 을 자동으로 결정하므로 수동 선택 비활성화"""
+        self.clean_check.config(state="disabled" if self.managed_workpath.get() else "normal")
+
     def on_script_path_change(self, *args):
-        """파일 경로가 변경될 때 호출되는 콜백"""
+        """파일 경로가 변경될 때 호출되는 콜백 (입력이 멈출 때까지 분석을 미룸)"""
+        if self.analysis_after_id is not None:
+            self.root.after_cancel(self.analysis_after_id)
+        self.analysis_after_id = self.root.after(self.ANALYSIS_DEBOUNCE_MS, self.start_path_analysis)
+
+    def cancel_path_analysis(self):
+        """예약되었거나 진행 중인 경로 분석 취소"""
+        if self.analysis_after_id is not None:
+            self.root.after_cancel(self.analysis_after_id)
+            self.analysis_after_id = None
+        if self.analysis_cancel_event is not None:
+            self.analysis_cancel_event.set()
+            self.analysis_cancel_event = None
+        # 이미 끝난 분석 결과도 반영되지 않도록 세대 번호 증가
+        self.analysis_generation += 1
+
+    def start_path_analysis(self):
+        """현재 경로의 파일을 백그라운드 스레드에서 분석"""
+        self.analysis_after_id = None
         file_path = self.script_path.get()
-        if file_path and os.path.isfile(file_path) and file_path.endswith('.py'):
+        if not (file_path and os.path.isfile(file_path) and file_path.endswith('.py')):
             # 경로가 유효한 Python 파일인 경우에만 분석 실행
-            self.analyze_and_add_imports(file_path)
+            return
+
+        # 이전 분석은 취소하고 새 세대로 시작
+        self.cancel_path_analysis()
+        generation = self.analysis_generation
+        cancel_event = threading.Event()
+        self.analysis_cancel_event = cancel_event
+        self.status_bar.config(text="파일 분석 중...")
+
+        def worker():
+            try:
+                graph = import_analysis.analyze_project(file_path, cancel_event=cancel_event)
+                error = None
+            except import_analysis.AnalysisCancelled:
+                return
+            except Exception as e:
+                graph, error = None, e
+            self.root.after(0, self.analyze_and_add_imports, file_path, generation, graph, error)
+
+        threading.Thread(target=worker, daemon=True).start()
 
     def create_advanced_tab(self):
         """고급 설정 탭 생성"""
@@ -257,6 +380,66 @@ class PyInstallerGUI:
         ttk.Checkbutton(adv_options_frame, text="No Prefer Redirects (--win-no-prefer-redirects)",
                         variable=self.win_no_prefer_redirects).grid(row=3, column=0, sticky=tk.W, padx=5, pady=5)
 
+        # spec 파일 빌드 프레임 (명령행 옵션으로 표현할 수 없는 설정)
+        spec_frame = ttk.LabelFrame(scrollable_frame, text="spec 파일 빌드")
+        spec_frame.pack(fill=tk.X, padx=10, pady=5)
+
+        self.use_spec = tk.BooleanVar(value=False)
+        ttk.Checkbutton(spec_frame, text="spec 파일을 생성해 빌드 (옵션이 바뀔 때만 다시 생성)",
+                        variable=self.use_spec).grid(row=0, column=0, columnspan=2, sticky=tk.W, padx=5, pady=5)
+
+        self.noarchive = tk.BooleanVar(value=False)
+        ttk.Checkbutton(spec_frame, text="모듈을 PYZ 아카이브에 묶지 않음 (noarchive)",
+                        variable=self.noarchive).grid(row=1, column=0, columnspan=2, sticky=tk.W, padx=5, pady=5)
+
+        ttk.Label(spec_frame, text="바이트코드 최적화 (optimize):").grid(row=2, column=0, sticky=tk.W, padx=5, pady=5)
+        self.optimize = tk.StringVar(value="0")
+        ttk.Combobox(spec_frame, textvariable=self.optimize, values=["0", "1", "2"], state="readonly",
+                     width=5).grid(row=2, column=1, sticky=tk.W, padx=5, pady=5)
+
+        ttk.Label(spec_frame, text="UPX 제외 파일 (쉼표로 구분):").grid(row=3, column=0, sticky=tk.W, padx=5, pady=5)
+        self.upx_exclude = tk.StringVar()
+        ttk.Entry(spec_frame, textvariable=self.upx_exclude, width=50).grid(row=3, column=1, padx=5, pady=5)
+
+        ttk.Label(spec_frame, text="결과물에서 뺄 파일 패턴 (쉼표로 구분):").grid(row=4, column=0, sticky=tk.W, padx=5, pady=5)
+        self.toc_excludes = tk.StringVar()
+        ttk.Entry(spec_frame, textvariable=self.toc_excludes, width=50).grid(row=4, column=1, padx=5, pady=5)
+
+        # 손으로 조정한 spec 키워드 인자 (프로젝트 파일의 spec_overrides 에서 편집)
+        self.spec_overrides = {}
+        self.spec_overrides_label = ttk.Label(spec_frame, text="")
+        self.spec_overrides_label.grid(row=5, column=0, columnspan=2, sticky=tk.W, padx=5, pady=5)
+        self.update_spec_overrides_label()
+
+        # 휠하우스 프레임 (오프라인 안전 모드)
+        wheelhouse_frame = ttk.LabelFrame(scrollable_frame, text="휠하우스 (오프라인 패키지 설치)")
+        wheelhouse_frame.pack(fill=tk.X, padx=10, pady=5)
+
+        ttk.Label(wheelhouse_frame, text="휠하우스 폴더:").grid(row=0, column=0, sticky=tk.W, padx=5, pady=5)
+        self.wheelhouse_dir = tk.StringVar()
+        wheelhouse_entry = ttk.Entry(wheelhouse_frame, textvariable=self.wheelhouse_dir, width=50)
+        wheelhouse_entry.grid(row=0, column=1, padx=5, pady=5)
+
+        wheelhouse_btn = ttk.Button(wheelhouse_frame, text="찾아보기", command=self.browse_wheelhouse_dir)
+        wheelhouse_btn.grid(row=0, column=2, padx=5, pady=5)
+
+        populate_btn = ttk.Button(wheelhouse_frame, text="휠 내려받기", command=self.populate_wheelhouse)
+        populate_btn.grid(row=1, column=0, padx=5, pady=5)
+
+    def update_spec_overrides_label(self):
+        """프로젝트 파일에서 불러온 spec_overrides 요약 표시"""
+        count = sum(len(values) for values in self.spec_overrides.values())
+        if count:
+            sections = ", ".join(sorted(self.spec_overrides))
+            self.spec_overrides_label.config(text=f"spec_overrides: {count}개 인자 ({sections}) - 프로젝트 파일에서 편집")
+        else:
+            self.spec_overrides_label.config(text="spec_overrides: 없음 - 프로젝트 파일에서 편집")
+
+    @staticmethod
+    def split_list(text):
+        """쉼표로 구분된 입력을 목록으로"""
+        return [item.strip() for item in text.split(",") if item.strip()]
+
     def create_hooks_tab(self):
         """훅 및 임포트 탭 생성"""
         self.tab_hooks = ttk.Frame(self.notebook)
@@ -299,6 +482,20 @@ class PyInstallerGUI:
         analyze_btn = ttk.Button(hidden_frame, text="파일 분석", command=self.analyze_imports)
         analyze_btn.grid(row=2, column=1, padx=5, pady=5)
 
+        # 빌드 환경에서 측정한 임포트 시간 (숨겨진 임포트별 누적 시간)
+        self.import_profile = None
+        ttk.Label(hidden_frame, text="임포트 시간 (누적):").grid(row=1, column=3, sticky=tk.W, padx=5, pady=5)
+        self.import_profile_listbox = tk.Listbox(hidden_frame, width=32, height=5)
+        self.import_profile_listbox.grid(row=0, column=3, padx=5, pady=5, sticky=tk.N + tk.S)
+
+        self.import_profile_script_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(hidden_frame, text="스크립트 전체 실행", variable=self.import_profile_script_var).grid(
+            row=2, column=3, sticky=tk.W, padx=5, pady=5)
+
+        import_profile_btn = ttk.Button(hidden_frame, text="임포트 프로파일", command=self.profile_imports)
+        import_profile_btn.grid(row=2, column=2, padx=5, pady=5)
+        self.refresh_import_profile_view()
+
         # 제외할 모듈 프레임
         exclude_frame = ttk.LabelFrame(scrollable_frame, text="제외할 모듈 (--exclude-module)")
         exclude_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -317,6 +514,9 @@ class PyInstallerGUI:
         remove_exclude_btn = ttk.Button(exclude_frame, text="제거", command=self.remove_exclude_module)
         remove_exclude_btn.grid(row=2, column=0, padx=5, pady=5)
 
+        suggest_exclude_btn = ttk.Button(exclude_frame, text="추천 받기", command=self.suggest_exclude_modules)
+        suggest_exclude_btn.grid(row=2, column=1, padx=5, pady=5)
+
         # 추가 훅 디렉토리 프레임
         hooks_dir_frame = ttk.LabelFrame(scrollable_frame, text="추가 훅 디렉토리 (--additional-hooks-dir)")
         hooks_dir_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -441,228 +641,165 @@ class PyInstallerGUI:
 
     def check_internet_connection(self):
         """인터넷 연결 상태 확인"""
-        try:
-            # Google에 ping 보내기
-            process = subprocess.run(
-                ["ping", "-n", "1", "google.com"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                timeout=5
-            )
-            return process.returncode == 0
-        except Exception:
-            return False
-
-    def create_virtual_env_and_install_packages(self, packages):
-        """가상환경 생성 및 패키지 설치"""
-        try:
-            # 임시 디렉토리 생성
-            temp_dir = os.path.join(os.path.dirname(self.script_path.get()), "temp_venv")
-            if os.path.exists(temp_dir):
-                shutil.rmtree(temp_dir)
-
-            # 가상환경 생성
-            self.log_text.insert(tk.END, f"가상환경 생성 중: {temp_dir}\n", "info")
-            self.log_text.see(tk.END)
-            self.root.update_idletasks()
-
-            process = subprocess.run(
-                [sys.executable, "-m", "venv", temp_dir],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-
-            if process.returncode != 0:
-                self.log_text.insert(tk.END, f"가상환경 생성 실패: {process.stderr}\n", "error")
-                self.log_text.see(tk.END)
-                self.root.update_idletasks()
-                return None, []
-
-            # 가상환경의 pip 경로
-            pip_path = os.path.join(temp_dir, "Scripts", "pip.exe") if os.name == "nt" else os.path.join(temp_dir,
-                                                                                                         "bin", "pip")
-            python_path = os.path.join(temp_dir, "Scripts", "python.exe") if os.name == "nt" else os.path.join(temp_dir,
-                                                                                                               "bin",
-                                                                                                               "python")
-
-            # 파이썬 기본 모듈 목록 (설치 시도에서 제외)
-            standard_libs = [
-                "os", "sys", "re", "json", "time", "datetime", "random", "math", "hashlib",
-                "subprocess", "shutil", "glob", "argparse", "collections", "copy", "csv",
-                "enum", "functools", "itertools", "io", "logging", "pickle", "platform",
-                "string", "tempfile", "threading", "traceback", "types", "typing", "uuid",
-                "warnings", "weakref", "zipfile", "pathlib"  # pathlib 추가
-            ]
-
-            # 패키지명과 모듈명 매핑 (pip 설치명 -> 실제 임포트명)
-            package_to_module = {
-                "python-dateutil": "dateutil",
-                "tk": "tkinter",
-                "pywin32-ctypes": "win32ctypes",
-                "pyinstaller-hooks-contrib": "_pyinstaller_hooks_contrib"
-            }
-
-            # 모듈명과 패키지명 매핑 (실제 임포트명 -> pip 설치명)
-            module_to_package = {
-                "tkinter": "tk",
-                "dateutil": "python-dateutil",
-                "win32ctypes": "pywin32-ctypes",
-                "_pyinstaller_hooks_contrib": "pyinstaller-hooks-contrib"
-            }
-
-            # pip 업그레이드 먼저 실행
-            self.log_text.insert(tk.END, "pip 업그레이드 중...\n", "info")
-            self.log_text.see(tk.END)
-            self.root.update_idletasks()
-
-            process = subprocess.run(
-                [python_path, "-m", "pip", "install", "--upgrade", "pip"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-
-            if process.returncode == 0:
-                self.log_text.insert(tk.END, "pip 업그레이드 완료\n", "success")
-            else:
-                self.log_text.insert(tk.END, f"pip 업그레이드 실패: {process.stderr}\n", "warning")
+        return build_env.check_internet_connection()
+
+    def get_wheelhouse(self):
+        """휠이 준비된 휠하우스 경로 반환 (없으면 None)"""
+        wheelhouse = self.wheelhouse_dir.get()
+        return wheelhouse if build_env.has_wheels(wheelhouse) else None
+
+    def populate_wheelhouse(self):
+        """숨겨진 임포트 목록의 의존성 휠을 휠하우스에 내려받기"""
+        wheelhouse = self.wheelhouse_dir.get()
+        if not wheelhouse:
+            messagebox.showwarning("경고", "휠하우스 폴더를 지정해주세요.")
+            return
 
-            self.log_text.see(tk.END)
-            self.root.update_idletasks()
+        if self.is_env_job_running():
+            messagebox.showinfo("알림", "다른 환경 준비 작업이 진행 중입니다.")
+            return
 
-            # pyinstaller 먼저 설치
-            self.log_text.insert(tk.END, "PyInstaller 설치 중...\n", "info")
-            self.log_text.see(tk.END)
-            self.root.update_idletasks()
+        packages = list(self.hidden_imports)
 
-            process = subprocess.run(
-                [pip_path, "install", "pyinstaller"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
+        def job(log, progress, cancel_event):
+            if not build_env.check_internet_connection():
+                return None
+            log(f"휠하우스 준비 중: {wheelhouse}\n", "info")
+            return build_env.populate_wheelhouse(wheelhouse, packages, log=log, progress=progress,
+                                                 cancel_event=cancel_event)
 
-            if process.returncode == 0:
-                self.log_text.insert(tk.END, "PyInstaller 설치 완료\n", "success")
+        def on_done(failed):
+            if failed is None:
+                messagebox.showwarning("경고", "인터넷 연결이 확인되지 않아 휠을 내려받을 수 없습니다.")
+            elif failed:
+                self.status_bar.config(text=f"휠하우스 준비 완료 (실패 {len(failed)}개)")
             else:
-                self.log_text.insert(tk.END, f"PyInstaller 설치 실패: {process.stderr}\n", "error")
-
-            self.log_text.see(tk.END)
-            self.root.update_idletasks()
-
-            # tkinter가 필요하면 tk 패키지 설치
-            if "tkinter" in packages:
-                self.log_text.insert(tk.END, "tkinter(tk) 설치 중...\n", "info")
-                self.log_text.see(tk.END)
-                self.root.update_idletasks()
+                self.status_bar.config(text="휠하우스 준비 완료")
 
-                process = subprocess.run(
-                    [pip_path, "install", "tk"],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
+        self.run_env_job("휠하우스 준비", job, on_done)
 
-                if process.returncode == 0:
-                    self.log_text.insert(tk.END, "tkinter(tk) 설치 완료\n", "success")
-                else:
-                    self.log_text.insert(tk.END, f"tkinter(tk) 설치 실패: {process.stderr}\n", "warning")
-
-                self.log_text.see(tk.END)
-                self.root.update_idletasks()
+    def log_message(self, message, tag=None):
+        """로그 대기열에 메시지 추가 (다음 주기에 로그 창에 표시, 대기열은 스레드 안전하므로 작업 스레드에서도 사용)"""
+        self.log_queue.put(message, tag)
 
-            # Visual C++ 런타임 관련 패키지 설치 (pandas 종속성 문제 해결)
-            if "pandas" in packages:
-                self.log_text.insert(tk.END, "pandas 종속성 패키지 설치 중...\n", "info")
-                self.log_text.see(tk.END)
-                self.root.update_idletasks()
-
-                # numpy 먼저 설치 (pandas 종속성)
-                process = subprocess.run(
-                    [pip_path, "install", "numpy"],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
-
-                if process.returncode == 0:
-                    self.log_text.insert(tk.END, "numpy 설치 완료\n", "success")
-                else:
-                    self.log_text.insert(tk.END, f"numpy 설치 실패: {process.stderr}\n", "warning")
-
-                self.log_text.see(tk.END)
-                self.root.update_idletasks()
+    def begin_log_file(self, kind):
+        """이후 로그를 새 빌드 로그 파일에도 기록"""
+        app_name = project_model.app_name_of(self.get_project_data()) or "project"
+        log_path = self.log_queue.begin_file(f"{app_name}-{kind}")
+        if log_path:
+            self.log_message(f"로그 파일: {log_path}\n", "info")
 
-            # 나머지 패키지 설치 (기본 모듈 제외)
-            for package in packages:
-                # 기본 모듈이거나 이미 설치한 패키지는 건너뛰기
-                if package in standard_libs or package == "pyinstaller" or package == "tkinter":
-                    continue
-
-                # 모듈명을 패키지명으로 변환 (필요한 경우)
-                install_package = module_to_package.get(package, package)
-
-                self.log_text.insert(tk.END, f"패키지 설치 중: {install_package}\n", "info")
+    def flush_log_queue(self):
+        """쌓인 로그를 한 번에 로그 창에 반영하고 오래된 줄은 잘라냄"""
+        try:
+            items = self.log_queue.drain()
+            if items:
+                # 어차피 잘려나갈 앞부분은 넣지 않음
+                if len(items) > self.LOG_MAX_LINES:
+                    items = items[-self.LOG_MAX_LINES:]
+                self.log_text.insert(tk.END, *log_pipeline.group_by_tag(items))
+
+                line_count = int(self.log_text.index("end-1c").split(".")[0])
+                if line_count > self.LOG_MAX_LINES:
+                    self.log_text.delete("1.0", f"{line_count - self.LOG_MAX_LINES + 1}.0")
                 self.log_text.see(tk.END)
-                self.root.update_idletasks()
-
-                process = subprocess.run(
-                    [pip_path, "install", install_package],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.PIPE,
-                    text=True
-                )
 
-                if process.returncode == 0:
-                    self.log_text.insert(tk.END, f"패키지 설치 완료: {install_package}\n", "success")
-                else:
-                    self.log_text.insert(tk.END, f"패키지 설치 실패: {install_package} - {process.stderr}\n", "warning")
+            progress = self.pending_build_progress
+            if progress is not None:
+                self.pending_build_progress = None
+                self.progress_var.set(progress[0])
+                self.progress_label.config(text=progress[1])
+        finally:
+            self.root.after(self.LOG_FLUSH_MS, self.flush_log_queue)
+
+    def create_virtual_env_and_install_packages(self, packages, wheelhouse=None, log=None,
+                                                progress=None, cancel_event=None):
+        """가상환경 생성 및 패키지 설치 (요구 패키지가 같으면 캐시된 가상환경 재사용)"""
+        return build_env.prepare_environment(
+            packages, cache=self.venv_cache, wheelhouse=wheelhouse,
+            log=log or self.log_message,
+            progress=progress,
+            cancel_event=cancel_event)
+
+    def is_env_job_running(self):
+        """백그라운드 환경 준비 작업이 진행 중인지 확인"""
+        return self.env_job is not None and self.env_job.is_alive()
+
+    def run_env_job(self, title, job, on_done):
+        """환경 준비 작업을 백그라운드 스레드에서 실행
+
+        job(log, progress, cancel_event) 의 결과는 메인 스레드에서 on_done(result) 로 전달된다.
+        """
+        if self.build_running:
+            messagebox.showwarning("경고", "빌드가 진행 중입니다. 완료 후 다시 시도해주세요.")
+            return
 
-                self.log_text.see(tk.END)
-                self.root.update_idletasks()
-
-            # 설치된 패키지 목록 가져오기
-            process = subprocess.run(
-                [pip_path, "freeze"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-
-            if process.returncode == 0:
-                # pip freeze 결과에서 패키지 이름만 추출
-                installed_packages_raw = [line.split('==')[0] for line in process.stdout.splitlines() if line]
-
-                # 실제 모듈 이름으로 변환 (패키지명 -> 모듈명)
-                installed_modules = []
-                for pkg in installed_packages_raw:
-                    if pkg in package_to_module:
-                        installed_modules.append(package_to_module[pkg])
-                    else:
-                        installed_modules.append(pkg)
+        cancel_event = threading.Event()
+        start_time = time.time()
 
-                # 기본 모듈 추가
-                for pkg in packages:
-                    if pkg in standard_libs and pkg not in installed_modules:
-                        installed_modules.append(pkg)
+        def progress(percent, message):
+            self.root.after(0, self.update_env_job_progress, start_time, percent, message)
 
-                self.log_text.insert(tk.END, f"설치된 패키지: {', '.join(installed_modules)}\n", "info")
-                self.log_text.see(tk.END)
-                self.root.update_idletasks()
-                return temp_dir, installed_modules
-            else:
-                self.log_text.insert(tk.END, f"패키지 목록 가져오기 실패: {process.stderr}\n", "error")
-                self.log_text.see(tk.END)
-                self.root.update_idletasks()
-                return temp_dir, []
+        def worker():
+            try:
+                result = job(self.log_message, progress, cancel_event)
+                self.root.after(0, on_done, result)
+            except build_env.BuildCancelled:
+                self.root.after(0, lambda: self.progress_label.config(text=f"{title} 취소됨"))
+                self.root.after(0, lambda: self.status_bar.config(text=f"{title}이(가) 취소되었습니다."))
+            except Exception as e:
+                self.log_message(f"{title} 중 오류 발생: {str(e)}\n", "error")
+                self.root.after(0, lambda: self.progress_label.config(text="오류 발생!"))
+            finally:
+                self.root.after(0, self.finish_env_job)
 
-        except Exception as e:
-            self.log_text.insert(tk.END, f"가상환경 생성 중 오류 발생: {str(e)}\n", "error")
-            self.log_text.see(tk.END)
-            self.root.update_idletasks()
-            return None, []
+        self.env_cancel_event = cancel_event
+        self.begin_log_file(title)
+        self.progress_var.set(0)
+        self.progress_label.config(text=f"{title} 시작...")
+        self.status_bar.config(text=f"{title} 중...")
+        self.generate_btn.config(state="disabled")
+        self.execute_btn.config(state="disabled")
+        self.cancel_btn.config(state="normal")
+
+        self.env_job = threading.Thread(target=worker, daemon=True)
+        self.env_job.start()
+
+    def update_env_job_progress(self, start_time, percent, message):
+        """환경 준비 진행률과 예상 남은 시간 표시"""
+        self.progress_var.set(percent)
+        elapsed = time.time() - start_time
+        if 0 < percent < 100:
+            remaining = elapsed * (100 - percent) / percent
+            self.progress_label.config(text=f"{message} ({percent:.0f}%, 남은 시간 약 {remaining:.0f}초)")
+        else:
+            self.progress_label.config(text=f"{message} ({percent:.0f}%)")
+
+    def finish_env_job(self):
+        """백그라운드 작업 종료 후 버튼 상태 복원"""
+        self.log_queue.end_file()
+        self.env_job = None
+        self.env_cancel_event = None
+        self.generate_btn.config(state="normal")
+        self.execute_btn.config(state="normal")
+        self.cancel_btn.config(state="disabled")
+
+    def finish_build(self):
+        """빌드 종료 후 실행 상태와 버튼 복원"""
+        self.log_queue.end_file()
+        self.build_running = False
+        self.build_cancel_event = None
+        self.generate_btn.config(state="normal")
+        self.execute_btn.config(state="normal")
+        self.cancel_btn.config(state="disabled")
+        self.status_bar.config(text="명령어 실행 완료")
+
+    def cancel_job(self):
+        """진행 중인 환경 준비 작업이나 빌드 취소"""
+        for cancel_event in (self.env_cancel_event, self.build_cancel_event):
+            if cancel_event is not None:
+                cancel_event.set()
+                self.progress_label.config(text="취소 중...")
 
     def create_execution_tab(self):
         """실행 및 로그 탭 생성"""
@@ -673,18 +810,23 @@ class PyInstallerGUI:
         command_frame = ttk.LabelFrame(self.tab_execution, text="PyInstaller 명령어")
         command_frame.pack(fill=tk.X, padx=10, pady=5)
 
-        self.command_text = scrolledtext.ScrolledText(command_frame, width=80, height=5)
+        # 표시 전용 (실행은 설정에서 다시 만든 인자 목록으로 하므로 직접 고칠 수 없게 함)
+        self.command_text = scrolledtext.ScrolledText(command_frame, width=80, height=5, state="disabled")
         self.command_text.pack(fill=tk.X, padx=5, pady=5)
 
         # 버튼 프레임
         button_frame = ttk.Frame(self.tab_execution)
         button_frame.pack(fill=tk.X, padx=10, pady=5)
 
-        generate_btn = ttk.Button(button_frame, text="명령어 생성", command=self.generate_command)
-        generate_btn.pack(side=tk.LEFT, padx=5, pady=5)
+        self.generate_btn = ttk.Button(button_frame, text="명령어 생성", command=self.generate_command)
+        self.generate_btn.pack(side=tk.LEFT, padx=5, pady=5)
 
-        execute_btn = ttk.Button(button_frame, text="실행", command=self.execute_command)
-        execute_btn.pack(side=tk.LEFT, padx=5, pady=5)
+        self.execute_btn = ttk.Button(button_frame, text="실행", command=self.execute_command)
+        self.execute_btn.pack(side=tk.LEFT, padx=5, pady=5)
+
+        # 가상환경 준비/빌드 취소 버튼
+        self.cancel_btn = ttk.Button(button_frame, text="취소", command=self.cancel_job, state="disabled")
+        self.cancel_btn.pack(side=tk.LEFT, padx=5, pady=5)
 
         save_btn = ttk.Button(button_frame, text="설정 저장", command=self.save_project)
         save_btn.pack(side=tk.LEFT, padx=5, pady=5)
@@ -698,6 +840,24 @@ class PyInstallerGUI:
         )
         safe_module_check.pack(side=tk.LEFT, padx=5, pady=5)
 
+        # 입력이 마지막 성공 빌드와 같으면 빌드 생략
+        self.skip_unchanged_var = tk.BooleanVar(value=True)
+        skip_unchanged_check = ttk.Checkbutton(
+            button_frame,
+            text="변경 없으면 빌드 생략",
+            variable=self.skip_unchanged_var
+        )
+        skip_unchanged_check.pack(side=tk.LEFT, padx=5, pady=5)
+
+        # 빌드 후 결과 실행 파일의 시작 시간과 최대 메모리 측정
+        self.profile_startup_var = tk.BooleanVar(value=False)
+        profile_startup_check = ttk.Checkbutton(
+            button_frame,
+            text="시작 시간 측정",
+            variable=self.profile_startup_var
+        )
+        profile_startup_check.pack(side=tk.LEFT, padx=5, pady=5)
+
         # 진행 상황 프레임
         progress_frame = ttk.LabelFrame(self.tab_execution, text="진행 상황")
         progress_frame.pack(fill=tk.X, padx=10, pady=5)
@@ -732,6 +892,14 @@ class PyInstallerGUI:
         save_log_btn = ttk.Button(log_button_frame, text="로그 저장", command=self.save_log)
         save_log_btn.pack(side=tk.LEFT, padx=5)
 
+        history_btn = ttk.Button(log_button_frame, text="빌드 기록", command=self.show_build_history)
+        history_btn.pack(side=tk.LEFT, padx=5)
+
+        # 빌드 결과물 구성 분석이 끝나면 활성화
+        self.bundle_btn = ttk.Button(log_button_frame, text="번들 구성", command=self.show_bundle_tree,
+                                     state="disabled")
+        self.bundle_btn.pack(side=tk.LEFT, padx=5)
+
         # 생성된 파일 확인하기 버튼 추가
         self.open_output_btn = ttk.Button(log_button_frame, text="생성된 파일 확인하기",
                                           command=self.open_output_folder, state="disabled")
@@ -744,8 +912,8 @@ class PyInstallerGUI:
             app_name = self.app_name.get() if self.app_name.get() else \
             os.path.splitext(os.path.basename(self.script_path.get()))[0]
 
-            # 빌드 타입에 따라 경로 결정
-            if self.build_type.get() == "--onefile":
+            # 빌드 타입에 따라 경로 결정 (변형 매트릭스면 변형 폴더들이 있는 출력 폴더)
+            if self.build_type.get() == "--onefile" or any(var.get() for var in self.variant_vars.values()):
                 folder_path = output_path
             else:
                 folder_path = os.path.join(output_path, app_name)
@@ -759,45 +927,48 @@ class PyInstallerGUI:
         except Exception as e:
             messagebox.showerror("오류", f"폴더를 열 수 없습니다: {str(e)}")
 
-    def analyze_and_add_imports(self, file_path):
-        """파일을 분석하고 숨겨진 임포트를 자동으로 추가"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            tree = ast.parse(content)
-            imports = set()
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for name in node.names:
-                        imports.add(name.name.split('.')[0])
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module:
-                        imports.add(node.module.split('.')[0])
-
-            # 기존 숨겨진 임포트 목록 초기화
-            self.hidden_imports = []
-            self.hidden_listbox.delete(0, tk.END)
-
-            # 분석된 임포트 추가
-            for imp in sorted(imports):
-                self.hidden_imports.append(imp)
-                self.hidden_listbox.insert(tk.END, imp)
-
-            # 로그에 분석 결과 표시
-            self.log_text.delete("1.0", tk.END)
-            self.log_text.insert(tk.END, "=== 임포트 분석 결과 ===\n", "info")
-            for imp in sorted(imports):
-                self.log_text.insert(tk.END, f"- {imp}\n")
-            self.log_text.insert(tk.END, "=======================\n", "info")
-            self.log_text.see(tk.END)
-
-            # 상태 업데이트
-            self.status_bar.config(text=f"파일 분석 완료: {len(imports)}개의 임포트를 찾았습니다.")
+    def show_import_graph(self, graph):
+        """임포트 분석 결과를 종류별로 로그에 표시"""
+        self.log_message("=== 임포트 분석 결과 ===\n", "info")
+        self.log_message(f"로컬 모듈: {len(graph.local_modules)}개\n")
+        self.log_message(f"표준 라이브러리: {', '.join(sorted(graph.stdlib))}\n")
+        self.log_message("서드파티:\n")
+        for imp in sorted(graph.third_party):
+            self.log_message(f"- {imp}\n")
+        for path, error in graph.errors.items():
+            self.log_message(f"파싱 실패: {path} - {error}\n", "warning")
+        self.log_message("=======================\n", "info")
+
+    def analyze_and_add_imports(self, file_path, generation, graph, error):
+        """분석 결과가 현재 경로와 일치할 때만 숨겨진 임포트를 자동으로 추가"""
+        if generation != self.analysis_generation or file_path != self.script_path.get():
+            # 그 사이 경로가 바뀐 오래된 분석 결과는 버림
+            return
+        self.analysis_cancel_event = None
 
-        except Exception as e:
-            messagebox.showerror("오류", f"파일 분석 중 오류 발생: {str(e)}")
+        if error is not None:
+            self.status_bar.config(text="파일 분석 실패")
+            messagebox.showerror("오류", f"파일 분석 중 오류 발생: {str(error)}")
+            return
+
+        imports = graph.hidden_imports()
+
+        # 기존 숨겨진 임포트 목록 초기화
+        self.hidden_imports = []
+        self.hidden_listbox.delete(0, tk.END)
+
+        # 분석된 임포트 추가
+        for imp in imports:
+            self.hidden_imports.append(imp)
+            self.hidden_listbox.insert(tk.END, imp)
+
+        self.refresh_import_profile_view()
+
+        # 로그에 분석 결과 표시
+        self.show_import_graph(graph)
+
+        # 상태 업데이트
+        self.status_bar.config(text=f"파일 분석 완료: {len(imports)}개의 임포트를 찾았습니다.")
 
     # 유틸리티 메서드
     def browse_script(self):
@@ -812,8 +983,26 @@ class PyInstallerGUI:
             base_name = os.path.splitext(os.path.basename(file_path))[0]
             self.app_name.set(base_name)
 
-            # 파일 분석 및 임포트 추가
-            self.analyze_and_add_imports(file_path)
+            # 파일 분석 및 임포트 추가 (입력 대기 없이 바로 시작)
+            self.start_path_analysis()
+
+    def add_extra_script(self):
+        """추가 진입 스크립트 추가 (실행 파일 이름은 스크립트 파일 이름)"""
+        file_path = filedialog.askopenfilename(
+            title="추가 진입 스크립트 선택",
+            filetypes=[("Python 파일", "*.py"), ("모든 파일", "*.*")]
+        )
+        if file_path and file_path not in self.extra_scripts:
+            self.extra_scripts.append(file_path)
+            self.extra_script_listbox.insert(tk.END, file_path)
+
+    def remove_extra_script(self):
+        """선택된 추가 진입 스크립트 제거"""
+        selected = self.extra_script_listbox.curselection()
+        if selected:
+            index = selected[0]
+            self.extra_script_listbox.delete(index)
+            self.extra_scripts.pop(index)
 
     def browse_output_dir(self):
         """출력 디렉토리 선택"""
@@ -833,6 +1022,12 @@ class PyInstallerGUI:
         if dir_path:
             self.upx_dir.set(dir_path)
 
+    def browse_wheelhouse_dir(self):
+        """휠하우스 디렉토리 선택"""
+        dir_path = filedialog.askdirectory(title="휠하우스 폴더 선택")
+        if dir_path:
+            self.wheelhouse_dir.set(dir_path)
+
     def browse_icon(self):
         """아이콘 파일 선택"""
         file_path = filedialog.askopenfilename(
@@ -909,6 +1104,7 @@ class PyInstallerGUI:
             self.hidden_imports.append(module_name)
             self.hidden_listbox.insert(tk.END, module_name)
             self.hidden_import_entry.delete(0, tk.END)
+            self.refresh_import_profile_view()
 
     def remove_hidden_import(self):
         """선택된 숨겨진 임포트 제거"""
@@ -917,6 +1113,51 @@ class PyInstallerGUI:
             index = selected[0]
             self.hidden_listbox.delete(index)
             self.hidden_imports.pop(index)
+            self.refresh_import_profile_view()
+
+    def profile_imports(self):
+        """빌드 환경(안전 모드면 준비된 가상환경)에서 진입 스크립트의 임포트 시간을 백그라운드에서 측정"""
+        project = self.get_project_data()
+        if not project["script_path"] or not os.path.isfile(project["script_path"]):
+            messagebox.showwarning("경고", "유효한 Python 파일을 선택해주세요.")
+            return
+        venv_dir = self.venv_dir if self.safe_module_var.get() else None
+        mode = import_profiler.MODE_SCRIPT if self.import_profile_script_var.get() else import_profiler.MODE_IMPORTS
+        environment = f"가상환경 {venv_dir}" if venv_dir else "현재 인터프리터"
+        self.log_message(f"임포트 시간 측정 시작 ({environment})\n", "info")
+        self.status_bar.config(text="임포트 시간 측정 중...")
+
+        def worker():
+            try:
+                result = import_profiler.profile_project(project, venv_dir, mode)
+            except Exception as e:
+                error = str(e)
+                self.root.after(0, lambda: self.status_bar.config(text="준비됨"))
+                self.root.after(0, lambda: messagebox.showerror("오류", f"임포트 시간 측정 중 오류 발생: {error}"))
+                return
+            summary = import_profiler.summarize(result)
+            self.root.after(0, lambda: self.on_imports_profiled(summary))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def on_imports_profiled(self, summary):
+        """측정 결과를 로그와 숨겨진 임포트 옆 목록에 표시 (프로젝트 저장 시 함께 저장)"""
+        self.import_profile = summary
+        for line in import_profiler.format_summary(summary):
+            self.log_message(line, "info")
+        self.refresh_import_profile_view()
+        self.status_bar.config(text=f"임포트 시간 측정 완료: 총 {summary['total_us'] / 1000:.1f}ms")
+
+    def refresh_import_profile_view(self):
+        """숨겨진 임포트를 측정된 누적 임포트 시간이 큰 순서로 표시"""
+        self.import_profile_listbox.delete(0, tk.END)
+        if not self.import_profile:
+            self.import_profile_listbox.insert(tk.END, "측정 기록 없음")
+            return
+        self.import_profile_listbox.insert(
+            tk.END, f"총 {self.import_profile['total_us'] / 1000:.1f}ms ({self.import_profile['created'][:10]})")
+        for module, cost in import_profiler.hidden_import_costs(self.import_profile, self.hidden_imports):
+            self.import_profile_listbox.insert(tk.END, f"{module}: {cost:.1f}ms" if cost is not None else f"{module}: -")
 
     def add_exclude_module(self):
         """제외할 모듈 추가"""
@@ -926,6 +1167,65 @@ class PyInstallerGUI:
             self.exclude_listbox.insert(tk.END, module_name)
             self.exclude_module_entry.delete(0, tk.END)
 
+    def suggest_exclude_modules(self):
+        """마지막 빌드의 모듈 그래프로 제외 모듈 추천을 백그라운드에서 계산"""
+        project = self.get_project_data()
+        if not project["script_path"]:
+            messagebox.showwarning("경고", "Python 파일을 먼저 선택해주세요.")
+            return
+        venv_dir = self.venv_dir if self.safe_module_var.get() else None
+        self.status_bar.config(text="제외 모듈 분석 중...")
+
+        def worker():
+            try:
+                index = module_index.build_index(build_env.venv_executable(venv_dir, "python")) if venv_dir else None
+                result = exclude_advisor.suggest_excludes(project, index=index)
+            except Exception as e:
+                error = str(e)
+                self.root.after(0, lambda: self.status_bar.config(text="준비됨"))
+                self.root.after(0, lambda: messagebox.showwarning("제외 모듈 추천", error))
+                return
+            self.root.after(0, lambda: self.show_exclude_suggestions(*result))
+
+        threading.Thread(target=worker, daemon=True).start()
+
+    def show_exclude_suggestions(self, recommendations, total_saving):
+        """추천 목록을 보여 주고 선택한 모듈을 한 번에 제외 목록에 추가"""
+        self.status_bar.config(text="준비됨")
+        for line in exclude_advisor.format_recommendations(recommendations, total_saving):
+            self.log_message(line, "info")
+        if not recommendations:
+            messagebox.showinfo("제외 모듈 추천", "제외를 추천할 모듈이 없습니다.")
+            return
+
+        dialog = tk.Toplevel(self.root)
+        dialog.title("제외 모듈 추천")
+        dialog.geometry("640x360")
+        dialog.transient(self.root)
+
+        ttk.Label(dialog, text="제외할 모듈을 선택하세요 (위험이 낮은 항목이 미리 선택됨):").pack(
+            anchor=tk.W, padx=5, pady=5)
+        listbox = tk.Listbox(dialog, selectmode=tk.MULTIPLE, width=90, height=14)
+        listbox.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        for i, r in enumerate(recommendations):
+            mark = "" if r["risk"] == "low" else " (검토 필요)"
+            listbox.insert(tk.END, f"{r['module']}{mark} - 약 {r['saving'] / (1024 * 1024):.2f} MB, {r['reason']}")
+            if r["risk"] == "low":
+                listbox.selection_set(i)
+
+        def on_apply():
+            for i in listbox.curselection():
+                module = recommendations[i]["module"]
+                if module in self.exclude_modules:
+                    continue
+                self.exclude_modules.append(module)
+                self.exclude_listbox.insert(tk.END, module)
+                self.log_message(f"제외 모듈 추가: {module}\n", "info")
+            dialog.destroy()
+            self.update_command_text()
+
+        ttk.Button(dialog, text="선택 항목 적용", command=on_apply).pack(pady=5)
+
     def remove_exclude_module(self):
         """선택된 제외 모듈 제거"""
         selected = self.exclude_listbox.curselection()
@@ -1095,26 +1395,11 @@ class PyInstallerGUI:
             return
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            tree = ast.parse(content)
-            imports = set()
-
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for name in node.names:
-                        imports.add(name.name.split('.')[0])
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module:
-                        imports.add(node.module.split('.')[0])
+            graph = import_analysis.analyze_project(file_path)
+            imports = graph.hidden_imports()
 
             # 결과 표시
-            self.log_text.insert(tk.END, "=== 임포트 분석 결과 ===\n", "info")
-            for imp in sorted(imports):
-                self.log_text.insert(tk.END, f"- {imp}\n")
-            self.log_text.insert(tk.END, "=======================\n", "info")
-            self.log_text.see(tk.END)
+            self.show_import_graph(graph)
 
             # 사용자에게 추가할지 물어보기
             if messagebox.askyesno("임포트 추가", "분석된 임포트를 숨겨진 임포트 목록에 추가하시겠습니까?"):
@@ -1122,6 +1407,7 @@ class PyInstallerGUI:
                     if imp not in self.hidden_imports:
                         self.hidden_imports.append(imp)
                         self.hidden_listbox.insert(tk.END, imp)
+                self.refresh_import_profile_view()
 
         except Exception as e:
             messagebox.showerror("오류", f"파일 분석 중 오류 발생: {str(e)}")
@@ -1133,208 +1419,201 @@ class PyInstallerGUI:
             messagebox.showwarning("경고", "Python 파일을 선택해주세요.")
             return
 
-        # 안전하게 모듈 추가하기 옵션이 켜져 있고 인터넷 연결이 되어 있는 경우
-        if self.safe_module_var.get() and self.check_internet_connection():
-            self.log_text.insert(tk.END, "인터넷 연결 확인됨. 안전 모드로 모듈 추가를 시작합니다.\n", "info")
-            self.log_text.see(tk.END)
-            self.root.update_idletasks()
+        if self.is_env_job_running():
+            messagebox.showinfo("알림", "가상환경 준비가 진행 중입니다. 완료 후 명령어가 생성됩니다.")
+            return
+
+        self.venv_dir = None
 
-            # 파일 분석하여 필요한 패키지 목록 가져오기
-            with open(script_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+        if not self.safe_module_var.get():
+            self.update_command_text()
+            return
 
-            tree = ast.parse(content)
-            imports = set()
+        wheelhouse = self.get_wheelhouse()
+        scripts = [script_path] + list(self.extra_scripts)
 
-            for node in ast.walk(tree):
-                if isinstance(node, ast.Import):
-                    for name in node.names:
-                        imports.add(name.name.split('.')[0])
-                elif isinstance(node, ast.ImportFrom):
-                    if node.module:
-                        imports.add(node.module.split('.')[0])
+        def job(log, progress, cancel_event):
+            # 파일 분석하여 필요한 패키지 목록 가져오기 (추가 진입 스크립트 포함)
+            # 로컬 모듈은 제외 (pyinstaller는 자동으로 추가됨)
+            graph = import_analysis.analyze_scripts(scripts)
+            required_packages = graph.top_level_imports()
 
-            # 필요한 패키지 목록 생성 (pyinstaller는 자동으로 추가됨)
-            required_packages = list(imports)
+            # 휠하우스가 있거나 인터넷 연결이 되어 있는 경우에만 안전 모드 진행
+            if wheelhouse:
+                log(f"휠하우스에서 오프라인으로 모듈 추가를 시작합니다: {wheelhouse}\n", "info")
+            elif build_env.check_internet_connection():
+                log("인터넷 연결 확인됨. 안전 모드로 모듈 추가를 시작합니다.\n", "info")
+            else:
+                return None
 
             # 가상환경 생성 및 패키지 설치
-            venv_dir, installed_packages = self.create_virtual_env_and_install_packages(required_packages)
+            return self.create_virtual_env_and_install_packages(
+                required_packages, wheelhouse=wheelhouse, log=log, progress=progress, cancel_event=cancel_event)
 
+        self.run_env_job("가상환경 준비", job, self.on_environment_ready)
+
+    def on_environment_ready(self, result):
+        """가상환경 준비가 끝나면 숨겨진 임포트를 갱신하고 명령어 생성"""
+        if result is None:
+            self.log_message("인터넷 연결과 휠하우스가 확인되지 않아 기존 방식으로 진행합니다.\n", "warning")
+        else:
+            venv_dir, installed_packages = result
             if venv_dir and installed_packages:
-                self.log_text.insert(tk.END, "가상환경 생성 및 패키지 설치 완료. PyInstaller 명령어가 생성되었습니다. 실행버튼을 눌러주세요\n", "info")
-                self.log_text.see(tk.END)
-                self.root.update_idletasks()
+                self.venv_dir = venv_dir
+                self.log_message("가상환경 생성 및 패키지 설치 완료. PyInstaller 명령어가 생성되었습니다. 실행버튼을 눌러주세요\n", "info")
 
                 # 기존 숨겨진 임포트 목록 초기화 및 설치된 패키지로 업데이트
                 self.hidden_imports = installed_packages
                 self.hidden_listbox.delete(0, tk.END)
                 for package in installed_packages:
                     self.hidden_listbox.insert(tk.END, package)
-        else:
-            if self.safe_module_var.get():
-                self.log_text.insert(tk.END, "인터넷 연결이 확인되지 않아 기존 방식으로 진행합니다.\n", "warning")
-                self.log_text.see(tk.END)
-                self.root.update_idletasks()
-
-        # 기본 명령어
-        command = ["pyinstaller"]
-
-        # 기본 옵션
-        if self.build_type.get():
-            command.append(self.build_type.get())
-
-        if self.console_option.get():
-            command.append(self.console_option.get())
-
-        # 이름 옵션
-        if self.app_name.get():
-            command.append(f"--name=\"{self.app_name.get()}\"")
-
-        # 출력 디렉토리
-        if self.output_dir.get():
-            command.append(f"--distpath=\"{self.output_dir.get()}\"")
-
-        # 작업 디렉토리
-        if self.work_dir.get():
-            command.append(f"--workpath=\"{self.work_dir.get()}\"")
+                self.refresh_import_profile_view()
 
-        # 일반 옵션
-        if self.clean_build.get():
-            command.append("--clean")
+        self.update_command_text()
 
-        if self.no_confirm.get():
-            command.append("--noconfirm")
-
-        if self.log_level.get() != "INFO":
-            command.append(f"--log-level={self.log_level.get()}")
-
-        # UPX 옵션
-        if not self.use_upx.get() or self.noupx.get():
-            command.append("--noupx")
-        elif self.upx_dir.get():
-            command.append(f"--upx-dir=\"{self.upx_dir.get()}\"")
-
-        # 고급 옵션
-        if self.strip.get():
-            command.append("--strip")
-
-        if self.ascii.get():
-            command.append("--ascii")
-
-        if self.uac_admin.get():
-            command.append("--uac-admin")
-
-        if self.uac_uiaccess.get():
-            command.append("--uac-uiaccess")
-
-        if self.win_private_assemblies.get():
-            command.append("--win-private-assemblies")
-
-        if self.win_no_prefer_redirects.get():
-            command.append("--win-no-prefer-redirects")
-
-        # 데이터 파일
-        for data_file in self.data_files:
-            command.append(f"--add-data=\"{data_file}\"")
-
-        # 바이너리 파일
-        for binary_file in self.binary_files:
-            command.append(f"--add-binary=\"{binary_file}\"")
-
-        # 숨겨진 임포트
-        for hidden_import in self.hidden_imports:
-            command.append(f"--hidden-import={hidden_import}")
-
-        # 제외 모듈
-        for exclude_module in self.exclude_modules:
-            command.append(f"--exclude-module={exclude_module}")
+    def update_command_text(self):
+        """현재 설정으로 PyInstaller 명령어를 만들어 명령어 창에 표시"""
+        project, clean, reasons = workpath.prepare(self.get_project_data(), self.venv_dir)
+        command = project_model.build_command(project)
+        self.log_workpath(project, clean, reasons)
+        if project_model.uses_spec(project):
+            try:
+                spec_path, regenerated = spec_builder.ensure_spec(project)
+                self.log_message(f"spec 파일: {spec_path} ({'다시 생성' if regenerated else '변경 없음'})\n", "info")
+            except (OSError, ValueError) as e:
+                self.log_message(f"spec 파일 생성 실패: {str(e)}\n", "error")
+
+        # 명령어 표시 (실행은 이 문자열이 아니라 설정에서 다시 만든 인자 목록으로 함)
+        final_command = project_model.command_line(command)
+        self.command_text.config(state="normal")
+        self.command_text.delete("1.0", tk.END)
+        self.command_text.insert(tk.END, final_command)
+        self.command_text.config(state="disabled")
 
-        # 훅 디렉토리
-        for hooks_dir in self.hooks_dirs:
-            command.append(f"--additional-hooks-dir=\"{hooks_dir}\"")
+        # 상태 업데이트
+        self.status_bar.config(text="명령어가 생성되었습니다.")
 
-        # 런타임 훅
-        for runtime_hook in self.runtime_hooks:
-            command.append(f"--runtime-hook=\"{runtime_hook}\"")
+    def log_workpath(self, project, clean, reasons):
+        """자동 관리 작업 폴더와 --clean 적용 여부, 그 이유를 로그에 표시"""
+        if project["managed_workpath"]:
+            action = "--clean 적용" if clean else "--clean 생략"
+            self.log_message(f"작업 폴더: {project['work_dir']} ({action})\n", "info")
+            for reason in reasons:
+                self.log_message(f"- {reason}\n", "info")
 
-        # 플랫폼 특화 옵션
-        if self.icon_file.get():
-            command.append(f"--icon=\"{self.icon_file.get()}\"")
+    def show_build_results(self):
+        """빌드 결과물 구성을 백그라운드에서 분석하고 결과를 로그에 표시"""
+        project = self.get_project_data()
+        venv_dir = self.venv_dir if self.safe_module_var.get() else None
 
-        if self.version_file.get():
-            command.append(f"--version-file=\"{self.version_file.get()}\"")
+        def worker():
+            try:
+                # 변형 매트릭스면 변형별 크기와 소요 시간을 표시하고 첫 변형의 구성을 분석
+                bundle_project = project
+                if project["variants"]:
+                    built = dict(project, work_dir=workpath.resolve_work_dir(project))
+                    results = build_history.variant_results(built)
+                    for line in variant_matrix.format_results(results, variant_matrix.read_report(built)):
+                        self.log_message(line, "info")
+                    bundle_project = variant_matrix.variant_project(project, project["variants"][0])
+
+                # 패키지 분류는 빌드에 쓰인 환경 기준 (안전 모드면 가상환경)
+                index = module_index.build_index(build_env.venv_executable(venv_dir, "python")) if venv_dir else None
+                tree = bundle_analysis.analyze_bundle(bundle_project, index=index)
+                exe_path = bundle_analysis.executable_path(bundle_project)
+                exe_size = os.path.getsize(exe_path) if os.path.isfile(exe_path) else None
+            except Exception as e:
+                self.log_message(f"빌드 정보 수집 중 오류 발생: {str(e)}\n", "error")
+                return
+            self.root.after(0, lambda: self.on_bundle_analyzed(bundle_project, tree, exe_path, exe_size))
 
-        if self.manifest_file.get():
-            command.append(f"--manifest=\"{self.manifest_file.get()}\"")
+        threading.Thread(target=worker, daemon=True).start()
 
-        # 리소스
-        for resource in self.resources:
-            command.append(f"--resource=\"{resource}\"")
+    def on_bundle_analyzed(self, project, tree, exe_path, exe_size):
+        """결과물 구성 분석이 끝나면 요약을 표시하고 상세 보기 활성화"""
+        if tree is None:
+            self.log_message("빌드 결과물을 찾을 수 없습니다.\n", "warning")
+            return
 
-        # 복잡한 패키지에 대한 collect-all 옵션 추가
-        if "pandas" in self.hidden_imports:
-            command.append("--collect-all=pandas")
-        if "numpy" in self.hidden_imports:
-            command.append("--collect-all=numpy")
+        self.bundle_tree = tree
+        self.log_message("\n빌드 결과:\n", "info")
+        if project["build_type"] != "--onefile":
+            self.log_message(f"- 출력 디렉토리: {project_model.output_path(project)}\n")
+        if exe_size is not None:
+            self.log_message(f"- 실행 파일: {exe_path}\n")
+            self.log_message(f"- 실행 파일 크기: {bundle_analysis.format_size(exe_size)}\n")
+            self.log_message(
+                f"- 생성 시간: {datetime.fromtimestamp(os.path.getmtime(exe_path)).strftime('%Y-%m-%d %H:%M:%S')}\n")
+        for line in bundle_analysis.format_summary(tree):
+            self.log_message(line)
+        self.bundle_btn.config(state="normal")
+
+    def show_bundle_tree(self):
+        """결과물 구성을 크기순 트리로 표시 (펼칠 때 하위 항목을 채움)"""
+        tree = self.bundle_tree
+        if tree is None:
+            return
 
-        # 스크립트 경로 추가
-        command.append(f"\"{script_path}\"")
+        window = tk.Toplevel(self.root)
+        window.title("번들 구성")
+        window.geometry("700x500")
+
+        view = ttk.Treeview(window, columns=("size", "percent", "files"))
+        view.heading("#0", text="항목")
+        view.heading("size", text="크기")
+        view.heading("percent", text="비율")
+        view.heading("files", text="파일 수")
+        view.column("#0", width=360)
+        view.column("size", width=110, anchor=tk.E)
+        view.column("percent", width=80, anchor=tk.E)
+        view.column("files", width=80, anchor=tk.E)
+
+        scrollbar = ttk.Scrollbar(window, orient=tk.VERTICAL, command=view.yview)
+        view.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        view.pack(fill=tk.BOTH, expand=True)
+
+        nodes = {}
+
+        def insert_children(parent_item, node):
+            for child in node.sorted_children():
+                percent = child.size * 100 / tree.size if tree.size else 0
+                item = view.insert(parent_item, tk.END, text=child.name, values=(
+                    bundle_analysis.format_size(child.size), f"{percent:.1f}%", child.files))
+                nodes[item] = child
+                if child.children:
+                    # 펼침 표시를 위한 빈 항목 (펼칠 때 실제 하위 항목으로 교체)
+                    view.insert(item, tk.END)
+
+        def on_open(event):
+            item = view.focus()
+            node = nodes.get(item)
+            if node is None:
+                return
+            placeholder = view.get_children(item)
+            if len(placeholder) == 1 and placeholder[0] not in nodes:
+                view.delete(placeholder[0])
+                insert_children(item, node)
+
+        view.bind("<<TreeviewOpen>>", on_open)
+        insert_children("", tree)
 
-        # 명령어 표시
-        final_command = " ".join(command)
-        self.command_text.delete("1.0", tk.END)
-        self.command_text.insert(tk.END, final_command)
+    def execute_command(self):
+        """PyInstaller 명령어 실행"""
+        if self.is_env_job_running():
+            messagebox.showwarning("경고", "가상환경 준비가 진행 중입니다. 완료 후 실행해주세요.")
+            return
 
-        # 상태 업데이트
-        self.status_bar.config(text="명령어가 생성되었습니다.")
+        # 같은 출력/작업 폴더를 쓰는 빌드가 겹치지 않도록 한 번에 하나만 실행
+        if self.build_running:
+            messagebox.showwarning("경고", "이미 빌드가 진행 중입니다.")
+            return
 
-    def show_build_results(self):
-        """빌드 결과 정보 표시"""
+        # 설정 값 검증 (잘못된 값이 PyInstaller 인자로 넘어가지 않도록)
         try:
-            output_path = self.output_dir.get() if self.output_dir.get() else "./dist"
-            app_name = self.app_name.get() if self.app_name.get() else \
-            os.path.splitext(os.path.basename(self.script_path.get()))[0]
-
-            if self.build_type.get() == "--onefile":
-                exe_path = os.path.join(output_path, f"{app_name}.exe")
-                if os.path.exists(exe_path):
-                    size_mb = os.path.getsize(exe_path) / (1024 * 1024)
-                    self.log_text.insert(tk.END, f"\n빌드 결과:\n", "info")
-                    self.log_text.insert(tk.END, f"- 실행 파일: {exe_path}\n")
-                    self.log_text.insert(tk.END, f"- 파일 크기: {size_mb:.2f} MB\n")
-                    self.log_text.insert(tk.END,
-                                         f"- 생성 시간: {datetime.fromtimestamp(os.path.getctime(exe_path)).strftime('%Y-%m-%d %H:%M:%S')}\n")
-            else:
-                dir_path = os.path.join(output_path, app_name)
-                if os.path.exists(dir_path):
-                    exe_path = os.path.join(dir_path, f"{app_name}.exe")
-                    if os.path.exists(exe_path):
-                        size_mb = os.path.getsize(exe_path) / (1024 * 1024)
-                        total_size = 0
-                        file_count = 0
-
-                        for root, dirs, files in os.walk(dir_path):
-                            for file in files:
-                                file_path = os.path.join(root, file)
-                                total_size += os.path.getsize(file_path)
-                                file_count += 1
-
-                        total_size_mb = total_size / (1024 * 1024)
-
-                        self.log_text.insert(tk.END, f"\n빌드 결과:\n", "info")
-                        self.log_text.insert(tk.END, f"- 출력 디렉토리: {dir_path}\n")
-                        self.log_text.insert(tk.END, f"- 실행 파일: {exe_path}\n")
-                        self.log_text.insert(tk.END, f"- 실행 파일 크기: {size_mb:.2f} MB\n")
-                        self.log_text.insert(tk.END, f"- 총 파일 수: {file_count}개\n")
-                        self.log_text.insert(tk.END, f"- 총 크기: {total_size_mb:.2f} MB\n")
-        except Exception as e:
-            self.log_text.insert(tk.END, f"빌드 정보 수집 중 오류 발생: {str(e)}\n", "error")
-
-    def execute_command(self):
-        """PyInstaller 명령어 실행"""
-        command = self.command_text.get("1.0", tk.END).strip()
-        if not command:
-            messagebox.showwarning("경고", "실행할 명령어가 없습니다. 먼저 명령어를 생성해주세요.")
+            self.get_project_data().validate()
+        except ValueError as e:
+            messagebox.showerror("오류", str(e))
             return
 
         # 로그 초기화
@@ -1344,142 +1623,147 @@ class PyInstallerGUI:
         self.progress_var.set(0)
         self.progress_label.config(text="빌드 시작...")
 
-        # 파일 확인 버튼 비활성화
+        # 파일 확인/번들 구성 버튼 비활성화
         self.open_output_btn.config(state="disabled")
+        self.bundle_btn.config(state="disabled")
 
         # 시작 시간 기록 및 로그에 표시
         start_time = datetime.now()
-        self.log_text.insert(tk.END, f"[{start_time.strftime('%H:%M:%S')}] 빌드 시작...\n", "info")
-        self.log_text.see(tk.END)
+        self.begin_log_file("build")
+        self.log_message(f"[{start_time.strftime('%H:%M:%S')}] 빌드 시작...\n", "info")
 
         # 안전 모드가 켜져 있고 가상환경이 생성되어 있는지 확인
         use_venv = False
         venv_dir = None
 
-        if self.safe_module_var.get():
-            # 스크립트 경로에서 디렉토리 추출
-            script_dir = os.path.dirname(self.script_path.get())
-            venv_dir = os.path.join(script_dir, "temp_venv")
+        if self.safe_module_var.get() and self.venv_dir:
+            # 명령어 생성 시 준비된 캐시 가상환경 사용
+            venv_dir = self.venv_dir
 
-            if os.path.exists(venv_dir) and os.path.isdir(venv_dir):
+            if os.path.exists(build_env.venv_executable(venv_dir, "pyinstaller")):
                 use_venv = True
-                self.log_text.insert(tk.END, f"가상환경을 사용하여 빌드합니다: {venv_dir}\n", "info")
-                self.log_text.see(tk.END)
+                self.log_message(f"가상환경을 사용하여 빌드합니다: {venv_dir}\n", "info")
+
+        # 작업 폴더 배정과 --clean 여부 (명령어 생성 후 빌드 환경이 바뀌었으면 지금 정리)
+        project, clean, clean_reasons = workpath.prepare(self.get_project_data(), venv_dir if use_venv else None)
+        command = project_model.build_command(project)
+        self.log_workpath(project, clean, clean_reasons)
+
+        # spec 빌드면 설정이 바뀐 경우에만 spec 파일을 다시 생성
+        if project_model.uses_spec(project):
+            try:
+                spec_path, regenerated = spec_builder.ensure_spec(project)
+            except (OSError, ValueError) as e:
+                self.log_message(f"spec 파일 생성 실패: {str(e)}\n", "error")
+                self.progress_label.config(text="spec 파일 생성 실패!")
+                self.finish_build()
+                return
+            self.log_message(f"spec 파일: {spec_path} ({'다시 생성' if regenerated else '변경 없음'})\n", "info")
+        skip_unchanged = self.skip_unchanged_var.get()
+        profile_startup = self.profile_startup_var.get()
 
         # 명령어 실행 스레드
         def run_command():
             try:
-                # 가상환경에서 실행할지 결정
-                if use_venv:
-                    # 가상환경의 PyInstaller 경로
-                    pyinstaller_path = os.path.join(venv_dir, "Scripts",
-                                                    "pyinstaller.exe") if os.name == "nt" else os.path.join(venv_dir,
-                                                                                                            "bin",
-                                                                                                            "pyinstaller")
-
-                    # 명령어에서 'pyinstaller' 부분을 가상환경의 pyinstaller 경로로 대체
-                    venv_command = command.replace("pyinstaller", f'"{pyinstaller_path}"', 1)
-
-                    self.log_text.insert(tk.END, f"가상환경에서 실행하는 명령어: {venv_command}\n", "info")
-                    self.log_text.see(tk.END)
-
-                    # 가상환경에서 명령 실행
-                    process = subprocess.Popen(
-                        venv_command,
-                        shell=True,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        encoding='cp949',  # Windows 한국어 환경에 맞는 인코딩
-                        errors='replace',  # 디코딩할 수 없는 바이트는 대체 문자로 대체
-                        text=True,
-                        bufsize=1,
-                        universal_newlines=True
-                    )
-                else:
-                    # 일반 환경에서 명령 실행
-                    process = subprocess.Popen(
-                        command,
-                        shell=True,
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        encoding='cp949',  # Windows 한국어 환경에 맞는 인코딩
-                        errors='replace',  # 디코딩할 수 없는 바이트는 대체 문자로 대체
-                        text=True,
-                        bufsize=1,
-                        universal_newlines=True
-                    )
-
-                # 진행 상태 추적을 위한 키워드
-                progress_keywords = {
-                    "Determining": 5,
-                    "Analyzing": 10,
-                    "Processing": 30,
-                    "Checking": 50,
-                    "Building": 70,
-                    "Building EXE": 80,
-                    "Copying": 90,
-                    "Completed": 100
-                }
-
-                # 표준 출력 처리 함수
-                def read_output(pipe, is_error=False):
-                    for line in iter(pipe.readline, ''):
-                        timestamp = datetime.now().strftime('%H:%M:%S')
-
-                        # GUI 업데이트는 메인 스레드에서 해야 함
-                        if is_error and "ERROR" in line:
-                            self.root.after(0, lambda l=line, t=timestamp: (
-                                self.log_text.insert(tk.END, f"[{t}] {l}", "error"),
-                                self.log_text.see(tk.END)
-                            ))
-                        elif is_error and "WARNING" in line:
-                            self.root.after(0, lambda l=line, t=timestamp: (
-                                self.log_text.insert(tk.END, f"[{t}] {l}", "warning"),
-                                self.log_text.see(tk.END)
-                            ))
+                # 입력 지문 확인 (스크립트 임포트 전체, 데이터/리소스 파일, 옵션, 빌드 환경)
+                graph = import_analysis.analyze_scripts(project_model.entry_scripts(project))
+                signatures = build_state.input_signatures(project, command, graph, venv_dir if use_venv else None)
+                up_to_date, reasons = build_state.check_up_to_date(project, signatures)
+                if up_to_date and skip_unchanged:
+                    self.log_message("변경 사항이 없어 빌드를 건너뜁니다 "
+                                                "(입력과 결과물이 마지막 성공 빌드와 같음).\n", "success")
+                    self.root.after(0, lambda: self.progress_var.set(100))
+                    self.root.after(0, lambda: self.progress_label.config(text="변경 없음 - 빌드 생략"))
+                    self.root.after(0, lambda: self.open_output_btn.config(state="normal"))
+                    return
+                for reason in reasons[:20]:
+                    self.log_message(f"다시 빌드하는 이유: {reason}\n", "info")
+                if len(reasons) > 20:
+                    self.log_message(f"... 외 {len(reasons) - 20}개\n", "info")
+
+                # 셸 없이 인자 목록으로 실행 (가상환경이면 가상환경의 pyinstaller)
+                argv = build_runner.pyinstaller_argv(venv_dir if use_venv else None) + command[1:]
+                self.log_message(f"실행하는 명령어: {project_model.command_line(argv)}\n", "info")
+                # 빌드 기록의 소요 시간은 헤드리스 빌드와 같이 PyInstaller 실행 구간만 잼
+                build_started = time.time()
+
+                # 출력은 로그 대기열에만 넣고 화면 반영은 flush_log_queue 가 주기적으로 처리
+                def build_log(message, tag=None):
+                    self.log_message(f"[{datetime.now().strftime('%H:%M:%S')}] {message}", tag)
+
+                # 진행 상태는 마지막 값만 남겨 다음 주기에 반영
+                def on_phase(percent, label):
+                    self.pending_build_progress = (percent, f"{label}... ({percent}%)")
+
+                # 헤드리스 빌드와 같은 실행 경로 (단계 추적, 변형 매트릭스 포함)
+                returncode, tracker = build_runner.run_build(project, argv, build_log, cancel_event,
+                                                             on_phase=on_phase)
+                build_duration = time.time() - build_started
+                self.pending_build_progress = None
+
+                # 성공한 빌드의 입력 지문 저장 (실패하면 다음에 반드시 다시 빌드)
+                try:
+                    if returncode == 0:
+                        build_state.record_success(project, signatures)
+                        if project["managed_workpath"]:
+                            workpath.record(project, venv_dir if use_venv else None)
+                    else:
+                        build_state.invalidate(project)
+                        if project["managed_workpath"]:
+                            workpath.discard(project)
+                except OSError as e:
+                    self.log_message(f"빌드 상태 저장 실패: {str(e)}\n", "warning")
+
+                # 단계별 타이밍 보고서 저장
+                report = tracker.report(app_name=project_model.app_name_of(project),
+                                        script_path=project["script_path"],
+                                        status="success" if returncode == 0 else "failed")
+                for summary_line in build_phases.format_summary(report):
+                    self.log_message(summary_line, "info")
+                try:
+                    report_path = build_phases.write_report(build_phases.report_path(project), report)
+                    self.log_message(f"타이밍 보고서: {report_path}\n", "info")
+                except OSError as e:
+                    self.log_message(f"타이밍 보고서 저장 실패: {str(e)}\n", "warning")
+
+                # 빌드 기록 저장 및 최근 빌드 대비 회귀 확인
+                record = None
+                try:
+                    record = self.build_history.record(
+                        project, report["status"], returncode, build_duration, tracker.durations())
+                    regressions = self.build_history.regressions(project, build=record)
+                    for regression_line in build_history.format_regressions(regressions):
+                        self.log_message(regression_line, "warning")
+                except Exception as e:
+                    self.log_message(f"빌드 기록 저장 실패: {str(e)}\n", "warning")
+
+                # 결과 실행 파일의 시작 시간 측정 후 빌드 기록에 저장
+                if returncode == 0 and profile_startup and project["variants"]:
+                    self.log_message("변형 매트릭스 빌드의 시작 시간은 헤드리스 빌드의 "
+                                                "--profile-startup 으로 측정합니다.\n", "info")
+                elif returncode == 0 and profile_startup:
+                    self.root.after(0, lambda: self.progress_label.config(text="시작 시간 측정 중..."))
+                    try:
+                        profile = startup_profiler.profile_build(project, log=self.log_message)
+                        if profile is None:
+                            self.log_message("시작 시간 측정 실패: 실행 파일을 찾을 수 없습니다\n", "warning")
                         else:
-                            self.root.after(0, lambda l=line, t=timestamp: (
-                                self.log_text.insert(tk.END, f"[{t}] {l}"),
-                                self.log_text.see(tk.END)
-                            ))
-
-                        # 진행 상태 업데이트
-                        for keyword, progress in progress_keywords.items():
-                            if keyword in line:
-                                self.root.after(0, lambda p=progress: self.progress_var.set(p))
-                                self.root.after(0, lambda l=line: self.progress_label.config(text=l.strip()))
-                                break
-
-                        # 실시간 업데이트를 위해 잠시 대기
-                        time.sleep(0.01)
-
-                # 출력 및 에러 스트림을 별도 스레드에서 읽기
-                stdout_thread = threading.Thread(target=read_output, args=(process.stdout, False))
-                stderr_thread = threading.Thread(target=read_output, args=(process.stderr, True))
-
-                stdout_thread.daemon = True
-                stderr_thread.daemon = True
-
-                stdout_thread.start()
-                stderr_thread.start()
-
-                # 프로세스 완료 대기
-                process.wait()
-
-                # 스레드 완료 대기
-                stdout_thread.join()
-                stderr_thread.join()
+                            for profile_line in startup_profiler.format_profile(profile):
+                                self.log_message(profile_line, "info")
+                            if record is not None:
+                                self.build_history.record_startup(record["id"], profile)
+                    except Exception as e:
+                        self.log_message(f"시작 시간 측정 실패: {str(e)}\n", "warning")
 
                 # 종료 시간 기록
                 end_time = datetime.now()
                 duration = end_time - start_time
 
-                if process.returncode == 0:
+                if returncode == 0:
                     self.root.after(0, lambda: self.progress_var.set(100))
                     self.root.after(0, lambda: self.progress_label.config(text="빌드 완료!"))
-                    self.root.after(0, lambda: self.log_text.insert(tk.END,
-                                                                    f"[{end_time.strftime('%H:%M:%S')}] 빌드 완료! (소요 시간: {duration.seconds}초)\n",
-                                                                    "success"))
+                    self.log_message(
+                        f"[{end_time.strftime('%H:%M:%S')}] 빌드 완료! (소요 시간: {duration.seconds}초)\n", "success")
 
                     # 빌드 결과 정보 표시
                     self.root.after(0, lambda: self.show_build_results())
@@ -1491,37 +1775,90 @@ class PyInstallerGUI:
                     self.root.after(0, lambda: messagebox.showinfo("빌드 완료", "PyInstaller 빌드가 성공적으로 완료되었습니다."))
                 else:
                     self.root.after(0, lambda: self.progress_label.config(text="빌드 실패!"))
-                    self.root.after(0, lambda: self.log_text.insert(tk.END,
-                                                                    f"[{end_time.strftime('%H:%M:%S')}] 빌드 실패! (소요 시간: {duration.seconds}초)\n",
-                                                                    "error"))
+                    self.log_message(
+                        f"[{end_time.strftime('%H:%M:%S')}] 빌드 실패! (소요 시간: {duration.seconds}초)\n", "error")
                     self.root.after(0,
                                     lambda: messagebox.showerror("빌드 실패", "PyInstaller 빌드 중 오류가 발생했습니다. 로그를 확인해주세요."))
 
+            except build_env.BuildCancelled:
+                self.pending_build_progress = None
+                build_state.invalidate(project)
+                self.log_message("빌드가 취소되었습니다.\n", "warning")
+                self.root.after(0, lambda: self.progress_label.config(text="빌드 취소됨"))
+
             except Exception as e:
-                self.root.after(0, lambda: self.log_text.insert(tk.END, f"명령어 실행 중 오류 발생: {str(e)}\n", "error"))
+                self.log_message(f"명령어 실행 중 오류 발생: {str(e)}\n", "error")
                 self.root.after(0, lambda: self.progress_label.config(text="오류 발생!"))
                 self.root.after(0, lambda: messagebox.showerror("오류", f"명령어 실행 중 오류가 발생했습니다: {str(e)}"))
 
             finally:
+                if use_venv:
+                    build_env.unpin(venv_dir)
                 # 상태 업데이트
-                self.root.after(0, lambda: self.status_bar.config(text="명령어 실행 완료"))
+                self.root.after(0, self.finish_build)
+
+        # 빌드가 끝날 때까지 사용하는 가상환경이 캐시 정리로 지워지지 않도록 고정
+        if use_venv:
+            build_env.pin(venv_dir)
 
         # 스레드 시작
+        cancel_event = threading.Event()
+        self.build_cancel_event = cancel_event
+        self.build_running = True
+        self.generate_btn.config(state="disabled")
+        self.execute_btn.config(state="disabled")
+        self.cancel_btn.config(state="normal")
         threading.Thread(target=run_command, daemon=True).start()
 
         # 상태 업데이트
         self.status_bar.config(text="명령어 실행 중...")
 
+    def show_build_history(self):
+        """현재 프로젝트의 빌드 기록 추세와 회귀 여부를 로그에 표시"""
+        project = self.get_project_data()
+        if not project["script_path"]:
+            messagebox.showwarning("경고", "Python 파일을 먼저 선택해주세요.")
+            return
+
+        try:
+            builds = self.build_history.builds(project)
+            regressions = self.build_history.regressions(project)
+            profiles = self.build_history.startup_profiles(project)
+        except Exception as e:
+            messagebox.showerror("오류", f"빌드 기록을 불러오는 중 오류 발생: {str(e)}")
+            return
+
+        if not builds:
+            self.log_message("이 프로젝트의 빌드 기록이 없습니다.\n", "info")
+            return
+
+        self.log_message(f"=== 빌드 기록: {project_model.app_name_of(project)} (최근 {len(builds)}개) ===\n", "info")
+        for line in build_history.format_report(builds):
+            self.log_message(line)
+        startup_lines = build_history.format_startup_report(builds, profiles)
+        if startup_lines:
+            self.log_message("시작 시간(초)과 최대 메모리 (측정 횟수의 중앙값):\n", "info")
+            for line in startup_lines:
+                self.log_message(line)
+        for line in build_history.format_regressions(regressions):
+            self.log_message(line, "warning")
+        self.log_message("=======================\n", "info")
+
     def clear_log(self):
         """로그 내용 지우기"""
+        self.log_queue.clear()
         self.log_text.delete("1.0", tk.END)
 
     def save_log(self):
-        """로그 내용 파일로 저장"""
-        log_content = self.log_text.get("1.0", tk.END)
-        if not log_content.strip():
-            messagebox.showinfo("알림", "저장할 로그 내용이 없습니다.")
-            return
+        """로그 내용 파일로 저장 (최근 작업의 로그 파일이 있으면 전체 로그를 복사)"""
+        # 로그 창에는 최근 줄만 남으므로 로그 파일이 있으면 그것을 저장
+        log_path = self.log_queue.last_log_path
+        log_content = None
+        if not log_path:
+            log_content = self.log_text.get("1.0", tk.END)
+            if not log_content.strip():
+                messagebox.showinfo("알림", "저장할 로그 내용이 없습니다.")
+                return
 
         file_path = filedialog.asksaveasfilename(
             title="로그 저장",
@@ -1531,12 +1868,63 @@ class PyInstallerGUI:
 
         if file_path:
             try:
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    f.write(log_content)
+                if log_path:
+                    log_pipeline.copy_log(log_path, file_path)
+                else:
+                    with open(file_path, 'w', encoding='utf-8') as f:
+                        f.write(log_content)
                 messagebox.showinfo("성공", "로그가 저장되었습니다.")
             except Exception as e:
                 messagebox.showerror("오류", f"로그 저장 중 오류 발생: {str(e)}")
 
+    def get_project_data(self):
+        """현재 설정을 프로젝트 설정(Project)으로 반환"""
+        return project_model.new_project(**{
+            "script_path": self.script_path.get(),
+            "extra_scripts": self.extra_scripts,
+            "app_name": self.app_name.get(),
+            "output_dir": self.output_dir.get(),
+            "work_dir": self.work_dir.get(),
+            "build_type": self.build_type.get(),
+            "console_option": self.console_option.get(),
+            "clean_build": self.clean_build.get(),
+            "managed_workpath": self.managed_workpath.get(),
+            "no_confirm": self.no_confirm.get(),
+            "log_level": self.log_level.get(),
+            "use_upx": self.use_upx.get(),
+            "upx_dir": self.upx_dir.get(),
+            "noupx": self.noupx.get(),
+            "strip": self.strip.get(),
+            "ascii": self.ascii.get(),
+            "uac_admin": self.uac_admin.get(),
+            "uac_uiaccess": self.uac_uiaccess.get(),
+            "win_private_assemblies": self.win_private_assemblies.get(),
+            "win_no_prefer_redirects": self.win_no_prefer_redirects.get(),
+            "use_spec": self.use_spec.get(),
+            "variants": [name for name, var in self.variant_vars.items() if var.get()],
+            "noarchive": self.noarchive.get(),
+            "optimize": int(self.optimize.get()),
+            "upx_exclude": self.split_list(self.upx_exclude.get()),
+            "toc_excludes": self.split_list(self.toc_excludes.get()),
+            "spec_overrides": self.spec_overrides,
+            "data_files": self.data_files,
+            "binary_files": self.binary_files,
+            "hidden_imports": self.hidden_imports,
+            "exclude_modules": self.exclude_modules,
+            "hooks_dirs": self.hooks_dirs,
+            "runtime_hooks": self.runtime_hooks,
+            "icon_file": self.icon_file.get(),
+            "version_file": self.version_file.get(),
+            "manifest_file": self.manifest_file.get(),
+            "resources": self.resources,
+            "file_version": self.file_version.get(),
+            "product_version": self.product_version.get(),
+            "company_name": self.company_name.get(),
+            "product_name": self.product_name.get(),
+            "wheelhouse": self.wheelhouse_dir.get(),
+            "import_profile": self.import_profile
+        })
+
     def save_project(self):
         """현재 설정을 프로젝트 파일로 저장"""
         file_path = filedialog.asksaveasfilename(
@@ -1547,43 +1935,7 @@ class PyInstallerGUI:
 
         if file_path:
             try:
-                project_data = {
-                    "script_path": self.script_path.get(),
-                    "app_name": self.app_name.get(),
-                    "output_dir": self.output_dir.get(),
-                    "work_dir": self.work_dir.get(),
-                    "build_type": self.build_type.get(),
-                    "console_option": self.console_option.get(),
-                    "clean_build": self.clean_build.get(),
-                    "no_confirm": self.no_confirm.get(),
-                    "log_level": self.log_level.get(),
-                    "use_upx": self.use_upx.get(),
-                    "upx_dir": self.upx_dir.get(),
-                    "noupx": self.noupx.get(),
-                    "strip": self.strip.get(),
-                    "ascii": self.ascii.get(),
-                    "uac_admin": self.uac_admin.get(),
-                    "uac_uiaccess": self.uac_uiaccess.get(),
-                    "win_private_assemblies": self.win_private_assemblies.get(),
-                    "win_no_prefer_redirects": self.win_no_prefer_redirects.get(),
-                    "data_files": self.data_files,
-                    "binary_files": self.binary_files,
-                    "hidden_imports": self.hidden_imports,
-                    "exclude_modules": self.exclude_modules,
-                    "hooks_dirs": self.hooks_dirs,
-                    "runtime_hooks": self.runtime_hooks,
-                    "icon_file": self.icon_file.get(),
-                    "version_file": self.version_file.get(),
-                    "manifest_file": self.manifest_file.get(),
-                    "resources": self.resources,
-                    "file_version": self.file_version.get(),
-                    "product_version": self.product_version.get(),
-                    "company_name": self.company_name.get(),
-                    "product_name": self.product_name.get()
-                }
-
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(project_data, f, indent=2, ensure_ascii=False)
+                project_model.save_project(file_path, self.get_project_data())
 
                 # 최근 프로젝트에 추가
                 if file_path not in self.recent_projects:
@@ -1610,13 +1962,17 @@ class PyInstallerGUI:
     def load_project_from_file(self, file_path):
         """파일에서 프로젝트 설정 불러오기"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                project_data = json.load(f)
+            project_data = project_model.load_project(file_path)
 
             # 기본 설정 불러오기
             if "script_path" in project_data:
                 self.script_path.set(project_data["script_path"])
 
+            self.extra_scripts = list(project_data.get("extra_scripts", []))
+            self.extra_script_listbox.delete(0, tk.END)
+            for extra_script in self.extra_scripts:
+                self.extra_script_listbox.insert(tk.END, extra_script)
+
             if "app_name" in project_data:
                 self.app_name.set(project_data["app_name"])
 
@@ -1635,6 +1991,10 @@ class PyInstallerGUI:
             if "clean_build" in project_data:
                 self.clean_build.set(project_data["clean_build"])
 
+            if "managed_workpath" in project_data:
+                self.managed_workpath.set(project_data["managed_workpath"])
+                self.update_clean_check()
+
             if "no_confirm" in project_data:
                 self.no_confirm.set(project_data["no_confirm"])
 
@@ -1670,6 +2030,18 @@ class PyInstallerGUI:
             if "win_no_prefer_redirects" in project_data:
                 self.win_no_prefer_redirects.set(project_data["win_no_prefer_redirects"])
 
+            # spec 빌드 설정 불러오기
+            self.use_spec.set(project_data.get("use_spec", False))
+            variants = project_data.get("variants", [])
+            for name, var in self.variant_vars.items():
+                var.set(name in variants)
+            self.noarchive.set(project_data.get("noarchive", False))
+            self.optimize.set(str(project_data.get("optimize", 0)))
+            self.upx_exclude.set(", ".join(project_data.get("upx_exclude", [])))
+            self.toc_excludes.set(", ".join(project_data.get("toc_excludes", [])))
+            self.spec_overrides = project_data.get("spec_overrides") or {}
+            self.update_spec_overrides_label()
+
             # 데이터 파일 불러오기
             if "data_files" in project_data:
                 self.data_files = project_data["data_files"]
@@ -1742,6 +2114,17 @@ class PyInstallerGUI:
             if "product_name" in project_data:
                 self.product_name.set(project_data["product_name"])
 
+            # 휠하우스 불러오기
+            if "wheelhouse" in project_data:
+                self.wheelhouse_dir.set(project_data["wheelhouse"])
+
+            # 임포트 시간 측정 결과 불러오기
+            self.import_profile = project_data.get("import_profile")
+            self.refresh_import_profile_view()
+
+            # 프로젝트의 숨겨진 임포트를 유지하도록 경로 변경에 따른 자동 분석 취소
+            self.cancel_path_analysis()
+
             # 최근 프로젝트에 추가
             if file_path not in self.recent_projects:
                 self.recent_projects.insert(0, file_path)
@@ -1794,6 +2177,8 @@ class PyInstallerGUI:
 
 
 def main():
+    # 실행 파일로 빌드된 경우 임포트 분석 프로세스 풀이 동작하도록 설정
+    multiprocessing.freeze_support()
     root = tk.Tk()
     app = PyInstallerGUI(root)
     root.mainloop()
@@ -0,0 +1,307 @@
+"""PyInstaller 명령 생성기 헤드리스 실행 (Tk 없이 .pyinstaller 프로젝트 파일 빌드)
+
+사용 예:
+    python pyinstaller_command_generator_cli.py myapp.pyinstaller --safe
+    python pyinstaller_command_generator_cli.py myapp.pyinstaller --dry-run
+    python pyinstaller_command_generator_cli.py a.pyinstaller b.pyinstaller --jobs 2 --priority b.pyinstaller=10
+    python pyinstaller_command_generator_cli.py myapp.pyinstaller --report
+    python pyinstaller_command_generator_cli.py myapp.pyinstaller --suggest-excludes --apply-excludes
+    python pyinstaller_command_generator_cli.py myapp.pyinstaller --profile-startup --compare-modes
+    python pyinstaller_command_generator_cli.py myapp.pyinstaller --import-profile --safe
+    python pyinstaller_command_generator_cli.py myapp.pyinstaller --variants onefile-noconsole-release,onedir-console-debug
+
+빌드 로그는 표준 오류로, 결과는 JSON 으로 표준 출력에 기록된다.
+"""
+import sys
+import json
+import argparse
+import threading
+import multiprocessing
+
+import build_env
+import build_history
+import build_runner
+import build_scheduler
+import exclude_advisor
+import import_analysis
+import import_profiler
+import log_pipeline
+import project_model
+import startup_profiler
+import variant_matrix
+
+
+# 종료 코드 0 으로 처리하는 빌드 상태
+SUCCESS_STATUSES = ("success", "dry-run", "up-to-date")
+
+
+def parse_args(argv=None):
+    """명령행 인자 해석"""
+    parser = argparse.ArgumentParser(
+        description="GUI 없이 .pyinstaller 프로젝트 파일을 분석하고 빌드합니다.")
+    parser.add_argument("projects", nargs="+", metavar="project",
+                        help="GUI에서 저장한 프로젝트 파일 (.pyinstaller / .json), 여러 개면 동시 빌드")
+    parser.add_argument("--safe", action="store_true",
+                        help="캐시된 가상환경에 의존성을 설치한 뒤 그 안에서 빌드 (안전 모드)")
+    parser.add_argument("--wheelhouse", help="오프라인 설치에 사용할 휠하우스 폴더 (프로젝트 설정보다 우선)")
+    parser.add_argument("--no-analyze", action="store_true",
+                        help="프로젝트 임포트 분석 결과를 숨겨진 임포트에 합치지 않음")
+    parser.add_argument("--dry-run", action="store_true", help="빌드하지 않고 명령어만 출력")
+    parser.add_argument("--force", action="store_true",
+                        help="입력이 마지막 성공 빌드와 같아도 PyInstaller 를 다시 실행")
+    parser.add_argument("-j", "--jobs", type=int,
+                        help="동시에 실행할 빌드 수 (기본: 코어 수와 사용 가능한 메모리로 계산)")
+    parser.add_argument("--priority", action="append", default=[], metavar="PROJECT=N",
+                        help="프로젝트별 우선순위 (클수록 먼저 빌드, 여러 번 지정 가능)")
+    parser.add_argument("--batch-dir", default="batch_builds",
+                        help="여러 프로젝트 빌드 시 작업별 build/dist 폴더를 만들 위치")
+    parser.add_argument("--log-dir", default=log_pipeline.DEFAULT_LOG_DIR,
+                        help="빌드별 로그 파일을 기록할 폴더 (오래된 로그는 압축 후 보관 한도에 따라 삭제)")
+    parser.add_argument("--no-log-file", action="store_true", help="빌드 로그 파일을 남기지 않음")
+    parser.add_argument("--no-history", action="store_true", help="빌드 결과를 빌드 기록에 저장하지 않음")
+    parser.add_argument("--report", action="store_true",
+                        help="빌드하지 않고 프로젝트의 빌드 기록 추세와 회귀 여부 출력")
+    parser.add_argument("--report-limit", type=int, default=20, help="추세 보고서에 표시할 최근 빌드 수")
+    parser.add_argument("--threshold", type=float, default=build_history.DEFAULT_THRESHOLD,
+                        help="최근 빌드 중앙값 대비 이 비율 이상 늘면 회귀로 표시 (기본 0.2)")
+    parser.add_argument("--suggest-excludes", action="store_true",
+                        help="빌드하지 않고 마지막 빌드의 모듈 그래프로 제외 모듈 추천")
+    parser.add_argument("--apply-excludes", action="store_true",
+                        help="위험이 낮은 추천 모듈을 프로젝트 파일의 제외 모듈에 추가 (--suggest-excludes 와 함께)")
+    parser.add_argument("--include-review", action="store_true",
+                        help="--apply-excludes 시 검토가 필요한 추천도 추가")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="빌드 후 결과 실행 파일을 여러 번 실행해 시작 시간과 최대 메모리 측정 (단일 프로젝트)")
+    parser.add_argument("--profile-runs", type=int, default=startup_profiler.DEFAULT_RUNS,
+                        help="시작 시간 측정 실행 횟수 (첫 번째는 콜드, 나머지는 웜)")
+    parser.add_argument("--profile-timeout", type=float, default=startup_profiler.DEFAULT_TIMEOUT,
+                        help="측정 실행 한 번의 제한 시간(초), 넘으면 강제 종료")
+    parser.add_argument("--compare-modes", action="store_true",
+                        help="onefile 과 onedir 로 각각 빌드해 크기와 시작 시간 비교")
+    parser.add_argument("--import-profile", action="store_true",
+                        help="빌드 환경에서 진입 스크립트의 임포트 시간을 측정해 프로젝트 파일에 저장")
+    parser.add_argument("--import-profile-script", action="store_true",
+                        help="임포트 문만이 아니라 스크립트 전체를 실행해 측정")
+    parser.add_argument("--import-profile-timeout", type=float, default=import_profiler.DEFAULT_TIMEOUT,
+                        help="임포트 시간 측정 제한 시간(초)")
+    parser.add_argument("--variants", metavar="VARIANT[,VARIANT...]",
+                        help="한 번의 분석으로 빌드할 변형 목록 (예: onedir-console-release, 전체는 all), "
+                             "프로젝트 파일의 variants 보다 우선")
+    parser.add_argument("-q", "--quiet", action="store_true", help="빌드 로그 출력 안 함")
+    return parser.parse_args(argv)
+
+
+def parse_priorities(values):
+    """PROJECT=N 형식의 우선순위 목록을 dict 로 변환"""
+    priorities = {}
+    for value in values:
+        project, _, priority = value.rpartition("=")
+        if not project:
+            raise ValueError(f"우선순위 형식이 잘못되었습니다: {value}")
+        priorities[project] = int(priority)
+    return priorities
+
+
+def load_project(project_path, args=None):
+    """프로젝트 파일을 불러와 (빌드면) 명령행의 --variants 를 적용하고 값 검증 (문제가 있으면 ValueError)"""
+    project = project_model.Project.load(project_path)
+    if args is not None and args.variants:
+        project["variants"] = variant_matrix.parse_variants(args.variants)
+    return project.validate()
+
+
+def run_single(args, log):
+    """프로젝트 하나를 현재 폴더에서 빌드"""
+    project_path = args.projects[0]
+    try:
+        project = load_project(project_path, args)
+    except Exception as e:
+        json.dump({"project": project_path, "status": "failed",
+                   "error": f"프로젝트 불러오기 중 오류 발생: {str(e)}"}, sys.stdout, ensure_ascii=False)
+        sys.stdout.write("\n")
+        return 2
+
+    try:
+        result = build_runner.build_project(
+            project, safe_mode=args.safe, analyze=not args.no_analyze,
+            wheelhouse=args.wheelhouse, dry_run=args.dry_run, log=log,
+            log_dir=None if args.no_log_file else args.log_dir,
+            history=None if args.no_history else build_history.BuildHistory(), force=args.force,
+            profile_runs=args.profile_runs if args.profile_startup else 0, profile_timeout=args.profile_timeout)
+    except build_env.BuildCancelled:
+        result = {"status": "cancelled"}
+
+    result["project"] = project_path
+    json.dump(result, sys.stdout, indent=2, ensure_ascii=False)
+    sys.stdout.write("\n")
+    return 0 if result["status"] in SUCCESS_STATUSES else 1
+
+
+def run_batch(args, log):
+    """여러 프로젝트를 대기열에 넣고 동시에 빌드"""
+    scheduler = build_scheduler.BuildScheduler(
+        args.batch_dir, max_workers=args.jobs, safe_mode=args.safe, analyze=not args.no_analyze,
+        wheelhouse=args.wheelhouse, dry_run=args.dry_run,
+        log_dir=None if args.no_log_file else args.log_dir,
+        history=None if args.no_history else build_history.BuildHistory(), force=args.force)
+    try:
+        priorities = parse_priorities(args.priority)
+        for project_path in args.projects:
+            scheduler.add(project_path, priorities.get(project_path, 0), load_project(project_path, args))
+    except Exception as e:
+        json.dump({"status": "failed", "error": f"프로젝트 불러오기 중 오류 발생: {str(e)}"},
+                  sys.stdout, ensure_ascii=False)
+        sys.stdout.write("\n")
+        return 2
+
+    log(f"{len(scheduler.jobs)}개 프로젝트를 최대 {scheduler.max_workers}개씩 동시에 빌드합니다.\n")
+    try:
+        summary = scheduler.run(log=log)
+    except KeyboardInterrupt:
+        scheduler.cancel()
+        raise
+
+    json.dump(summary, sys.stdout, indent=2, ensure_ascii=False)
+    sys.stdout.write("\n")
+    ok = all(job.status in SUCCESS_STATUSES for job in scheduler.jobs)
+    return 0 if ok else 1
+
+
+def run_compare_modes(args, log):
+    """프로젝트를 onefile 과 onedir 로 각각 빌드하고 크기와 시작 시간 비교표 출력"""
+    project_path = args.projects[0]
+    try:
+        project = load_project(project_path)
+    except Exception as e:
+        sys.stderr.write(f"프로젝트 불러오기 중 오류 발생: {project_path} - {str(e)}\n")
+        return 2
+
+    output_root = project["output_dir"] or "dist"
+    results = {}
+    profiles = []
+    for build_type in ("--onefile", "--onedir"):
+        variant = startup_profiler.variant_project(project, build_type, output_root)
+        log(f"== {build_type} 빌드: {variant['output_dir']}\n", "info")
+        try:
+            result = build_runner.build_project(
+                variant, safe_mode=args.safe, analyze=not args.no_analyze, wheelhouse=args.wheelhouse,
+                log=log, log_dir=None if args.no_log_file else args.log_dir,
+                history=None if args.no_history else build_history.BuildHistory(), force=args.force,
+                profile_runs=max(1, args.profile_runs), profile_timeout=args.profile_timeout)
+        except build_env.BuildCancelled:
+            result = {"status": "cancelled"}
+        results[build_type.lstrip("-")] = result
+        if result.get("startup"):
+            profiles.append(result["startup"])
+
+    if profiles:
+        for line in startup_profiler.format_comparison(profiles):
+            log(line, "info")
+    json.dump({"project": project_path, "modes": results}, sys.stdout, indent=2, ensure_ascii=False)
+    sys.stdout.write("\n")
+    return 0 if all(r["status"] in SUCCESS_STATUSES for r in results.values()) else 1
+
+
+def run_report(args):
+    """프로젝트별 빌드 기록 추세와 최근 빌드의 회귀 여부 출력"""
+    history = build_history.BuildHistory()
+    status = 0
+    for project_path in args.projects:
+        try:
+            project = load_project(project_path)
+        except Exception as e:
+            sys.stderr.write(f"프로젝트 불러오기 중 오류 발생: {project_path} - {str(e)}\n")
+            status = 2
+            continue
+
+        builds = history.builds(project, args.report_limit)
+        sys.stdout.write(f"== {project_path} ({project_model.app_name_of(project)}) - 최근 {len(builds)}개 빌드\n")
+        sys.stdout.writelines(build_history.format_report(builds, threshold=args.threshold))
+        startup = build_history.format_startup_report(builds, history.startup_profiles(project, args.report_limit))
+        if startup:
+            sys.stdout.write("시작 시간(초)과 최대 메모리 (측정 횟수의 중앙값):\n")
+            sys.stdout.writelines(startup)
+        regressions = history.regressions(project, threshold=args.threshold)
+        if regressions:
+            sys.stdout.writelines(build_history.format_regressions(regressions))
+            status = status or 1
+        sys.stdout.write("\n")
+    return status
+
+
+def run_suggest_excludes(args):
+    """프로젝트별 제외 모듈 추천 출력 (요청 시 프로젝트 파일에 적용)"""
+    status = 0
+    for project_path in args.projects:
+        try:
+            project = load_project(project_path)
+            recommendations, total_saving = exclude_advisor.suggest_excludes(project)
+        except Exception as e:
+            sys.stderr.write(f"제외 모듈 분석 실패: {project_path} - {str(e)}\n")
+            status = 2
+            continue
+        sys.stdout.write(f"== {project_path} ({project_model.app_name_of(project)})\n")
+        sys.stdout.writelines(exclude_advisor.format_recommendations(recommendations, total_saving))
+        if args.apply_excludes:
+            modules = [r["module"] for r in recommendations if args.include_review or r["risk"] == "low"]
+            added = exclude_advisor.apply_excludes(project, modules)
+            if added:
+                project.save(project_path)
+            sys.stdout.write(f"프로젝트 파일에 추가한 제외 모듈: {', '.join(added) or '없음'}\n")
+        sys.stdout.write("\n")
+    return status
+
+
+def run_import_profile(args, log):
+    """프로젝트별 임포트 시간을 (안전 모드면 캐시 가상환경에서) 측정해 출력하고 프로젝트 파일에 저장"""
+    status = 0
+    mode = import_profiler.MODE_SCRIPT if args.import_profile_script else import_profiler.MODE_IMPORTS
+    for project_path in args.projects:
+        try:
+            project = load_project(project_path)
+            venv_dir = None
+            if args.safe:
+                graph = import_analysis.analyze_scripts(project_model.entry_scripts(project))
+                wheelhouse = args.wheelhouse or project["wheelhouse"] or None
+                venv_dir, _ = build_env.prepare_environment(graph.top_level_imports(), wheelhouse=wheelhouse, log=log)
+            result = import_profiler.profile_project(project, venv_dir, mode, args.import_profile_timeout)
+        except Exception as e:
+            sys.stderr.write(f"임포트 시간 측정 실패: {project_path} - {str(e)}\n")
+            status = 2
+            continue
+        summary = import_profiler.summarize(result)
+        project["import_profile"] = summary
+        project.save(project_path)
+        sys.stdout.write(f"== {project_path} ({project_model.app_name_of(project)})\n")
+        sys.stdout.writelines(import_profiler.format_summary(summary))
+        sys.stdout.write("\n")
+    return status
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    log_lock = threading.Lock()
+
+    def log(message, tag=None):
+        if not args.quiet:
+            # 동시 빌드의 로그 줄이 섞이지 않도록 한 줄씩 기록
+            with log_lock:
+                sys.stderr.write(message)
+                sys.stderr.flush()
+
+    if args.report:
+        return run_report(args)
+    if args.suggest_excludes:
+        return run_suggest_excludes(args)
+    if args.import_profile:
+        return run_import_profile(args, log)
+    if args.compare_modes:
+        return run_compare_modes(args, log)
+    if len(args.projects) > 1 or args.jobs:
+        return run_batch(args, log)
+    return run_single(args, log)
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
@@ -0,0 +1,356 @@
+""".spec 파일 생성: 프로젝트 설정을 PyInstaller spec 으로 옮기고 옵션이 바뀔 때만 다시 생성 (Tk 비의존)
+
+명령행 옵션으로는 표현할 수 없는 설정(파일별 UPX 제외, TOC 필터링, noarchive, 바이트코드
+최적화 수준)과 프로젝트 파일의 spec_overrides 에 적은 항목별 키워드 인자 덮어쓰기를 지원한다.
+추가 진입 스크립트(extra_scripts)가 있으면 하나의 Analysis 에서 실행 파일을 여러 개 만들고,
+빌드 변형(variants)이 있으면 같은 Analysis 로 변형마다 결과물을 만든다.
+spec 파일은 작업 폴더에 저장되며, 첫 줄 근처의 지문이 같으면 다시 쓰지 않는다.
+"""
+import os
+import hashlib
+
+import project_model
+import variant_matrix
+
+
+# spec 형식이 바뀌면 기존 spec 을 다시 생성하기 위한 버전
+SPEC_VERSION = 1
+
+# spec 파일 안의 지문 표시줄
+_FINGERPRINT_PREFIX = "# spec-fingerprint: "
+
+# PyInstaller 의 --collect-all 과 같은 처리를 하는 패키지 (build_command 와 같은 규칙)
+_COLLECT_ALL = ("pandas", "numpy")
+
+_HEADER = """# -*- mode: python ; coding: utf-8 -*-
+# PyInstaller 명령 생성기가 프로젝트 설정으로 만든 파일입니다.
+# 직접 고치면 다음 생성 때 덮어쓰이므로 프로젝트 파일의 spec_overrides 를 사용하세요.
+"""
+
+
+def _split_entry(entry):
+    """--add-data / --add-binary 항목을 (원본, 대상 폴더) 로 분리"""
+    for separator in (";", os.pathsep):
+        if separator in entry:
+            source, destination = entry.rsplit(separator, 1)
+            return source, destination
+    return entry, "."
+
+
+def _absolute(path, base_dir):
+    """spec 파일 위치와 관계없이 해석되도록 실행 폴더 기준 절대 경로로"""
+    return os.path.normpath(os.path.join(base_dir, path))
+
+
+def _arguments(project, base_dir):
+    """항목별 (키, 값) 목록 {항목: [(키, 값)]} (값은 repr 로 spec 에 쓸 파이썬 값)"""
+    upx = project["use_upx"] and not project["noupx"]
+    name = project_model.app_name_of(project)
+    onefile = project["build_type"] == "--onefile"
+
+    pathex = []
+    for script in project_model.entry_scripts(project):
+        directory = os.path.dirname(_absolute(script, base_dir))
+        if directory not in pathex:
+            pathex.append(directory)
+
+    analysis = [
+        ("pathex", pathex),
+        ("binaries", [(_absolute(source, base_dir), destination)
+                      for source, destination in map(_split_entry, project["binary_files"])]),
+        ("datas", [(_absolute(source, base_dir), destination)
+                   for source, destination in map(_split_entry, project["data_files"])]),
+        ("hiddenimports", list(project["hidden_imports"])),
+        ("hookspath", [_absolute(path, base_dir) for path in project["hooks_dirs"]]),
+        ("hooksconfig", {}),
+        ("runtime_hooks", [_absolute(path, base_dir) for path in project["runtime_hooks"]]),
+        ("excludes", list(project["exclude_modules"])),
+        ("noarchive", project["noarchive"]),
+        ("optimize", project["optimize"]),
+    ]
+    if project["win_private_assemblies"]:
+        analysis.append(("win_private_assemblies", True))
+    if project["win_no_prefer_redirects"]:
+        analysis.append(("win_no_prefer_redirects", True))
+
+    exe = [
+        ("name", name),
+        ("debug", False),
+        ("bootloader_ignore_signals", False),
+        ("strip", project["strip"]),
+        ("upx", upx),
+        ("console", project["console_option"] not in ("--noconsole", "--windowed", "-w")),
+        ("disable_windowed_traceback", False),
+        ("argv_emulation", False),
+        ("target_arch", None),
+        ("codesign_identity", None),
+        ("entitlements_file", None),
+    ]
+    if onefile:
+        exe[5:5] = [("upx_exclude", list(project["upx_exclude"])), ("runtime_tmpdir", None)]
+    else:
+        exe.insert(0, ("exclude_binaries", True))
+    for key, option in (("icon_file", "icon"), ("version_file", "version"), ("manifest_file", "manifest")):
+        if project[key]:
+            exe.append((option, _absolute(project[key], base_dir)))
+    if project["uac_admin"]:
+        exe.append(("uac_admin", True))
+    if project["uac_uiaccess"]:
+        exe.append(("uac_uiaccess", True))
+    if project["resources"]:
+        exe.append(("resources", list(project["resources"])))
+
+    collect = [
+        ("strip", project["strip"]),
+        ("upx", upx),
+        ("upx_exclude", list(project["upx_exclude"])),
+        ("name", name),
+    ]
+
+    sections = {"Analysis": analysis, "PYZ": [], "EXE": exe, "COLLECT": [] if onefile else collect}
+    return _apply_overrides(sections, project["spec_overrides"])
+
+
+def _apply_overrides(sections, overrides):
+    """spec_overrides 의 키워드 인자로 생성된 값을 바꾸거나 추가"""
+    for section, values in (overrides or {}).items():
+        if section not in project_model.OVERRIDE_SECTIONS:
+            raise ValueError(f"spec_overrides 에 알 수 없는 항목이 있습니다: {section}")
+        if section == "COLLECT" and not sections["COLLECT"]:
+            continue  # onefile 빌드에는 COLLECT 가 없음
+        arguments = sections[section]
+        for key, value in values.items():
+            for i, (existing, _) in enumerate(arguments):
+                if existing == key:
+                    arguments[i] = (key, value)
+                    break
+            else:
+                arguments.append((key, value))
+    return sections
+
+
+def _keywords(arguments, indent="    "):
+    """키워드 인자 목록을 spec 의 들여쓴 줄로"""
+    return "".join(f"{indent}{key}={value!r},\n" for key, value in arguments)
+
+
+def entry_points(project, base_dir=None):
+    """진입 스크립트별 (실행 파일 이름, 절대 경로) 목록, 이름이 겹치면 ValueError"""
+    base_dir = base_dir or os.getcwd()
+    scripts = project_model.entry_scripts(project)
+    points = [(project_model.app_name_of(project), _absolute(scripts[0], base_dir))]
+    for script in scripts[1:]:
+        points.append((project_model.entry_name_of(script), _absolute(script, base_dir)))
+    names = [name for name, _ in points]
+    for name in names:
+        if names.count(name) > 1:
+            raise ValueError(f"진입 스크립트의 실행 파일 이름이 겹칩니다: {name}")
+    return points
+
+
+def _entry_points_helper(points):
+    """진입 스크립트 목록과 실행 파일별 a.scripts 를 고르는 spec 함수"""
+    return (
+        f"\n# 진입 스크립트별 실행 파일 (이름, 스크립트)\nENTRY_POINTS = {points!r}\n"
+        "_ENTRY_PATHS = {os.path.normcase(os.path.abspath(path)) for _, path in ENTRY_POINTS}\n\n\n"
+        "def _scripts_for(path):\n"
+        "    \"\"\"런타임 훅과 해당 진입 스크립트만 남긴 a.scripts\"\"\"\n"
+        "    path = os.path.normcase(os.path.abspath(path))\n"
+        "    entries = [(os.path.normcase(os.path.abspath(entry[1])), entry) for entry in a.scripts]\n"
+        "    return [entry for entry_path, entry in entries if entry_path == path or entry_path not in _ENTRY_PATHS]\n"
+        "\n\n")
+
+
+def _render_variants(project, points, base_dir):
+    """하나의 Analysis/PYZ 로 빌드 변형마다 EXE(와 COLLECT)를 만드는 spec 부분
+
+    PyInstaller 는 EXE/COLLECT 를 만들 때 CONF 의 distpath/workpath 에 결과를 쓰므로 변형마다
+    두 경로를 <변형 이름> 하위 폴더로 바꿔 결과물과 중간 파일이 겹치지 않게 한다. 환경 변수로
+    변형을 지정하지 않고 실행하면 모든 변형을 차례로 만들고 소요 시간을 작업 폴더의 variants.json
+    에 기록한다. debug 변형은 부트로더 디버그 메시지를 켜고 EXE 와 COLLECT 모두 strip/UPX 를 끈다.
+    """
+    onefile_exe = dict(_arguments(dict(project, build_type="--onefile"), base_dir)["EXE"])
+    onedir = _arguments(dict(project, build_type="--onedir"), base_dir)
+    exe_options = {key: value for key, value in onedir["EXE"]
+                   if key not in ("name", "exclude_binaries", "console", "debug")}
+    onefile_options = {key: onefile_exe[key] for key in ("upx_exclude", "runtime_tmpdir")}
+    variants = []
+    for name in project["variants"]:
+        build_type, console_option, debug = variant_matrix.parse_variant(name)
+        variants.append((name, build_type == "--onefile", console_option == "--console", debug))
+
+    return [
+        _entry_points_helper(points),
+        f"# 빌드 변형 (하위 폴더 이름, onefile, console, debug)\nVARIANTS = {variants!r}\n",
+        f"EXE_OPTIONS = {exe_options!r}\n",
+        f"ONEFILE_OPTIONS = {onefile_options!r}\n",
+        f"COLLECT_OPTIONS = {dict(onedir['COLLECT'])!r}\n\n",
+        "# 빌드 러너가 변형을 동시에 빌드할 때는 이 실행에서 만들 변형만 지정 (빈 값이면 분석만)\n"
+        f"SELECTED = os.environ.get({variant_matrix.VARIANTS_ENV!r})\n"
+        "if SELECTED is not None:\n"
+        "    VARIANTS = [variant for variant in VARIANTS if variant[0] in SELECTED.split(',')]\n\n"
+        "DISTPATH, WORKPATH = CONF['distpath'], CONF['workpath']\n"
+        "timings = {'analysis': time.perf_counter() - _started, 'variants': {}}\n"
+        "try:\n"
+        "    for variant, onefile, console, debug in VARIANTS:\n"
+        "        started = time.perf_counter()\n"
+        "        CONF['distpath'] = os.path.join(DISTPATH, variant)\n"
+        "        CONF['workpath'] = os.path.join(WORKPATH, variant)\n"
+        "        os.makedirs(CONF['workpath'], exist_ok=True)\n"
+        "        options = dict(EXE_OPTIONS, console=console, debug=debug)\n"
+        "        collect_options = dict(COLLECT_OPTIONS)\n"
+        "        if debug:\n"
+        "            options.update(strip=False, upx=False)\n"
+        "            collect_options.update(strip=False, upx=False)\n"
+        "        executables = []\n"
+        "        for name, path in ENTRY_POINTS:\n"
+        "            if onefile:\n"
+        "                executables.append(EXE(pyz, _scripts_for(path), a.binaries, a.datas, [], name=name,\n"
+        "                                       **ONEFILE_OPTIONS, **options))\n"
+        "            else:\n"
+        "                executables.append(EXE(pyz, _scripts_for(path), [], name=name, exclude_binaries=True,\n"
+        "                                       **options))\n"
+        "        if not onefile:\n"
+        "            COLLECT(*executables, a.binaries, a.datas, **collect_options)\n"
+        "        timings['variants'][variant] = time.perf_counter() - started\n"
+        "finally:\n"
+        "    CONF['distpath'], CONF['workpath'] = DISTPATH, WORKPATH\n"
+        "if SELECTED is None:\n"
+        f"    with open(os.path.join(WORKPATH, {variant_matrix.REPORT_NAME!r}), 'w', encoding='utf-8') as f:\n"
+        "        json.dump(timings, f)\n",
+    ]
+
+
+def _render_entry_points(points, sections, onefile):
+    """진입 스크립트마다 EXE 를 만들고 하나의 Analysis/PYZ 를 공유하는 spec 부분
+
+    a.scripts 에는 런타임 훅과 모든 진입 스크립트가 들어 있으므로 실행 파일마다 자기 진입
+    스크립트만 남긴다. onedir 은 모든 실행 파일을 한 COLLECT 폴더에 모아 런타임을 한 벌만
+    두고, onefile 은 실행 파일마다 런타임을 담는다 (분석만 공유).
+    """
+    exe_keywords = _keywords([(key, value) for key, value in sections["EXE"] if key != "name"], " " * 8)
+    lines = [_entry_points_helper(points), "executables = []\nfor name, path in ENTRY_POINTS:\n"]
+    if onefile:
+        lines.append("    executables.append(EXE(\n        pyz,\n        _scripts_for(path),\n        a.binaries,\n"
+                     "        a.datas,\n        [],\n        name=name,\n")
+    else:
+        lines.append("    executables.append(EXE(\n        pyz,\n        _scripts_for(path),\n        [],\n"
+                     "        name=name,\n")
+    lines.append(exe_keywords + "    ))\n")
+    if not onefile:
+        lines.append(f"coll = COLLECT(\n    *executables,\n    a.binaries,\n    a.datas,\n"
+                     f"{_keywords(sections['COLLECT'])})\n")
+    return lines
+
+
+def render_spec(project, base_dir=None):
+    """프로젝트 설정으로 만든 spec 본문 (지문 줄 제외)
+
+    추가 진입 스크립트가 있으면 모든 진입 스크립트를 하나의 Analysis 로 분석하고
+    실행 파일을 스크립트마다 만든다.
+    """
+    project = project_model.new_project(**project)
+    base_dir = base_dir or os.getcwd()
+    sections = _arguments(project, base_dir)
+    points = entry_points(project, base_dir)
+    scripts = [path for _, path in points]
+    onefile = project["build_type"] == "--onefile"
+
+    variants = project["variants"]
+    lines = [_HEADER, "import os\n" if len(points) > 1 or variants else "", "import fnmatch\n"]
+    if variants:
+        lines.append("import json\nimport time\n\nfrom PyInstaller.config import CONF\n")
+    collect_all = [package for package in _COLLECT_ALL if package in project["hidden_imports"]]
+    if collect_all:
+        lines.append("from PyInstaller.utils.hooks import collect_all\n")
+    lines.append(f"\n# 결과물에서 뺄 파일 (대상 경로 기준 glob 패턴)\nTOC_EXCLUDES = {list(project['toc_excludes'])!r}\n")
+    lines.append(
+        "\n\ndef _keep(entry):\n"
+        "    \"\"\"TOC_EXCLUDES 패턴에 맞지 않는 항목만 남김\"\"\"\n"
+        "    name = entry[0].replace('\\\\', '/')\n"
+        "    return not any(fnmatch.fnmatch(name, pattern) for pattern in TOC_EXCLUDES)\n\n\n")
+
+    analysis = sections["Analysis"]
+    if collect_all:
+        # --collect-all 처럼 패키지의 데이터, 바이너리, 하위 모듈을 모두 포함
+        values = dict(analysis)
+        lines.append(f"datas = {values.pop('datas')!r}\n")
+        lines.append(f"binaries = {values.pop('binaries')!r}\n")
+        lines.append(f"hiddenimports = {values.pop('hiddenimports')!r}\n")
+        for package in collect_all:
+            lines.append(f"tmp_ret = collect_all({package!r})\n"
+                         "datas += tmp_ret[0]; binaries += tmp_ret[1]; hiddenimports += tmp_ret[2]\n")
+        lines.append("\n")
+        analysis = [(key, value) for key, value in analysis if key not in ("datas", "binaries", "hiddenimports")]
+        analysis_keywords = (_keywords(analysis) + "    datas=datas,\n    binaries=binaries,\n"
+                             "    hiddenimports=hiddenimports,\n")
+    else:
+        analysis_keywords = _keywords(analysis)
+
+    if variants:
+        lines.append("_started = time.perf_counter()\n")
+    lines.append(f"a = Analysis(\n    {scripts!r},\n{analysis_keywords})\n")
+    lines.append("a.binaries = [entry for entry in a.binaries if _keep(entry)]\n")
+    lines.append("a.datas = [entry for entry in a.datas if _keep(entry)]\n")
+    lines.append(f"pyz = PYZ(\n    a.pure,\n{_keywords(sections['PYZ'])})\n")
+    if variants:
+        lines.extend(_render_variants(project, points, base_dir))
+    elif len(points) > 1:
+        lines.extend(_render_entry_points(points, sections, onefile))
+    elif onefile:
+        lines.append(f"exe = EXE(\n    pyz,\n    a.scripts,\n    a.binaries,\n    a.datas,\n    [],\n"
+                     f"{_keywords(sections['EXE'])})\n")
+    else:
+        lines.append(f"exe = EXE(\n    pyz,\n    a.scripts,\n    [],\n{_keywords(sections['EXE'])})\n")
+        lines.append(f"coll = COLLECT(\n    exe,\n    a.binaries,\n    a.datas,\n"
+                     f"{_keywords(sections['COLLECT'])})\n")
+    return "".join(lines)
+
+
+def fingerprint(text):
+    """spec 본문의 지문"""
+    return hashlib.sha256(f"{SPEC_VERSION}\n{text}".encode("utf-8")).hexdigest()[:16]
+
+
+def spec_fingerprint(project, base_dir=None):
+    """프로젝트 설정으로 만들 spec 의 지문 (빌드 기록의 옵션 지문에 사용)"""
+    return fingerprint(render_spec(project, base_dir))
+
+
+def _stored_fingerprint(path):
+    """기존 spec 파일에 적힌 지문 (없으면 None)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            for _ in range(5):
+                line = f.readline()
+                if line.startswith(_FINGERPRINT_PREFIX):
+                    return line[len(_FINGERPRINT_PREFIX):].strip()
+    except OSError:
+        pass
+    return None
+
+
+def check_spec(project, base_dir=None):
+    """spec 파일을 쓰지 않고 (경로, 다시 생성해야 하는지) 반환 (--dry-run 처럼 부작용이 없어야 할 때)"""
+    path = project_model.spec_path_of(project, base_dir)
+    return path, _stored_fingerprint(path) != spec_fingerprint(project, base_dir)
+
+
+def ensure_spec(project, base_dir=None):
+    """spec 파일이 현재 설정과 다르거나 없으면 생성, (경로, 새로 썼는지) 반환
+
+    지문이 같으면 파일을 건드리지 않으므로 수정 시각을 보는 증분 빌드 검사가 그대로 유지된다.
+    """
+    path = project_model.spec_path_of(project, base_dir)
+    text = render_spec(project, base_dir)
+    digest = fingerprint(text)
+    if _stored_fingerprint(path) == digest:
+        return path, False
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    header, _, body = text.partition("\n")
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(f"{header}\n{_FINGERPRINT_PREFIX}{digest}\n{body}")
+    os.replace(tmp_path, path)
+    return path, True
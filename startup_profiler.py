@@ -0,0 +1,299 @@
+"""빌드된 실행 파일의 시작 시간과 최대 메모리 측정 (Tk 비의존)
+
+실행 파일을 여러 번 실행해 첫 출력(출력이 없으면 종료)까지의 시간, 종료까지의 시간,
+최대 RSS 를 잰다. 첫 실행은 가능하면 결과물 파일을 페이지 캐시에서 내린 뒤 실행해
+디스크에서 읽는 콜드 스타트에 가깝게 측정하고, 나머지 실행은 웜 스타트로 집계한다.
+"""
+import os
+import sys
+import signal
+import time
+import statistics
+import subprocess
+import threading
+
+import bundle_analysis
+import project_model
+import workpath
+
+
+DEFAULT_RUNS = 5
+DEFAULT_TIMEOUT = 30
+
+
+def _evict_from_cache(paths):
+    """파일들을 OS 페이지 캐시에서 내림 (Linux 의 posix_fadvise, 지원하지 않으면 False)"""
+    if not hasattr(os, "posix_fadvise"):
+        return False
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    return True
+
+
+def _bundle_files(path):
+    """실행 파일과 (onedir 이면) 같은 폴더 아래 모든 파일 경로"""
+    if not os.path.isdir(os.path.join(os.path.dirname(path), bundle_analysis.CONTENTS_DIR)):
+        return [path]
+    files = []
+    stack = [os.path.dirname(path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        files.append(entry.path)
+        except OSError:
+            continue
+    return files
+
+
+def _windows_peak_memory(process):
+    """Windows 프로세스의 최대 작업 집합 크기 (바이트, 알 수 없으면 None)"""
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    handle = getattr(process, "_handle", None)
+    if handle is None:
+        return None
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(PROCESS_MEMORY_COUNTERS)
+    if ctypes.windll.psapi.GetProcessMemoryInfo(int(handle), ctypes.byref(counters), counters.cb):
+        return counters.PeakWorkingSetSize
+    return None
+
+
+def _linux_tree_hwm(pid):
+    """Linux 에서 프로세스와 그 자식들의 최대 RSS(VmHWM) 중 가장 큰 값 (바이트, 읽지 못하면 None)"""
+    peak = None
+    pending = [pid]
+    while pending:
+        current = pending.pop()
+        try:
+            with open(f"/proc/{current}/status", 'r') as f:
+                for line in f:
+                    if line.startswith("VmHWM:"):
+                        value = int(line.split()[1]) * 1024
+                        peak = value if peak is None else max(peak, value)
+                        break
+            with open(f"/proc/{current}/task/{current}/children", 'r') as f:
+                pending.extend(int(child) for child in f.read().split())
+        except (OSError, ValueError):
+            continue
+    return peak
+
+
+def _kill_tree(process):
+    """프로세스와 같은 그룹의 자식들(onefile 부트로더가 띄운 프로세스 포함)을 모두 강제 종료"""
+    try:
+        if os.name == "nt":
+            # CREATE_NEW_PROCESS_GROUP 으로 띄운 트리 전체를 taskkill 로 종료
+            subprocess.run(["taskkill", "/F", "/T", "/PID", str(process.pid)],
+                           stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        else:
+            # start_new_session 으로 실행했으므로 프로세스 그룹 번호가 pid 와 같음
+            os.killpg(process.pid, signal.SIGKILL)
+            return
+    except OSError:
+        pass
+    try:
+        process.kill()
+    except OSError:
+        pass
+
+
+def run_once(argv, timeout=DEFAULT_TIMEOUT, cwd=None):
+    """실행 파일을 한 번 실행해 측정값 dict 반환
+
+    first_output 은 첫 출력까지, exit 는 종료까지의 초이고, peak_rss 는 바이트 단위이다.
+    Linux 의 wait4 최대 RSS 에는 fork 시점의 측정 프로세스 메모리가 섞이므로, 실행 중에
+    /proc 의 VmHWM 을 프로세스 트리(onefile 부트로더가 띄운 프로세스 포함) 전체에서 읽는다.
+    시간이 초과되면 새 세션(Windows 는 새 프로세스 그룹)으로 띄운 프로세스 트리 전체를 종료한다.
+    """
+    if os.name == "nt":
+        group_options = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    else:
+        group_options = {"start_new_session": True}
+    started = time.perf_counter()
+    process = subprocess.Popen(argv, cwd=cwd, stdin=subprocess.DEVNULL,
+                               stdout=subprocess.PIPE, stderr=subprocess.STDOUT, **group_options)
+    first_output = [None]
+    timed_out = threading.Event()
+
+    def read_output():
+        if process.stdout.read(1):
+            first_output[0] = time.perf_counter() - started
+            while process.stdout.read(65536):
+                pass
+
+    def kill():
+        timed_out.set()
+        _kill_tree(process)
+
+    sampled = [None]
+    finished = threading.Event()
+
+    def sample_memory():
+        while not finished.wait(0.005):
+            peak = _linux_tree_hwm(process.pid)
+            if peak is not None:
+                sampled[0] = max(sampled[0] or 0, peak)
+
+    reader = threading.Thread(target=read_output, daemon=True)
+    reader.start()
+    sampler = None
+    if sys.platform.startswith("linux"):
+        sampler = threading.Thread(target=sample_memory, daemon=True)
+        sampler.start()
+    timer = threading.Timer(timeout, kill)
+    timer.start()
+    peak_rss = None
+    try:
+        if hasattr(os, "wait4"):
+            _, status, usage = os.wait4(process.pid, 0)
+            process.returncode = os.waitstatus_to_exitcode(status)
+            # macOS 는 바이트 단위 (Linux 는 아래에서 VmHWM 측정값 사용)
+            peak_rss = usage.ru_maxrss if sys.platform == "darwin" else usage.ru_maxrss * 1024
+        else:
+            process.wait()
+            peak_rss = _windows_peak_memory(process)
+        exit_time = time.perf_counter() - started
+    finally:
+        finished.set()
+        if sampler is not None:
+            sampler.join()
+            peak_rss = sampled[0] or peak_rss
+        timer.cancel()
+        reader.join(5)
+        process.stdout.close()
+
+    return {
+        "first_output": first_output[0] if first_output[0] is not None else exit_time,
+        "exit": exit_time,
+        "peak_rss": peak_rss,
+        "returncode": process.returncode,
+        "timed_out": timed_out.is_set(),
+    }
+
+
+def _summarize(samples):
+    """측정값 목록의 중앙값/최소/최대 요약"""
+    if not samples:
+        return None
+    summary = {"runs": len(samples), "timeouts": sum(1 for s in samples if s["timed_out"]),
+               "failures": sum(1 for s in samples if s["returncode"] != 0 and not s["timed_out"])}
+    for key in ("first_output", "exit"):
+        values = [s[key] for s in samples]
+        summary[key] = {"median": statistics.median(values), "min": min(values), "max": max(values)}
+    memory = [s["peak_rss"] for s in samples if s["peak_rss"]]
+    summary["peak_rss"] = max(memory) if memory else None
+    return summary
+
+
+def profile_executable(path, runs=DEFAULT_RUNS, timeout=DEFAULT_TIMEOUT, args=(), log=None):
+    """실행 파일을 runs 번 실행해 {"cold": 요약, "warm": 요약, "cold_cache_evicted": bool} 반환"""
+    log = log or (lambda message, tag=None: None)
+    argv = [path] + list(args)
+    cwd = os.path.dirname(path)
+    samples = []
+    evicted = False
+    for i in range(max(1, runs)):
+        if i == 0:
+            evicted = _evict_from_cache(_bundle_files(path))
+        sample = run_once(argv, timeout, cwd)
+        samples.append(sample)
+        state = "시간 초과" if sample["timed_out"] else f"종료 코드 {sample['returncode']}"
+        log(f"시작 시간 측정 {i + 1}/{runs}: 첫 출력 {sample['first_output']:.3f}초, "
+            f"종료 {sample['exit']:.3f}초 ({state})\n")
+    return {
+        "path": path,
+        "cold": _summarize(samples[:1]),
+        "warm": _summarize(samples[1:]),
+        "cold_cache_evicted": evicted,
+    }
+
+
+def profile_build(project, base_dir=None, runs=DEFAULT_RUNS, timeout=DEFAULT_TIMEOUT, log=None):
+    """프로젝트의 빌드 결과 실행 파일을 측정 (실행 파일이 없으면 None)"""
+    path = bundle_analysis.executable_path(project, base_dir)
+    if not os.path.isfile(path):
+        return None
+    profile = profile_executable(path, runs, timeout, log=log)
+    profile["mode"] = project["build_type"].lstrip("-")
+    profile["size"] = sum(os.path.getsize(p) for p in _bundle_files(path))
+    return profile
+
+
+def _format_memory(size):
+    """바이트를 MB 문자열로 (없으면 -)"""
+    return f"{size / (1024 * 1024):.1f} MB" if size else "-"
+
+
+def format_profile(profile):
+    """로그에 표시할 시작 시간 요약"""
+    runs = profile["cold"]["runs"] + (profile["warm"] or {}).get("runs", 0)
+    lines = [f"시작 시간 ({profile.get('mode', '')}, {runs}회 실행):\n"]
+    for kind, label in (("cold", "콜드"), ("warm", "웜")):
+        summary = profile[kind]
+        if not summary:
+            continue
+        note = ""
+        if kind == "cold" and not profile["cold_cache_evicted"]:
+            note = " (페이지 캐시를 비우지 못해 첫 실행 기준)"
+        if summary["timeouts"]:
+            note += f" (시간 초과 {summary['timeouts']}회)"
+        lines.append(f"- {label}: 첫 출력 {summary['first_output']['median']:.3f}초, "
+                     f"종료 {summary['exit']['median']:.3f}초, 최대 메모리 {_format_memory(summary['peak_rss'])}{note}\n")
+    return lines
+
+
+def format_comparison(profiles):
+    """패키징 방식별 측정 결과 비교 표"""
+    width = max([8] + [len(profile["mode"]) for profile in profiles])
+    lines = [f"{'방식':<{width}} {'크기':>10} {'콜드 첫 출력':>12} {'웜 첫 출력':>10} {'웜 종료':>8} {'최대 메모리':>10}\n"]
+    for profile in profiles:
+        cold = profile["cold"]
+        warm = profile["warm"] or cold
+        lines.append(f"{profile['mode']:<{width}} {_format_memory(profile['size']):>10} "
+                     f"{cold['first_output']['median']:>11.3f}s {warm['first_output']['median']:>9.3f}s "
+                     f"{warm['exit']['median']:>7.3f}s {_format_memory(warm['peak_rss']):>10}\n")
+    return lines
+
+
+def variant_project(project, build_type, output_root, base_dir=None):
+    """같은 프로젝트를 다른 패키징 방식으로 빌드할 설정
+
+    결과물은 output_root/<방식> 에, 작업 폴더는 원래 작업 폴더의 <방식> 하위 폴더에 두어
+    방식마다 빌드 상태와 분석 캐시가 따로 유지된다.
+    """
+    mode = build_type.lstrip("-")
+    variant = project_model.new_project(**project)
+    variant["build_type"] = build_type
+    variant["variants"] = []
+    variant["output_dir"] = os.path.join(output_root, mode)
+    variant["work_dir"] = os.path.join(workpath.resolve_work_dir(project, base_dir), mode)
+    return variant
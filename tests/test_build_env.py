@@ -0,0 +1,113 @@
+"""build_env 의 가상환경 캐시 키와 캐시 제거 정책"""
+import os
+import subprocess
+import threading
+
+import build_env
+
+
+def test_fingerprint_normalizes_names_and_keeps_specifiers():
+    assert build_env.compute_fingerprint(["Foo_Bar"]) == build_env.compute_fingerprint(["foo-bar"])
+    assert build_env.compute_fingerprint(["numpy==1.26"]) != build_env.compute_fingerprint(["numpy==2.0"])
+    assert build_env.compute_fingerprint(["numpy >= 1.0"]) == build_env.compute_fingerprint(["numpy>=1.0"])
+
+
+def test_fingerprint_changes_with_wheelhouse_contents(tmp_path):
+    before = build_env.compute_fingerprint(["foo"], wheelhouse=str(tmp_path))
+    (tmp_path / "foo-1.0-py3-none-any.whl").write_bytes(b"wheel")
+    after = build_env.compute_fingerprint(["foo"], wheelhouse=str(tmp_path))
+    assert before != after
+    assert after == build_env.compute_fingerprint(["foo"], wheelhouse=str(tmp_path))
+
+
+def _store(cache, fingerprint):
+    """가상환경 없이 캐시 항목만 등록"""
+    os.makedirs(cache.entry_dir(fingerprint), exist_ok=True)
+    cache.store(fingerprint, ["pyinstaller"], [])
+
+
+def test_evict_removes_least_recently_used(tmp_path):
+    cache = build_env.VenvCache(str(tmp_path), max_entries=2)
+    for fingerprint in ("evict-a", "evict-b", "evict-c"):
+        _store(cache, fingerprint)
+    assert not os.path.exists(cache.entry_dir("evict-a"))
+    assert os.path.exists(cache.entry_dir("evict-c"))
+
+
+def test_evict_skips_entry_locked_by_another_job(tmp_path):
+    cache = build_env.VenvCache(str(tmp_path), max_entries=1)
+    _store(cache, "locked-a")
+    lock = build_env._fingerprint_lock("locked-a")
+    acquired = threading.Event()
+    release = threading.Event()
+
+    def hold():
+        with lock:
+            acquired.set()
+            release.wait(5)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    acquired.wait(5)
+    try:
+        _store(cache, "locked-b")
+        assert os.path.exists(cache.entry_dir("locked-a"))
+    finally:
+        release.set()
+        holder.join()
+    assert cache.evict() == ["locked-a"]
+    assert not os.path.exists(cache.entry_dir("locked-a"))
+
+
+def test_evict_skips_pinned_entry_until_unpinned(tmp_path):
+    cache = build_env.VenvCache(str(tmp_path), max_entries=1)
+    _store(cache, "pinned-a")
+    with build_env.pinned(cache.entry_dir("pinned-a")):
+        build_env.pin(cache.entry_dir("pinned-a"))
+        _store(cache, "pinned-b")
+        build_env.unpin(cache.entry_dir("pinned-a"))
+        assert os.path.exists(cache.entry_dir("pinned-a"))
+        assert cache.evict() == ["pinned-b"]
+    assert not build_env.is_pinned(cache.entry_dir("pinned-a"))
+    _store(cache, "pinned-c")
+    assert not os.path.exists(cache.entry_dir("pinned-a"))
+
+
+def test_default_cache_dir_is_per_user(monkeypatch, tmp_path):
+    import user_dirs
+    assert not build_env.DEFAULT_CACHE_DIR.startswith(os.path.dirname(os.path.abspath(build_env.__file__)) + os.sep)
+    monkeypatch.setenv(user_dirs.CACHE_DIR_ENV, str(tmp_path))
+    assert user_dirs.cache_path("venv_cache") == os.path.join(str(tmp_path), "venv_cache")
+    monkeypatch.delenv(user_dirs.CACHE_DIR_ENV)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+    if os.name != "nt":
+        assert user_dirs.cache_root() == os.path.join(str(tmp_path / "xdg"), user_dirs.APP_DIR_NAME)
+
+
+def _fake_pip(monkeypatch, bad, message):
+    """bad 패키지가 들어 있는 묶음만 실패하는 가짜 pip, 성공한 설치 묶음 목록 반환"""
+    installed = []
+
+    def run(args, on_line=None, cancel_event=None):
+        batch = args[args.index("--disable-pip-version-check") + 1:]
+        if bad in batch:
+            return subprocess.CompletedProcess(args, 1, "", message)
+        installed.extend(batch)
+        return subprocess.CompletedProcess(args, 0, "", "")
+
+    monkeypatch.setattr(build_env, "_run", run)
+    return installed
+
+
+def test_pip_in_batches_bisects_unknown_failure(monkeypatch):
+    installed = _fake_pip(monkeypatch, "bad", "ERROR: subprocess-exited-with-error\n")
+    failed = build_env._pip_in_batches("python", ["install"], ["a", "b", "bad", "c", "d"], "설치")
+    assert failed == {"bad": "ERROR: subprocess-exited-with-error"}
+    assert sorted(installed) == ["a", "b", "c", "d"]
+
+
+def test_pip_in_batches_drops_named_failure_without_bisecting(monkeypatch):
+    installed = _fake_pip(monkeypatch, "Bad_Pkg", "ERROR: No matching distribution found for bad-pkg\n")
+    failed = build_env._pip_in_batches("python", ["install"], ["a", "Bad_Pkg", "c"], "설치")
+    assert list(failed) == ["Bad_Pkg"]
+    assert installed == ["a", "c"]
@@ -0,0 +1,50 @@
+"""build_history 의 옵션 지문과 회귀 판정"""
+import os
+
+import build_history
+import project_model
+
+
+def _project(tmp_path, **values):
+    return project_model.new_project(script_path=str(tmp_path / "app.py"), build_type="--onefile",
+                                     output_dir=str(tmp_path / "dist"), **values)
+
+
+def _write_output(project, size):
+    path = project_model.output_path(project)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(b"x" * size)
+
+
+def test_options_fingerprint_ignores_clean(tmp_path):
+    project = _project(tmp_path)
+    assert (build_history.options_fingerprint(project)
+            == build_history.options_fingerprint(dict(project, clean_build=True)))
+    assert (build_history.options_fingerprint(project)
+            != build_history.options_fingerprint(dict(project, console_option="--noconsole")))
+
+
+def test_find_regressions_against_median():
+    previous = [{"duration": 10.0, "total_size": 100}, {"duration": 12.0, "total_size": 100},
+                {"duration": 11.0, "total_size": 100}]
+    build = {"status": "success", "duration": 14.0, "total_size": 110}
+    regressions = build_history.find_regressions(build, previous, threshold=0.2)
+    assert [r["metric"] for r in regressions] == ["duration"]
+    assert regressions[0]["baseline"] == 11.0
+    assert build_history.find_regressions(dict(build, status="failed"), previous) == []
+
+
+def test_regressions_use_recent_successful_builds(tmp_path):
+    history = build_history.BuildHistory(str(tmp_path / "history.db"))
+    project = _project(tmp_path)
+    _write_output(project, 1000)
+    for _ in range(3):
+        history.record(project, "success", 0, 10.0, {})
+    history.record(project, "failed", 1, 1.0, {})
+    assert history.regressions(project) == []
+
+    _write_output(project, 2000)
+    record = history.record(project, "success", 0, 10.0, {})
+    metrics = {r["metric"] for r in history.regressions(project, build=record)}
+    assert metrics == {"total_size", "exe_size"}
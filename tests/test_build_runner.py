@@ -0,0 +1,61 @@
+"""build_runner 의 공용 빌드 실행 경로와 변형 매트릭스 실행"""
+import threading
+import time
+
+import build_runner
+import project_model
+import variant_matrix
+
+
+def test_run_build_reports_phases_to_callback(monkeypatch):
+    def fake_run(argv, log=None, cancel_event=None, cwd=None, env=None):
+        for line in ("INFO: checking Analysis\n", "INFO: checking EXE\n", "INFO: Build complete!\n"):
+            log(line)
+        return 0
+
+    monkeypatch.setattr(build_runner, "run_pyinstaller", fake_run)
+    lines, phases = [], []
+    returncode, tracker = build_runner.run_build(
+        project_model.new_project(script_path="main.py"), ["pyinstaller"],
+        log=lambda message, tag=None: lines.append(message), on_phase=lambda *phase: phases.append(phase))
+
+    assert returncode == 0
+    assert len(lines) == 3
+    assert [label for _, label in phases][-1] == "빌드 완료"
+    assert [percent for percent, _ in phases] == sorted(percent for percent, _ in phases)
+    assert tracker.completed
+
+
+def test_variant_matrix_serializes_shared_steps_only(monkeypatch, tmp_path):
+    lock = threading.Lock()
+    state = {"shared": 0, "shared_peak": 0, "exe": 0, "exe_peak": 0}
+
+    def enter(key, delta):
+        with lock:
+            state[key] += delta
+            state[key + "_peak"] = max(state[key + "_peak"], state[key])
+
+    def fake_run(argv, log=None, cancel_event=None, cwd=None, env=None):
+        if not env[variant_matrix.VARIANTS_ENV]:
+            return 0
+        enter("shared", 1)
+        log("INFO: checking Analysis\n")
+        time.sleep(0.05)
+        log("INFO: checking PYZ\n")
+        enter("shared", -1)
+        log("INFO: checking EXE\n")
+        enter("exe", 1)
+        time.sleep(0.2)
+        enter("exe", -1)
+        return 0
+
+    monkeypatch.setattr(build_runner, "run_pyinstaller", fake_run)
+    project = project_model.new_project(script_path="main.py", work_dir="build",
+                                        variants=["onedir-console-release", "onedir-console-debug",
+                                                  "onefile-console-release"])
+    returncode = build_runner.run_variant_matrix(project, ["pyinstaller"], cwd=str(tmp_path), max_workers=3)
+
+    assert returncode == 0
+    assert state["shared_peak"] == 1
+    assert state["exe_peak"] > 1
+    assert set(variant_matrix.read_report(project, str(tmp_path))["variants"]) == set(project["variants"])
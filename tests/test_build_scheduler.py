@@ -0,0 +1,71 @@
+"""build_scheduler 의 동시 실행 수, 우선순위, 작업 폴더 격리와 취소"""
+import threading
+
+import build_env
+import build_runner
+import build_scheduler
+import project_model
+
+
+def _scheduler(tmp_path, names, max_workers, priorities=None):
+    scheduler = build_scheduler.BuildScheduler(str(tmp_path / "batch"), max_workers=max_workers)
+    for name in names:
+        project = project_model.new_project(script_path=str(tmp_path / f"{name}.py"))
+        scheduler.add(f"{name}.pyinstaller", (priorities or {}).get(name, 0), project)
+    return scheduler
+
+
+def test_runs_at_most_max_workers_in_isolated_folders(monkeypatch, tmp_path):
+    lock = threading.Lock()
+    state = {"running": 0, "peak": 0}
+    calls = []
+
+    def fake_build(project, cwd=None, cancel_event=None, **options):
+        with lock:
+            state["running"] += 1
+            state["peak"] = max(state["peak"], state["running"])
+            calls.append((cwd, project["work_dir"], project["output_dir"]))
+        threading.Event().wait(0.05)
+        with lock:
+            state["running"] -= 1
+        return {"status": "success"}
+
+    monkeypatch.setattr(build_runner, "build_project", fake_build)
+    summary = _scheduler(tmp_path, ["a", "b", "c", "d", "e"], max_workers=2).run()
+
+    assert state["peak"] == 2
+    assert summary["counts"] == {"success": 5}
+    assert len({cwd for cwd, _, _ in calls}) == 5
+    for cwd, work_dir, output_dir in calls:
+        assert work_dir.startswith(cwd) and output_dir.startswith(cwd)
+
+
+def test_higher_priority_starts_first(monkeypatch, tmp_path):
+    order = []
+
+    def fake_build(project, **options):
+        order.append(project_model.app_name_of(project))
+        return {"status": "success"}
+
+    monkeypatch.setattr(build_runner, "build_project", fake_build)
+    _scheduler(tmp_path, ["a", "b", "c"], max_workers=1, priorities={"c": 10, "b": 5}).run()
+    assert order == ["c", "b", "a"]
+
+
+def test_cancel_stops_running_job_and_skips_queued_jobs(monkeypatch, tmp_path):
+    scheduler = _scheduler(tmp_path, ["a", "b", "c"], max_workers=1)
+    started = []
+
+    def fake_build(project, cancel_event=None, **options):
+        started.append(project_model.app_name_of(project))
+        scheduler.cancel()
+        if cancel_event.wait(5):
+            raise build_env.BuildCancelled()
+        return {"status": "success"}
+
+    monkeypatch.setattr(build_runner, "build_project", fake_build)
+    summary = scheduler.run()
+
+    assert started == ["a"]
+    assert summary["counts"] == {"cancelled": 3}
+    assert [job["duration"] is None for job in summary["jobs"]] == [False, True, True]
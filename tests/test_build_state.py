@@ -0,0 +1,66 @@
+"""build_state 의 입력 지문과 증분 빌드 검사"""
+import os
+
+import build_state
+import project_model
+
+
+def _project(tmp_path):
+    (tmp_path / "app.py").write_text("print('hello')\n", encoding="utf-8")
+    return project_model.new_project(script_path=str(tmp_path / "app.py"), build_type="--onefile",
+                                     output_dir="dist", work_dir="build")
+
+
+def _write_output(project, base_dir):
+    path = project_model.output_path(project, base_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(b"exe")
+    return path
+
+
+def test_no_state_means_rebuild(tmp_path):
+    project = _project(tmp_path)
+    up_to_date, reasons = build_state.check_up_to_date(project, {"options": "x"}, str(tmp_path))
+    assert not up_to_date
+    assert reasons == ["이전 성공 빌드 기록 없음"]
+
+
+def test_unchanged_inputs_and_output_are_up_to_date(tmp_path):
+    project = _project(tmp_path)
+    _write_output(project, str(tmp_path))
+    signatures = {"options": "a", "python": "3"}
+    build_state.record_success(project, signatures, str(tmp_path))
+    up_to_date, _ = build_state.check_up_to_date(project, dict(signatures), str(tmp_path))
+    assert up_to_date
+
+
+def test_changed_input_and_missing_output_are_reported(tmp_path):
+    project = _project(tmp_path)
+    output = _write_output(project, str(tmp_path))
+    build_state.record_success(project, {"options": "a"}, str(tmp_path))
+
+    up_to_date, reasons = build_state.check_up_to_date(project, {"options": "b"}, str(tmp_path))
+    assert not up_to_date
+    assert len(reasons) == 1 and reasons[0].startswith("입력 변경")
+
+    os.remove(output)
+    up_to_date, reasons = build_state.check_up_to_date(project, {"options": "a"}, str(tmp_path))
+    assert not up_to_date
+    assert reasons == ["결과물이 없음"]
+
+
+def test_invalidate_forces_rebuild(tmp_path):
+    project = _project(tmp_path)
+    _write_output(project, str(tmp_path))
+    build_state.record_success(project, {"options": "a"}, str(tmp_path))
+    build_state.invalidate(project, str(tmp_path))
+    assert not build_state.check_up_to_date(project, {"options": "a"}, str(tmp_path))[0]
+
+
+def test_option_signature_ignores_clean(tmp_path):
+    project = _project(tmp_path)
+    command = project_model.build_command(project)
+    plain = build_state.input_signatures(project, command, base_dir=str(tmp_path))
+    clean = build_state.input_signatures(project, command + ["--clean"], base_dir=str(tmp_path))
+    assert plain["options"] == clean["options"]
@@ -0,0 +1,95 @@
+"""bundle_analysis 의 PKG/PYZ 아카이브 해석과 패키지별 집계"""
+import marshal
+import struct
+
+import bundle_analysis
+
+
+class _FakeIndex:
+    """표준 라이브러리와 배포판 이름만 아는 모듈 색인"""
+
+    def is_stdlib(self, name):
+        return name in ("os", "json")
+
+    def distribution_for(self, name):
+        return {"requests": "requests"}.get(name)
+
+
+def _pyz(modules):
+    """[(모듈 이름, 유형 코드, 내용)] 로 PYZ 아카이브 바이트 생성"""
+    header_length = len(bundle_analysis._PYZ_MAGIC) + 4 + 4
+    data, toc, offset = b"", [], header_length
+    for name, typecode, content in modules:
+        toc.append((name, (typecode, offset, len(content))))
+        data += content
+        offset += len(content)
+    return bundle_analysis._PYZ_MAGIC + b"\0" * 4 + struct.pack("!i", offset) + data + marshal.dumps(toc)
+
+
+def _executable(path, bootloader, entries):
+    """부트로더 뒤에 [(이름, 유형 코드, 내용)] PKG 와 쿠키를 붙인 실행 파일 생성"""
+    data, toc = b"", b""
+    for name, typecode, content in entries:
+        encoded = name.encode("utf-8") + b"\0"
+        encoded += b"\0" * (-(bundle_analysis._TOC_ENTRY_LENGTH + len(encoded)) % 16)
+        toc += struct.pack(bundle_analysis._TOC_ENTRY_FORMAT, bundle_analysis._TOC_ENTRY_LENGTH + len(encoded),
+                           len(data), len(content), len(content), 0, typecode.encode("ascii")) + encoded
+        data += content
+    pkg_length = len(data) + len(toc) + bundle_analysis._COOKIE_LENGTH
+    cookie = struct.pack(bundle_analysis._COOKIE_FORMAT, bundle_analysis._COOKIE_MAGIC, pkg_length,
+                         len(data), len(toc), 311, b"libpython3.11.so")
+    path.write_bytes(bootloader + data + toc + cookie)
+    return str(path)
+
+
+def _build(tmp_path):
+    pyz = _pyz([("os", 0, b"o" * 30), ("requests", 1, b"r" * 20), ("requests.api", 0, b"a" * 40),
+                ("mypkg.util", 0, b"u" * 10)])
+    return _executable(tmp_path / "app", b"\x7fELF" + b"\0" * 996, [
+        ("pyiboot01_bootstrap", "s", b"s" * 50),
+        ("pyimod01_archive", "m", b"m" * 60),
+        ("pyi-contents-directory _internal", "o", b""),
+        ("PYZ-00.pyz", "z", pyz),
+        ("libfoo.so.1", "b", b"b" * 70),
+    ]), len(pyz)
+
+
+def test_read_pkg_skips_option_entries(tmp_path):
+    path, pyz_length = _build(tmp_path)
+    pkg_start, entries = bundle_analysis.read_pkg(path)
+    assert pkg_start == 1000
+    assert [(name, typecode) for name, _, _, typecode in entries] == [
+        ("pyiboot01_bootstrap", "s"), ("pyimod01_archive", "m"), ("PYZ-00.pyz", "z"), ("libfoo.so.1", "b")]
+    assert entries[2][1:3] == (110, pyz_length)
+
+
+def test_read_pyz_lists_modules(tmp_path):
+    path, _ = _build(tmp_path)
+    pkg_start, entries = bundle_analysis.read_pkg(path)
+    modules = bundle_analysis.read_pyz(path, pkg_start + entries[2][1])
+    assert modules == [("os", 0, 30), ("requests", 1, 20), ("requests.api", 0, 40), ("mypkg.util", 0, 10)]
+
+
+def test_executable_sizes_are_grouped_by_package(tmp_path):
+    path, _ = _build(tmp_path)
+    analyzer = bundle_analysis.BundleAnalyzer(_FakeIndex())
+    analyzer.add_executable(path)
+    groups = {node.name: node for node in analyzer.root.sorted_children()}
+
+    assert analyzer.root.size == (tmp_path / "app").stat().st_size
+    assert groups[bundle_analysis.BOOTLOADER_GROUP].size == 1000 + 60
+    assert groups[bundle_analysis.SCRIPT_GROUP].size == 50
+    assert groups[bundle_analysis.STDLIB_GROUP].children["os.pyc"].size == 30
+    assert groups["requests"].size == 60
+    assert set(groups["requests"].children["requests"].children) == {"__init__.pyc", "api.pyc"}
+    assert groups["mypkg"].size == 10
+    assert groups[bundle_analysis.SHARED_LIB_GROUP].size == 70
+
+
+def test_file_without_cookie_counts_as_bootloader(tmp_path):
+    path = tmp_path / "plain"
+    path.write_bytes(b"\0" * 100)
+    analyzer = bundle_analysis.BundleAnalyzer(_FakeIndex())
+    analyzer.add_executable(str(path))
+    assert [(node.name, node.size) for node in analyzer.root.sorted_children()] == [
+        (bundle_analysis.BOOTLOADER_GROUP, 100)]
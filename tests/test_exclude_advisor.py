@@ -0,0 +1,45 @@
+"""exclude_advisor 의 임포트 종류 분류"""
+import exclude_advisor
+
+
+def _kinds(tmp_path, source, module_name="pkg.mod", file_name="mod.py"):
+    path = tmp_path / file_name
+    path.write_text(source, encoding="utf-8")
+    return {tuple(targets): kinds for targets, kinds in exclude_advisor.import_kinds(str(path), module_name)}
+
+
+def test_classifies_statement_context(tmp_path):
+    kinds = _kinds(tmp_path, (
+        "import os\n"
+        "try:\n"
+        "    import IPython\n"
+        "except ImportError:\n"
+        "    IPython = None\n"
+        "if False:\n"
+        "    import tkinter\n"
+        "def run():\n"
+        "    import pytest\n"
+        "    try:\n"
+        "        import numpy\n"
+        "    except ImportError:\n"
+        "        pass\n"))
+    assert kinds[("os",)] == {"top-level"}
+    assert kinds[("IPython",)] == {"optional"}
+    assert kinds[("tkinter",)] == {"conditional"}
+    assert kinds[("pytest",)] == {"delayed"}
+    assert kinds[("numpy",)] == {"delayed", "optional"}
+
+
+def test_resolves_relative_imports(tmp_path):
+    kinds = _kinds(tmp_path, "from . import sibling\nfrom ..base import thing\n", module_name="pkg.sub.mod")
+    assert ("pkg.sub", "pkg.sub.sibling") in kinds
+    assert ("pkg.base", "pkg.base.thing") in kinds
+
+    package_kinds = _kinds(tmp_path, "from .mod import x\n", module_name="pkg", file_name="__init__.py")
+    assert ("pkg.mod", "pkg.mod.x") in package_kinds
+
+
+def test_unparsable_file_returns_none(tmp_path):
+    path = tmp_path / "broken.py"
+    path.write_text("def (:\n", encoding="utf-8")
+    assert exclude_advisor.import_kinds(str(path), "broken") is None
@@ -0,0 +1,35 @@
+"""import_analysis 의 프로젝트 임포트 그래프"""
+import import_analysis
+
+
+def _write(path, text):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+
+
+def test_follows_local_imports_and_classifies_the_rest(tmp_path):
+    _write(tmp_path / "main.py", "import os\nimport helper\nimport requests.adapters\n")
+    _write(tmp_path / "helper.py", "import json\n")
+    graph = import_analysis.analyze_scripts([str(tmp_path / "main.py")], cache=False)
+    assert set(graph.local_modules) == {"__main__", "helper"}
+    assert graph.stdlib == {"os", "json"}
+    assert graph.third_party == {"requests.adapters"}
+
+
+def test_relative_import_in_entry_script_has_no_empty_module(tmp_path):
+    _write(tmp_path / "main.py", "from . import helper\nfrom .pkg import thing\n")
+    _write(tmp_path / "helper.py", "import csv\n")
+    _write(tmp_path / "pkg" / "__init__.py", "")
+    graph = import_analysis.analyze_scripts([str(tmp_path / "main.py")], cache=False)
+    assert graph.edges["__main__"] == {"helper", "pkg"}
+    assert "" not in graph.local_modules
+    assert all("" not in targets for targets in graph.edges.values())
+
+
+def test_entry_scripts_are_merged(tmp_path):
+    _write(tmp_path / "a.py", "import shared\n")
+    _write(tmp_path / "b.py", "import shared\nimport csv\n")
+    _write(tmp_path / "shared.py", "import json\n")
+    graph = import_analysis.analyze_scripts([str(tmp_path / "a.py"), str(tmp_path / "b.py")], cache=False)
+    assert "shared" in graph.local_modules
+    assert {"csv", "json"} <= graph.stdlib
@@ -0,0 +1,44 @@
+"""import_profiler 의 -X importtime 출력 해석"""
+import import_profiler
+
+
+_OUTPUT = """\
+import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     encodings.aliases
+import time:       300 |        400 |   encodings
+import time:        50 |        450 | site
+import time:       900 |       1200 |   json.decoder
+import time:       250 |       1500 | json
+some unrelated stderr line
+import time:        20 |         20 | csv
+"""
+
+
+def test_parse_builds_tree_from_indentation():
+    roots = import_profiler.parse_importtime(_OUTPUT)
+    assert [root.name for root in roots] == ["site", "json", "csv"]
+    site = roots[0]
+    assert [child.name for child in site.children] == ["encodings"]
+    assert [child.name for child in site.children[0].children] == ["encodings.aliases"]
+    assert roots[1].cumulative_us == 1500
+    assert sum(root.cumulative_us for root in roots) == 1970
+
+
+def test_rank_modules_by_self_time():
+    roots = import_profiler.parse_importtime(_OUTPUT)
+    ranked = import_profiler.rank_modules(roots, limit=2)
+    assert ranked == [("json.decoder", 900, 1200), ("encodings", 300, 400)]
+    assert [name for name, _, _ in import_profiler.rank_modules(roots, limit=1, key="cumulative_us")] == ["json"]
+
+
+def test_import_statements_skip_functions(tmp_path):
+    path = tmp_path / "main.py"
+    path.write_text("import os\ntry:\n    import json\nexcept ImportError:\n    pass\n"
+                    "def f():\n    import csv\nclass C:\n    import re\n", encoding="utf-8")
+    assert import_profiler.import_statements(str(path)) == ["import os", "import json"]
+
+
+def test_hidden_import_costs_sorted_by_cost():
+    summary = {"cumulative": {"json": 1500, "csv": 2000}}
+    assert import_profiler.hidden_import_costs(summary, ["json", "missing", "csv"]) == [
+        ("csv", 2.0), ("json", 1.5), ("missing", None)]
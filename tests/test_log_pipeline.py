@@ -0,0 +1,67 @@
+"""log_pipeline 의 빌드 로그 회전, 압축과 보관 한도"""
+import gzip
+import os
+
+import log_pipeline
+
+
+def _make_logs(log_dir, count, size=100):
+    """mtime 이 오래된 순서대로 로그 파일을 만들고 경로 목록 반환"""
+    log_dir.mkdir(exist_ok=True)
+    paths = []
+    for i in range(count):
+        path = log_dir / f"{i:02d}-app.log"
+        path.write_bytes(b"x" * size)
+        os.utime(path, (1000000 + i, 1000000 + i))
+        paths.append(path)
+    return paths
+
+
+def _names(log_dir):
+    return sorted(os.listdir(log_dir))
+
+
+def test_old_logs_are_compressed_and_newest_stay_plain(tmp_path):
+    paths = _make_logs(tmp_path / "logs", 5)
+    log_pipeline.rotate_logs(str(tmp_path / "logs"), keep_plain=2, max_files=10, max_bytes=10 ** 6)
+    assert _names(tmp_path / "logs") == ["00-app.log.gz", "01-app.log.gz", "02-app.log.gz",
+                                         "03-app.log", "04-app.log"]
+    with gzip.open(str(paths[0]) + ".gz", "rb") as f:
+        assert f.read() == b"x" * 100
+    assert os.path.getmtime(str(paths[0]) + ".gz") == 1000000
+
+
+def test_max_files_removes_oldest(tmp_path):
+    _make_logs(tmp_path / "logs", 5)
+    log_pipeline.rotate_logs(str(tmp_path / "logs"), keep_plain=5, max_files=3, max_bytes=10 ** 6)
+    assert _names(tmp_path / "logs") == ["02-app.log", "03-app.log", "04-app.log"]
+
+
+def test_max_bytes_removes_oldest(tmp_path):
+    _make_logs(tmp_path / "logs", 4, size=1000)
+    log_pipeline.rotate_logs(str(tmp_path / "logs"), keep_plain=4, max_files=10, max_bytes=2500)
+    assert _names(tmp_path / "logs") == ["02-app.log", "03-app.log"]
+
+
+def test_open_log_is_neither_compressed_nor_removed(tmp_path):
+    log_dir = tmp_path / "logs"
+    _make_logs(log_dir, 3)
+    build_log = log_pipeline.BuildLog(str(log_dir / "00-app.log"))
+    try:
+        log_pipeline.rotate_logs(str(log_dir), keep_plain=0, max_files=1, max_bytes=10 ** 6)
+        assert _names(log_dir) == ["00-app.log", "02-app.log.gz"]
+    finally:
+        build_log.close()
+
+
+def test_open_build_log_writes_and_copy_log_decompresses(tmp_path):
+    log_dir = str(tmp_path / "logs")
+    build_log = log_pipeline.open_build_log("my app", log_dir)
+    build_log.write("첫 줄\n")
+    build_log.close()
+    assert build_log.path.endswith("-my_app.log")
+
+    log_pipeline.rotate_logs(log_dir, keep_plain=0)
+    assert not os.path.exists(build_log.path)
+    log_pipeline.copy_log(build_log.path, str(tmp_path / "copy.log"))
+    assert (tmp_path / "copy.log").read_text(encoding="utf-8") == "첫 줄\n"
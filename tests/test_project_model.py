@@ -0,0 +1,95 @@
+"""project_model 의 항목 표, Project 검증과 명령어 구성"""
+import pytest
+
+import project_model
+
+
+def test_default_project_comes_from_field_table():
+    assert list(project_model.DEFAULT_PROJECT) == [name for name, _, _, _ in project_model.FIELDS]
+    assert project_model.Project.__slots__ == tuple(project_model.DEFAULT_PROJECT)
+    assert project_model.new_project() == project_model.Project()
+    assert project_model.new_project().to_dict() == project_model.DEFAULT_PROJECT
+
+
+def test_valid_project_has_no_errors():
+    project = project_model.Project(script_path="main.py", build_type="--onefile", log_level="WARN",
+                                    variants=["onedir-console-debug"], spec_overrides={"EXE": {"upx": False}})
+    assert project.errors() == []
+    assert project.validate() is project
+
+
+def test_type_errors_come_first():
+    errors = project_model.Project(script_path="main.py", clean_build=1, optimize="2", hidden_imports=[1],
+                                   log_level="NOPE").errors()
+    assert [error.split(":")[0] for error in errors] == ["clean_build", "hidden_imports", "optimize"]
+
+
+@pytest.mark.parametrize("values, field", [
+    ({"script_path": ""}, "script_path"),
+    ({"build_type": "--onefolder"}, "build_type"),
+    ({"log_level": "NOPE"}, "log_level"),
+    ({"optimize": 3}, "optimize"),
+    ({"variants": ["bogus"]}, "variants"),
+    ({"spec_overrides": {"Foo": {}}}, "spec_overrides"),
+    ({"spec_overrides": {"EXE": {"not valid": 1}}}, "spec_overrides.EXE"),
+    ({"extra_scripts": ["other/main.py"]}, "extra_scripts"),
+    ({"app_name": "tool", "extra_scripts": ["tool.py"]}, "extra_scripts"),
+    ({"hidden_imports": ["bad\0name"]}, "hidden_imports"),
+])
+def test_invalid_values_are_reported(values, field):
+    values = dict({"script_path": "main.py"}, **values)
+    errors = project_model.Project(**values).errors()
+    assert len(errors) == 1 and errors[0].startswith(field + ":")
+    with pytest.raises(ValueError):
+        project_model.Project(**values).validate()
+
+
+def test_unknown_keys():
+    with pytest.raises(ValueError):
+        project_model.Project(script_path="main.py", name="x")
+    assert project_model.Project.from_dict({"script_path": "main.py", "name": "x"}).script_path == "main.py"
+    with pytest.raises(KeyError):
+        project_model.Project()["name"] = "x"
+
+
+def test_values_are_deep_copied():
+    data = {"script_path": "main.py", "spec_overrides": {"EXE": {"upx": False}}, "hidden_imports": ["a"]}
+    project = project_model.Project.from_dict(data)
+    data["spec_overrides"]["EXE"]["upx"] = True
+    data["hidden_imports"].append("b")
+    assert project.spec_overrides == {"EXE": {"upx": False}}
+    assert project.hidden_imports == ["a"]
+    assert project.to_dict()["spec_overrides"] is not project.spec_overrides
+
+
+def test_diff_copy_and_dict_access():
+    project = project_model.Project(script_path="main.py")
+    changed = project.copy(build_type="--onefile")
+    assert project.diff(changed) == {"build_type": ("--onedir", "--onefile")}
+    assert project != changed and project == project.copy()
+    assert project_model.new_project(**changed)["build_type"] == "--onefile"
+
+
+def test_argv_keeps_each_value_one_argument():
+    project = project_model.Project(script_path="my dir/it's.py", app_name='a "b"')
+    argv = project.argv(["/venv/bin/pyinstaller"])
+    assert argv[0] == "/venv/bin/pyinstaller"
+    assert argv[-1] == "my dir/it's.py"
+    assert '--name=a "b"' in argv
+
+
+def test_spec_build_command_replaces_options_with_spec():
+    command = project_model.build_command(project_model.new_project(script_path="main.py", use_spec=True,
+                                                                    hidden_imports=["x"]))
+    assert command[-1].endswith("main.spec")
+    assert not any(arg.startswith("--hidden-import") for arg in command)
+
+
+def test_pipeline_helpers_return_project(tmp_path):
+    path = str(tmp_path / "app.pyinstaller")
+    project_model.save_project(path, project_model.new_project(script_path="main.py", hidden_imports=["x"]))
+    loaded = project_model.load_project(path)
+    assert isinstance(loaded, project_model.Project)
+    assert loaded == project_model.new_project(script_path="main.py", hidden_imports=["x"])
+    with pytest.raises(ValueError):
+        project_model.new_project(script_path="main.py", name="x")
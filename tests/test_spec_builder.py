@@ -0,0 +1,75 @@
+"""spec_builder 의 spec 생성과 지문"""
+import os
+
+import pytest
+
+import project_model
+import spec_builder
+
+
+def _project(tmp_path, **values):
+    return project_model.new_project(script_path=str(tmp_path / "main.py"), work_dir=str(tmp_path / "build"),
+                                     **values)
+
+
+def test_onedir_spec_is_valid_python(tmp_path):
+    text = spec_builder.render_spec(_project(tmp_path, hidden_imports=["numpy"]), str(tmp_path))
+    compile(text, "main.spec", "exec")
+    assert "a = Analysis(" in text
+    assert "coll = COLLECT(" in text
+    assert "collect_all('numpy')" in text
+
+
+def test_onefile_spec_has_no_collect(tmp_path):
+    text = spec_builder.render_spec(_project(tmp_path, build_type="--onefile"), str(tmp_path))
+    compile(text, "main.spec", "exec")
+    assert "COLLECT(" not in text
+    assert "runtime_tmpdir=None" in text
+
+
+def test_overrides_replace_and_add_keywords(tmp_path):
+    project = _project(tmp_path, spec_overrides={"EXE": {"upx": False, "argv_emulation": True},
+                                                 "PYZ": {"cipher": None}})
+    sections = spec_builder._arguments(project, str(tmp_path))
+    exe = dict(sections["EXE"])
+    assert exe["upx"] is False and exe["argv_emulation"] is True
+    assert [key for key, _ in sections["EXE"]].count("upx") == 1
+    assert sections["PYZ"] == [("cipher", None)]
+
+
+def test_fingerprint_follows_options(tmp_path):
+    project = _project(tmp_path)
+    assert spec_builder.spec_fingerprint(project, str(tmp_path)) == spec_builder.spec_fingerprint(
+        dict(project), str(tmp_path))
+    assert spec_builder.spec_fingerprint(project, str(tmp_path)) != spec_builder.spec_fingerprint(
+        dict(project, toc_excludes=["*.pdb"]), str(tmp_path))
+
+
+def test_ensure_spec_writes_only_on_change_and_check_spec_never_writes(tmp_path):
+    project = _project(tmp_path)
+    path, stale = spec_builder.check_spec(project, str(tmp_path))
+    assert stale and not os.path.exists(path)
+
+    assert spec_builder.ensure_spec(project, str(tmp_path)) == (path, True)
+    assert spec_builder.ensure_spec(project, str(tmp_path)) == (path, False)
+    assert spec_builder.check_spec(project, str(tmp_path)) == (path, False)
+
+    changed = dict(project, optimize=2)
+    assert spec_builder.check_spec(changed, str(tmp_path)) == (path, True)
+    assert spec_builder.ensure_spec(changed, str(tmp_path)) == (path, True)
+
+
+def test_entry_points_share_one_analysis(tmp_path):
+    project = _project(tmp_path, app_name="app", extra_scripts=[str(tmp_path / "tools" / "tool.py")])
+    assert [name for name, _ in spec_builder.entry_points(project, str(tmp_path))] == ["app", "tool"]
+    text = spec_builder.render_spec(project, str(tmp_path))
+    compile(text, "app.spec", "exec")
+    assert text.count("Analysis(") == 1
+    assert "COLLECT(\n    *executables," in text
+    assert os.path.join(str(tmp_path), "tools") in text
+
+
+def test_entry_points_reject_clashing_names(tmp_path):
+    project = _project(tmp_path, extra_scripts=[str(tmp_path / "other" / "main.py")])
+    with pytest.raises(ValueError, match="main"):
+        spec_builder.entry_points(project, str(tmp_path))
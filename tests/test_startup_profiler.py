@@ -0,0 +1,43 @@
+"""startup_profiler 의 실행 측정과 시간 초과 시 프로세스 트리 종료"""
+import os
+import sys
+import time
+
+import pytest
+
+import startup_profiler
+
+
+def test_run_once_measures_output_and_exit():
+    sample = startup_profiler.run_once([sys.executable, "-c", "print('ready')"], timeout=30)
+    assert sample["returncode"] == 0 and not sample["timed_out"]
+    assert 0 < sample["first_output"] <= sample["exit"]
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="/proc 로 자식 프로세스 상태 확인")
+def test_timeout_kills_child_of_launched_process(tmp_path):
+    pid_file = tmp_path / "child.pid"
+    # onefile 부트로더처럼 자식 프로세스를 띄우고 그 종료를 기다리는 부모
+    parent = ("import subprocess, sys\n"
+              "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(60)'])\n"
+              f"open({str(pid_file)!r}, 'w').write(str(child.pid))\n"
+              "child.wait()\n")
+    started = time.time()
+    sample = startup_profiler.run_once([sys.executable, "-c", parent], timeout=1)
+    assert sample["timed_out"]
+    # 자식이 출력 파이프를 잡고 남아 있으면 읽기 스레드가 끝나지 않아 오래 걸림
+    assert time.time() - started < 10
+    child_pid = int(pid_file.read_text())
+    deadline = time.time() + 5
+    while time.time() < deadline:
+        try:
+            os.kill(child_pid, 0)
+        except ProcessLookupError:
+            break
+        # 종료된 자식이 init 에 회수되기 전의 좀비 상태도 종료로 본다
+        with open(f"/proc/{child_pid}/stat") as f:
+            if f.read().split(")")[-1].split()[0] == "Z":
+                break
+        time.sleep(0.05)
+    else:
+        pytest.fail("시간 초과 후에도 자식 프로세스가 남아 있습니다")
@@ -0,0 +1,67 @@
+"""variant_matrix 의 변형 이름 해석과 변형 매트릭스 spec"""
+import os
+
+import pytest
+
+import build_phases
+import project_model
+import spec_builder
+import variant_matrix
+
+
+def test_parse_variant():
+    assert variant_matrix.parse_variant("onefile-noconsole-debug") == ("--onefile", "--noconsole", True)
+    assert variant_matrix.parse_variant(" onedir-console-release ") == ("--onedir", "--console", False)
+    for name in ("bogus", "onefile-console", "onefile-window-debug", ""):
+        with pytest.raises(ValueError):
+            variant_matrix.parse_variant(name)
+
+
+def test_parse_variants():
+    assert variant_matrix.parse_variants("all") == variant_matrix.ALL_VARIANTS
+    assert len(set(variant_matrix.ALL_VARIANTS)) == 8
+    assert variant_matrix.parse_variants("onedir-console-debug, ,onedir-console-debug,onefile-console-release") == [
+        "onedir-console-debug", "onefile-console-release"]
+    with pytest.raises(ValueError):
+        variant_matrix.parse_variants("onedir-console-debug,bogus")
+
+
+def test_variant_project_points_to_subfolder():
+    project = project_model.new_project(script_path="main.py", output_dir="out",
+                                        variants=["onefile-noconsole-release"])
+    variant = variant_matrix.variant_project(project, "onefile-noconsole-release")
+    assert variant["output_dir"] == os.path.join("out", "onefile-noconsole-release")
+    assert (variant["build_type"], variant["console_option"], variant["variants"]) == ("--onefile", "--noconsole", [])
+    assert project["variants"] == ["onefile-noconsole-release"]
+
+
+def test_report_roundtrip(tmp_path):
+    project = project_model.new_project(script_path="main.py", work_dir="build")
+    assert variant_matrix.read_report(project, str(tmp_path)) is None
+    report = {"analysis": 1.5, "variants": {"onedir-console-release": 2.0}}
+    variant_matrix.write_report(project, report, str(tmp_path))
+    assert variant_matrix.read_report(project, str(tmp_path)) == report
+
+
+def test_matrix_spec_disables_strip_and_upx_for_debug_collect(tmp_path):
+    project = project_model.new_project(script_path=str(tmp_path / "main.py"), use_upx=True, strip=True,
+                                        variants=["onedir-console-debug", "onedir-console-release"])
+    text = spec_builder.render_spec(project, str(tmp_path))
+    compile(text, "main.spec", "exec")
+    assert "collect_options.update(strip=False, upx=False)" in text
+    assert "COLLECT(*executables, a.binaries, a.datas, **collect_options)" in text
+
+
+def test_tracker_can_ignore_intermediate_build_complete():
+    tracker = build_phases.PhaseTracker(finish_on_complete=False)
+    tracker.feed("INFO: checking Analysis")
+    assert tracker.feed("INFO: Build complete! The results are available in: dist") is None
+    assert not tracker.completed
+    tracker.feed("INFO: checking EXE")
+    assert tracker.current == "exe"
+    tracker.finish()
+    assert tracker.completed
+
+    default = build_phases.PhaseTracker()
+    assert default.feed("INFO: Build complete!") == (100, "빌드 완료")
+    assert default.completed
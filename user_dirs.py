@@ -0,0 +1,27 @@
+"""캐시와 빌드 상태를 두는 사용자별 폴더 위치 (Tk 비의존)"""
+import os
+import sys
+
+
+# 캐시 폴더를 바꾸는 환경 변수 (지정하면 그 폴더를 그대로 사용)
+CACHE_DIR_ENV = "PYINSTALLER_GUI_CACHE_DIR"
+
+# 사용자 캐시 폴더 아래에 만드는 이 도구의 폴더 이름
+APP_DIR_NAME = "pyinstaller-command-generator"
+
+
+def cache_root():
+    """사용자별 캐시 폴더 (Windows 는 %LOCALAPPDATA%, 그 밖에는 $XDG_CACHE_HOME 또는 ~/.cache 아래)"""
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return os.path.abspath(os.path.expanduser(override))
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), "AppData", "Local")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, APP_DIR_NAME)
+
+
+def cache_path(*parts):
+    """캐시 폴더 아래의 경로 (폴더는 만들지 않음)"""
+    return os.path.join(cache_root(), *parts)
@@ -0,0 +1,106 @@
+"""변형 매트릭스 빌드: 한 번의 분석으로 onefile/onedir × console/noconsole × debug/release 결과물 생성 (Tk 비의존)
+
+프로젝트 파일의 variants 에 변형 이름(예: onedir-console-release)을 적으면 spec 빌드로 전환되어
+하나의 Analysis 뒤에 변형마다 EXE/COLLECT 를 만든다. 결과물은 출력 폴더의 <변형 이름> 하위 폴더에,
+작업 파일은 작업 폴더의 앱 폴더 아래 <변형 이름> 폴더에 생긴다. 헤드리스 빌드는 분석만 하는
+PyInstaller 를 먼저 실행한 뒤 같은 분석 결과로 변형마다 PyInstaller 를 동시에 실행한다
+(공유 작업 폴더를 쓰는 Analysis/PYZ 단계는 한 번에 한 실행만).
+변형별 소요 시간은 작업 폴더에 기록되어 빌드 후 변형별 크기와 함께 보여 준다.
+"""
+import os
+import json
+
+import project_model
+
+
+# 변형 축: (이름 조각, 프로젝트 값)
+BUILD_TYPES = (("onefile", "--onefile"), ("onedir", "--onedir"))
+CONSOLE_OPTIONS = (("console", "--console"), ("noconsole", "--noconsole"))
+DEBUG_OPTIONS = (("release", False), ("debug", True))
+
+# 변형별 소요 시간을 기록하는 파일 (작업 폴더의 앱 폴더 안)
+REPORT_NAME = "variants.json"
+
+# spec 이 만들 변형을 지정하는 환경 변수 (쉼표로 구분, 빈 값이면 분석만, 없으면 모든 변형)
+VARIANTS_ENV = "PYINSTALLER_GUI_VARIANTS"
+
+# 전체 변형 이름 (결과물 하위 폴더 이름)
+ALL_VARIANTS = [f"{mode}-{console}-{debug}"
+                for mode, _ in BUILD_TYPES for console, _ in CONSOLE_OPTIONS for debug, _ in DEBUG_OPTIONS]
+
+
+def parse_variant(name):
+    """변형 이름을 (build_type, console_option, debug) 로, 알 수 없는 이름이면 ValueError"""
+    parts = name.strip().split("-")
+    if len(parts) == 3:
+        mode, console, debug = parts
+        build_types = dict(BUILD_TYPES)
+        console_options = dict(CONSOLE_OPTIONS)
+        debug_options = dict(DEBUG_OPTIONS)
+        if mode in build_types and console in console_options and debug in debug_options:
+            return build_types[mode], console_options[console], debug_options[debug]
+    raise ValueError(f"알 수 없는 빌드 변형입니다: {name} (예: onedir-console-release)")
+
+
+def parse_variants(text):
+    """쉼표로 구분한 변형 목록 ("all" 이면 전체), 중복 제거, 순서 유지"""
+    if text.strip() == "all":
+        return list(ALL_VARIANTS)
+    variants = []
+    for name in text.split(","):
+        if not name.strip():
+            continue
+        parse_variant(name)
+        if name.strip() not in variants:
+            variants.append(name.strip())
+    return variants
+
+
+def variant_project(project, name):
+    """변형 하나의 결과물을 가리키는 프로젝트 설정 (결과물 크기, 실행 파일 경로 계산용)"""
+    build_type, console_option, _ = parse_variant(name)
+    variant = project_model.new_project(**project)
+    variant["variants"] = []
+    variant["build_type"] = build_type
+    variant["console_option"] = console_option
+    variant["output_dir"] = os.path.join(project["output_dir"] or "dist", name)
+    return variant
+
+
+def report_path(project, base_dir=None):
+    """spec 이 변형별 소요 시간을 기록하는 파일 경로 (작업 폴더가 정해진 프로젝트 기준)"""
+    work_path = os.path.join(base_dir or os.getcwd(), project["work_dir"] or "build")
+    return os.path.join(work_path, project_model.app_name_of(project), REPORT_NAME)
+
+
+def read_report(project, base_dir=None):
+    """마지막 매트릭스 빌드의 {"analysis": 초, "variants": {이름: 초}} (없으면 None)"""
+    try:
+        with open(report_path(project, base_dir), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_report(project, report, base_dir=None):
+    """변형별 소요 시간 기록 (read_report 와 같은 형식)"""
+    path = report_path(project, base_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f)
+    os.replace(tmp_path, path)
+    return path
+
+
+def format_results(results, report=None):
+    """로그에 표시할 변형별 크기와 소요 시간 표"""
+    lines = []
+    if report and report.get("analysis") is not None:
+        lines.append(f"공유 분석: {report['analysis']:.1f}초\n")
+    lines.append(f"{'변형':<26} {'크기':>10} {'파일 수':>7} {'소요 시간':>9}\n")
+    for result in results:
+        size = f"{result['size'] / (1024 * 1024):.1f} MB" if result["files"] else "없음"
+        seconds = f"{result['seconds']:.1f}s" if result["seconds"] is not None else "-"
+        lines.append(f"{result['variant']:<26} {size:>10} {result['files']:>7} {seconds:>9}\n")
+    return lines
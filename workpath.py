@@ -0,0 +1,176 @@
+"""프로젝트별 고정 작업 폴더 관리와 선택적 --clean 판단 (Tk 비의존)
+
+PyInstaller 는 작업 폴더(--workpath)에 모듈 그래프와 바이너리 의존성 분석 결과를 남겨
+다음 빌드에서 다시 쓴다. 작업 폴더를 프로젝트마다 고정해 두고, 인터프리터나 PyInstaller,
+설치된 패키지 목록이 실제로 바뀌었을 때만 --clean 을 붙여 이 캐시를 최대한 활용한다.
+"""
+import os
+import re
+import sys
+import json
+import hashlib
+
+import build_history
+import build_state
+import project_model
+import user_dirs
+
+
+# 자동 관리 작업 폴더 기본 위치 (사용자별 캐시 폴더)
+DEFAULT_WORKPATH_ROOT = user_dirs.cache_path("workpaths")
+
+# 마지막 성공 빌드의 빌드 환경 기록 (작업 폴더의 앱 폴더 안, --clean 시 함께 삭제됨)
+ENV_STATE_NAME = "workpath_env.json"
+
+# 기록 형식이 바뀌면 이전 기록을 무시하기 위한 버전
+ENV_STATE_VERSION = 1
+
+_DIST_INFO_PATTERN = re.compile(r"^(?P<name>[^-]+)-(?P<version>[^-]+)\.(dist|egg)-info$")
+
+
+def _safe_dir_name(name):
+    """폴더 이름으로 쓸 수 있도록 문자 정리"""
+    return re.sub(r"[^\w.-]+", "_", name).strip("_") or "app"
+
+
+def managed_workpath(project, root=DEFAULT_WORKPATH_ROOT):
+    """프로젝트 전용 작업 폴더 경로 (스크립트 경로와 앱 이름이 같으면 항상 같은 폴더)"""
+    digest = hashlib.sha256(build_history.project_key(project).encode("utf-8")).hexdigest()[:8]
+    return os.path.join(root, f"{_safe_dir_name(project_model.app_name_of(project))}-{digest}")
+
+
+def resolve_work_dir(project, base_dir=None, root=DEFAULT_WORKPATH_ROOT):
+    """PyInstaller 가 실제로 사용할 작업 폴더 (자동 관리면 프로젝트 전용 폴더)"""
+    work_dir = project["work_dir"]
+    if not work_dir:
+        work_dir = managed_workpath(project, root) if project["managed_workpath"] else "build"
+    return os.path.join(base_dir or os.getcwd(), work_dir)
+
+
+def _interpreter(venv_dir=None):
+    """빌드에 쓰이는 인터프리터 식별 문자열 (가상환경이면 pyvenv.cfg 기준)"""
+    if venv_dir:
+        config = {}
+        try:
+            with open(os.path.join(venv_dir, "pyvenv.cfg"), 'r', encoding='utf-8') as f:
+                for line in f:
+                    key, _, value = line.partition("=")
+                    config[key.strip()] = value.strip()
+        except OSError:
+            pass
+        version = config.get("version_info") or config.get("version") or ""
+        return f"{version} ({config.get('home', '')})"
+    return f"{sys.version.split()[0]} ({sys.executable})"
+
+
+def installed_packages(venv_dir=None):
+    """빌드 환경에 설치된 배포 패키지 {이름: 버전}"""
+    packages = {}
+    for path in build_state.site_packages_dirs(venv_dir):
+        try:
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    match = _DIST_INFO_PATTERN.match(entry.name)
+                    if match:
+                        packages[match.group("name").lower().replace("_", "-")] = match.group("version")
+        except OSError:
+            continue
+    return packages
+
+
+def environment_state(venv_dir=None):
+    """PyInstaller 분석 캐시의 유효성을 좌우하는 빌드 환경 (인터프리터, PyInstaller, 패키지 목록)"""
+    packages = installed_packages(venv_dir)
+    return {
+        "version": ENV_STATE_VERSION,
+        "interpreter": _interpreter(venv_dir),
+        "pyinstaller": packages.get("pyinstaller"),
+        "packages": packages,
+    }
+
+
+def env_state_path(project):
+    """작업 폴더의 빌드 환경 기록 파일 경로"""
+    work_path = project["work_dir"] or "build"
+    return os.path.join(work_path, project_model.app_name_of(project), ENV_STATE_NAME)
+
+
+def compare_environment(previous, current):
+    """두 빌드 환경의 차이를 사람이 읽을 수 있는 이유 목록으로 반환 (같으면 빈 목록)"""
+    if previous.get("version") != current["version"]:
+        return ["작업 폴더 기록 형식이 바뀜"]
+    reasons = []
+    if previous.get("interpreter") != current["interpreter"]:
+        reasons.append(f"인터프리터 변경: {previous.get('interpreter')} -> {current['interpreter']}")
+    if previous.get("pyinstaller") != current["pyinstaller"]:
+        reasons.append(f"PyInstaller 버전 변경: {previous.get('pyinstaller')} -> {current['pyinstaller']}")
+    old_packages = previous.get("packages", {})
+    new_packages = current["packages"]
+    for name in sorted(set(old_packages) | set(new_packages)):
+        if name == "pyinstaller":
+            continue
+        if name not in old_packages:
+            reasons.append(f"패키지 추가: {name} {new_packages[name]}")
+        elif name not in new_packages:
+            reasons.append(f"패키지 제거: {name} {old_packages[name]}")
+        elif old_packages[name] != new_packages[name]:
+            reasons.append(f"패키지 버전 변경: {name} {old_packages[name]} -> {new_packages[name]}")
+    return reasons
+
+
+def prepare(project, venv_dir=None, base_dir=None, root=DEFAULT_WORKPATH_ROOT):
+    """작업 폴더와 --clean 여부를 정한 프로젝트 사본과 (정리 여부, 이유 목록) 반환
+
+    managed_workpath 가 꺼져 있으면 사용자 설정을 그대로 쓴다. 켜져 있으면 작업 폴더가
+    비어 있을 때 프로젝트 전용 폴더를 배정하고, clean_build 설정 대신 마지막 성공 빌드 이후
+    빌드 환경이 바뀌었는지로 --clean 을 결정한다.
+    """
+    project = project_model.new_project(**project)
+    if not project["managed_workpath"]:
+        return project, project["clean_build"], []
+
+    if not project["work_dir"] or base_dir:
+        project["work_dir"] = resolve_work_dir(project, base_dir, root)
+
+    current = environment_state(venv_dir)
+    path = env_state_path(project)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        previous = None
+
+    app_work_dir = os.path.dirname(path)
+    if previous is None:
+        # 기록 없이 남아 있는 분석 결과는 어떤 환경에서 만들어졌는지 알 수 없으므로 정리
+        if os.path.isdir(app_work_dir) and os.listdir(app_work_dir):
+            clean, reasons = True, ["작업 폴더에 환경 기록이 없는 이전 분석 결과가 있음"]
+        else:
+            clean, reasons = False, ["새 작업 폴더"]
+    else:
+        reasons = compare_environment(previous, current)
+        clean = bool(reasons)
+        if not clean:
+            reasons = ["빌드 환경이 같아 분석 캐시를 재사용"]
+
+    project["clean_build"] = clean
+    return project, clean, reasons
+
+
+def record(project, venv_dir=None):
+    """성공한 빌드의 빌드 환경을 작업 폴더에 기록 (prepare 가 돌려준 프로젝트 사용)"""
+    path = env_state_path(project)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(environment_state(venv_dir), f, ensure_ascii=False)
+    os.replace(tmp_path, path)
+    return path
+
+
+def discard(project):
+    """빌드 환경 기록 삭제 (다음 빌드는 --clean 으로 실행)"""
+    try:
+        os.remove(env_state_path(project))
+    except OSError:
+        pass